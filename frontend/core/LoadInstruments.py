@@ -1,77 +1,493 @@
-import json 
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import sys
+from collections import namedtuple
+from operator import itemgetter
+
+from frontend.core.errorhandler import ErrorCode, LibraryError
+from frontend.core.logger import Logger
+
+try:
+    import msgspec
+except ImportError:  # msgspec è opzionale: si ricade su orjson o sul modulo json standard
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # orjson è opzionale: si ricade sul modulo json standard
+    orjson = None
+
+
+def _loads(raw):
+    """Decodifica JSON da bytes, usando msgspec o orjson se disponibili."""
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(raw)
+        except msgspec.DecodeError as e:
+            # Stessa eccezione degli altri parser, gestita da load_instruments
+            raise json.JSONDecodeError(str(e), '', 0) from e
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw) if isinstance(raw, memoryview) else raw)
+
+
+def _load_file(file_path):
+    """
+    Decodifica un file JSON. Con msgspec/orjson il file viene mappato in memoria
+    e passato al parser senza copiarlo prima in un oggetto bytes.
+    """
+    with open(file_path, 'rb') as f:
+        if (msgspec is None and orjson is None) or os.fstat(f.fileno()).st_size == 0:
+            return _loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view)
+
+
+# Versione del formato della cache compilata: va incrementata ogni volta che
+# cambia la struttura degli indici prodotti da _build_indexes.
+_CACHE_VERSION = 10
+_CACHE_SUFFIX = '.pkl'
+_CACHE_APP_NAME = 'OpenLabAutomation'
+
+
+def _user_cache_dir():
+    """
+    Cartella di cache dell'utente per l'applicazione, fuori dall'albero sorgente.
+    - Linux: $XDG_CACHE_HOME/OpenLabAutomation (default ~/.cache)
+    - Windows: %LOCALAPPDATA%/OpenLabAutomation/Cache
+    - macOS: ~/Library/Caches/OpenLabAutomation
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+        return os.path.join(base, _CACHE_APP_NAME, 'Cache')
+    if sys.platform == 'darwin':
+        return os.path.join(os.path.expanduser('~'), 'Library', 'Caches', _CACHE_APP_NAME)
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, _CACHE_APP_NAME)
+
+
+def _cache_path_for(abs_path):
+    """Path della cache compilata di una libreria, distinta per path assoluto del JSON."""
+    digest = hashlib.sha1(abs_path.encode('utf-8')).hexdigest()[:16]
+    name = f"{os.path.splitext(os.path.basename(abs_path))[0]}-{digest}{_CACHE_SUFFIX}"
+    return os.path.join(_user_cache_dir(), name)
+
+
+class _CacheUnpickler(pickle.Unpickler):
+    """
+    Unpickler della cache compilata: lo stato contiene solo tipi built-in e
+    ModelBundle, quindi ogni altra classe viene rifiutata. Un file di cache
+    manomesso non può così eseguire codice al caricamento.
+    """
+
+    def find_class(self, module, name):
+        if module == __name__ and name == 'ModelBundle':
+            return ModelBundle
+        raise pickle.UnpicklingError(f"Classe non ammessa nella cache: {module}.{name}")
+
+
+# Chiave della libreria JSON che contiene le serie di ciascun tipo di strumento
+SERIES_KEY_BY_TYPE = {
+    'power_supply': 'power_supplies_series',
+    'datalogger': 'dataloggers_series',
+    'oscilloscope': 'oscilloscopes_series',
+    'electronic_load': 'electronic_loads_series',
+}
+
+
+def _intern_field(obj, key):
+    """Sostituisce obj[key] con la versione internata se è una stringa."""
+    value = obj.get(key)
+    if isinstance(value, str):
+        obj[key] = sys.intern(value)
+
+
+def _intern_library(lib):
+    """
+    Interna gli identificativi ripetuti della libreria (id di serie, modelli,
+    moduli e tipi di connessione), così i confronti di uguaglianza si
+    risolvono per identità e le copie duplicate vengono rilasciate.
+    I nomi dei tipi ('power_supply', ...) sono letterali nel codice e quindi
+    già internati dal compilatore.
+    """
+    for key in SERIES_KEY_BY_TYPE.values():
+        for series in lib.get(key) or []:
+            _intern_field(series, 'series_id')
+            for model in series.get('models', []):
+                _intern_field(model, 'id')
+                interface = model.get('interface') or {}
+                for connection in interface.get('supported_connection_types', []):
+                    _intern_field(connection, 'type')
+    for module in lib.get('datalogger_modules') or []:
+        _intern_field(module, 'module_id')
+
+
+_get_type = itemgetter('type')
+
+# Dati di un modello usati insieme dai dialog, assemblati al caricamento
+ModelBundle = namedtuple('ModelBundle', ('capabilities', 'scpi', 'channels', 'supported_connections'))
+
 
 class LoadInstruments:
     """
     Classe per la gestione e l'accesso agli strumenti caricati da file JSON.
     Permette di recuperare strumenti per id, nome, tipo e di accedere a parametri specifici come canali, capabilities e comandi SCPI.
     """
+    __slots__ = (
+        'instruments',
+        '_ps_series', '_dl_series', '_dl_modules',
+        '_by_type',
+        '_ps_series_by_id', '_dl_series_by_id',
+        '_ps_model_by_id', '_dl_model_by_id',
+        '_ps_series_ids', '_dl_series_ids',
+        '_ps_series_names', '_dl_series_names',
+        '_dl_all_connections',
+        '_all_types',
+        '_memo',
+        '_pending_path',
+    )
+    # Slot ricalcolati a runtime, esclusi dalla cache compilata
+    _TRANSIENT_SLOTS = ('_memo', '_pending_path')
+    # Libreria già caricata in questo processo: path assoluto -> (firma del file, stato)
+    _LOAD_CACHE = {}
+
     def __init__(self):
-        """Inizializza la lista strumenti vuota."""
+        """Inizializza la libreria vuota e gli indici derivati."""
+        # Libreria registrata con set_library_path e non ancora caricata
+        self._pending_path = None
+        # Risultati memorizzati dei getter derivati, svuotati a ogni caricamento
+        self._memo = {}
+        self._reset_library()
+
+    def _reset_library(self):
+        """Imposta libreria e indici allo stato vuoto."""
+        # Libreria grezza, mantenuta in sola lettura per la visualizzazione/debug:
+        # i getter usano esclusivamente i campi tipizzati qui sotto.
         self.instruments = {}
+        self._ps_series = []
+        self._dl_series = []
+        self._by_type = {}
+        self._ps_series_by_id = {}
+        self._dl_series_by_id = {}
+        self._ps_model_by_id = {}
+        self._dl_model_by_id = {}
+        self._ps_series_ids = ()
+        self._dl_series_ids = ()
+        self._ps_series_names = ()
+        self._dl_series_names = ()
+        self._dl_modules = []
+        self._dl_all_connections = ()
+        self._all_types = tuple(SERIES_KEY_BY_TYPE)
+
+    def set_library_path(self, file_path):
+        """
+        Registra il file della libreria senza caricarlo: il caricamento avviene
+        al primo accesso a libreria o indici, così l'avvio non paga il parsing
+        se nessun pannello usa la libreria.
+        Args:
+            file_path (str): Path to the instruments JSON file.
+        """
+        self._memo = {}
+        self._pending_path = file_path
+        for name in self.__slots__:
+            if name in self._TRANSIENT_SLOTS:
+                continue
+            # delattr su uno slot già vuoto solleva AttributeError senza passare da
+            # __getattr__: hasattr invece avvierebbe il caricamento lazy
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
+
+    def __getattr__(self, name):
+        # Chiamato solo per gli slot non valorizzati, cioè dopo set_library_path
+        pending_path = self._pending_path
+        if pending_path is None or name not in self.__slots__:
+            raise AttributeError(name)
+        try:
+            self.load_instruments(pending_path)
+        except LibraryError:
+            # Già registrato da load_instruments: i getter vedono una libreria vuota
+            pass
+        return object.__getattribute__(self, name)
 
     def load_instruments(self, file_path):
         """
         Loads the instrument list from a JSON file.
         Args:
             file_path (str): Path to the instruments JSON file.
+        Raises:
+            LibraryError: If the file is missing or is not valid JSON; the error is
+                also logged. On the first (lazy) load from set_library_path the
+                library is left empty; on an explicit reload the previously loaded
+                library and indexes are kept.
+        """
+        self._memo = {}
+        if self._pending_path is not None:
+            self._pending_path = None
+            # Valori vuoti se il caricamento non va a buon fine
+            self._reset_library()
+        # File invariato dall'ultimo caricamento nel processo: nessun parsing né unpickling
+        abs_path = os.path.abspath(file_path)
+        try:
+            signature = self._source_signature(file_path)
+        except OSError:
+            signature = None
+        cached = self._LOAD_CACHE.get(abs_path)
+        if signature is not None and cached is not None and cached[0] == signature:
+            self._restore_state(cached[1])
+            return
+        cache_path = _cache_path_for(abs_path)
+        if self._load_cache(file_path, cache_path):
+            self._LOAD_CACHE[abs_path] = (signature, self._state())
+            return
+        try:
+            # Raw bytes (memory-mapped when possible): the parser decodes UTF-8 itself
+            data = _load_file(file_path)
+            # Normalize to dictionary with 'instrument_library' key
+            if isinstance(data, dict) and 'instrument_library' in data:
+                lib = data['instrument_library']
+            else:
+                # fallback: accept directly the expected dictionary structure
+                lib = data if isinstance(data, dict) else {}
+            self._build_indexes(lib)
+            self.instruments = lib
+        except FileNotFoundError as e:
+            error = LibraryError(ErrorCode.LIB_NOT_FOUND, f"File not found: {file_path}")
+            Logger().error(str(error))
+            raise error from e
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError ne è una sottoclasse
+            error = LibraryError(ErrorCode.LIB_CORRUPT, f"Error decoding JSON from file: {file_path}")
+            Logger().error(str(error), exc_info=True)
+            raise error from e
+        self._LOAD_CACHE[abs_path] = (signature, self._state())
+        self._save_cache(file_path, cache_path)
+
+    def _state(self):
+        """Restituisce libreria e indici come dizionario slot -> valore."""
+        return {name: getattr(self, name) for name in self.__slots__
+                if name not in self._TRANSIENT_SLOTS}
+
+    def _restore_state(self, state):
+        """Ripristina libreria e indici da un dizionario prodotto da _state."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @staticmethod
+    def _source_signature(file_path):
+        """Restituisce (mtime_ns, size) del file JSON, usati per validare la cache."""
+        st = os.stat(file_path)
+        return st.st_mtime_ns, st.st_size
+
+    def _load_cache(self, file_path, cache_path):
+        """
+        Ripristina libreria e indici dalla cache compilata, se ancora valida.
+        Args:
+            file_path (str): Path del file JSON sorgente.
+            cache_path (str): Path del file di cache.
+        Returns:
+            bool: True se la cache è stata caricata, False se va ricostruita.
         """
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                # Normalize to dictionary with 'instrument_library' key
-                if isinstance(data, dict) and 'instrument_library' in data:
-                    self.instruments = data['instrument_library']
-                else:
-                    # fallback: accept directly the expected dictionary structure
-                    self.instruments = data if isinstance(data, dict) else {}
-        except FileNotFoundError:
-            print(f"File not found: {file_path}")
-        except json.JSONDecodeError:
-            print(f"Error decoding JSON from file: {file_path}")
+            signature = self._source_signature(file_path)
+            with open(cache_path, 'rb') as f:
+                cached = _CacheUnpickler(f).load()
+        except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError, ValueError):
+            return False
+        if (not isinstance(cached, dict)
+                or cached.get('version') != _CACHE_VERSION
+                or cached.get('source') != signature):
+            return False
+        self._restore_state(cached['state'])
+        return True
+
+    def _save_cache(self, file_path, cache_path):
+        """
+        Salva libreria e indici nella cache compilata, nella cartella di cache dell'utente.
+        Un errore di scrittura non è bloccante: la cache verrà rigenerata al prossimo avvio.
+        """
+        state = self._state()
+        tmp_path = cache_path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+            payload = {
+                'version': _CACHE_VERSION,
+                'source': self._source_signature(file_path),
+                'state': state,
+            }
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            Logger().warning(f"Could not write instrument library cache {cache_path}: {e}")
+
+    def _build_indexes(self, lib):
+        """
+        Precalcola i campi usati dai getter a partire dalla libreria caricata.
+        Args:
+            lib (dict): Contenuto della chiave 'instrument_library'.
+        """
+        _intern_library(lib)
+        # Le liste restituite dai getter sono tuple: la libreria è condivisa tra
+        # istanze (_LOAD_CACHE) e non deve poter essere modificata dai chiamanti
+        self._ps_series = tuple(lib.get('power_supplies_series') or ())
+        self._dl_series = tuple(lib.get('dataloggers_series') or ())
+        self._dl_modules = tuple(lib.get('datalogger_modules') or ())
+
+        # Indici per tipo: series_id -> serie, (series_id, model_id) -> (serie, modello);
+        # model_id -> prima (serie, modello) per i getter che non indicano la serie.
+        # Modelli e tipi di connessione sono materializzati come tuple immutabili,
+        # così i getter possono restituirli senza copia difensiva.
+        self._by_type = {}
+        for type_name, key in SERIES_KEY_BY_TYPE.items():
+            series_list = tuple(lib.get(key) or ())
+            series_by_id = {}
+            model_by_id = {}
+            model_by_key = {}
+            models_by_series = {}
+            connections_by_model = {}
+            scpi_by_model = {}
+            compatible_modules_by_key = {}
+            bundle_by_key = {}
+            # Tutte le connessioni del tipo, nell'ordine della libreria (duplicati inclusi)
+            all_connections = []
+            for series in series_list:
+                series_id = series.get('series_id')
+                series_by_id.setdefault(series_id, series)
+                models = series.get('models')
+                models_by_series.setdefault(series_id, tuple(models) if models is not None else None)
+                for model in models or ():
+                    model_id = model.get('id')
+                    interface = model.get('interface') or {}
+                    connections = tuple(interface.get('supported_connection_types', ()))
+                    all_connections.extend(connections)
+                    key = (series_id, model_id)
+                    if key in model_by_key:
+                        # Stessa logica della scansione: vale il primo modello trovato
+                        continue
+                    model_by_key[key] = (series, model)
+                    model_by_id.setdefault(model_id, (series, model))
+                    connections_by_model.setdefault(model_id, connections)
+                    # Comandi comuni della serie fusi con quelli specifici del modello
+                    scpi = {**series.get('common_scpi_commands', {}), **model.get('scpi_commands', {})}
+                    scpi_by_model.setdefault(model_id, scpi)
+                    capabilities = model.get('capabilities') or {}
+                    compatible_modules_by_key[key] = frozenset(capabilities.get('compatible_modules', ()))
+                    bundle_by_key[key] = ModelBundle(
+                        capabilities=model.get('capabilities'),
+                        scpi=scpi,
+                        channels=model.get('channels'),
+                        supported_connections=connections,
+                    )
+            self._by_type[type_name] = {
+                'series_list': series_list,
+                'series_by_id': series_by_id,
+                'model_by_id': model_by_id,
+                'model_by_key': model_by_key,
+                'models_by_series': models_by_series,
+                'connections_by_model': connections_by_model,
+                'scpi_by_model': scpi_by_model,
+                'compatible_modules_by_key': compatible_modules_by_key,
+                'bundle_by_key': bundle_by_key,
+                'all_connections': tuple(all_connections),
+            }
+        self._ps_series_by_id = self._by_type['power_supply']['series_by_id']
+        self._dl_series_by_id = self._by_type['datalogger']['series_by_id']
+        self._ps_model_by_id = self._by_type['power_supply']['model_by_id']
+        self._dl_model_by_id = self._by_type['datalogger']['model_by_id']
+
+        self._ps_series_ids = tuple(s['series_id'] for s in self._ps_series)
+        self._dl_series_ids = tuple(s['series_id'] for s in self._dl_series)
+        self._ps_series_names = tuple(s['series_name'] for s in self._ps_series)
+        self._dl_series_names = tuple(s['series_name'] for s in self._dl_series)
+        self._dl_all_connections = self._by_type['datalogger']['all_connections']
+
+        # Tipi con serie nella libreria per primi; gli altri vengono comunque
+        # aggiunti perché tutte le categorie siano disponibili nella GUI di aggiunta
+        available = [tname for tname, key in SERIES_KEY_BY_TYPE.items()
+                     if isinstance(lib.get(key), list) and lib[key]]
+        self._all_types = tuple(available + [tname for tname in SERIES_KEY_BY_TYPE if tname not in available])
+
+    def _find_model(self, type_name, series_id, model_id):
+        """
+        Risolve (serie, modello) tramite l'indice per tipo.
+        Args:
+            type_name (str): Tipo di strumento.
+            series_id (str | None): ID della serie; se None non viene verificato.
+            model_id (str): ID del modello.
+        Returns:
+            tuple | None: (serie, modello), o None se non esiste una corrispondenza.
+        """
+        idx = self._by_type.get(type_name)
+        if not idx:
+            return None
+        if series_id is None:
+            return idx['model_by_id'].get(model_id)
+        return idx['model_by_key'].get((series_id, model_id))
+
+    def _index_get(self, type_name, index_name, key):
+        """Restituisce idx[index_name][key] per il tipo indicato, o None se la libreria non lo contiene."""
+        idx = self._by_type.get(type_name)
+        return idx[index_name].get(key) if idx else None
+
+    def _series_field(self, type_name, series_id, field):
+        """Restituisce series[field] per la serie indicata, o None se non esiste."""
+        idx = self._by_type.get(type_name)
+        series = idx['series_by_id'].get(series_id) if idx else None
+        return series.get(field) if series is not None else None
+
+    def _model_field(self, type_name, model_id, field):
+        """Restituisce model[field] per il modello indicato (qualsiasi serie), o None se non esiste."""
+        entry = self._find_model(type_name, None, model_id)
+        return entry[1].get(field) if entry is not None else None
+
+    def _number_channels(self, type_name, model_id, key):
+        """Restituisce capabilities[key] del modello, o None se non ha capabilities."""
+        capabilities = self._model_field(type_name, model_id, 'capabilities')
+        return capabilities[key] if capabilities else None
+
+    def _connection_type_list(self, type_name, model_id):
+        """Restituisce la lista dei tipi di connessione del modello, o None se non esiste."""
+        conns = self._index_get(type_name, 'connections_by_model', model_id)
+        if conns is None:
+            return None
+        return list(map(_get_type, conns))
 
     def get_powersupplys_series(self):
         """
         Retrieves the available power supply series.
         Returns:
-            list: List of power supply series.
+            tuple: Power supply series (immutable).
         """
-        # Find instruments of type 'power_supply' and collect their series
-        power_supplies_series = self.instruments.get('power_supplies_series', [])
-        return power_supplies_series
+        return self._ps_series
     
     def get_dataloggers_series(self):
         """
         Retrieves the available datalogger series.
         Returns:
-            list: List of datalogger series.
+            tuple: Datalogger series (immutable).
         """
-        # Find instruments of type 'datalogger' and collect their series
-        dataloggers_series = self.instruments.get('dataloggers_series', [])
-        return dataloggers_series
+        return self._dl_series
 
     def get_powersupply_list_id(self):
         """
         Recupera la lista degli ID degli alimentatori disponibili.
         Returns:
-            list: Lista degli ID degli alimentatori.
+            tuple: ID degli alimentatori (immutabile).
         """
-        series_id = []
-        power_supplies = self.get_powersupplys_series()
-        for series in power_supplies:
-            series_id.append(series['series_id'])
-        return series_id
+        return self._ps_series_ids
 
     def get_datalogger_list_id(self):
         """
         Recupera la lista degli ID dei datalogger disponibili.
         Returns:
-            list: Lista degli ID dei datalogger.
+            tuple: ID dei datalogger (immutabile).
         """
-        series_id = []
-        dataloggers = self.get_dataloggers_series()
-        for series in dataloggers:
-            series_id.append(series['series_id'])
-        return series_id
+        return self._dl_series_ids
     
     def get_powersupply_models(self, series_id):
         """
@@ -79,13 +495,9 @@ class LoadInstruments:
         Args:
             series_id (str): ID della serie degli alimentatori.
         Returns:
-            list: Lista dei modelli di alimentatori per la serie specificata.
+            tuple: Modelli di alimentatori per la serie specificata (immutabile, non copiare).
         """
-        power_supplies = self.get_powersupplys_series()
-        for series in power_supplies:
-            if series['series_id'] == series_id:
-                return series.get('models')
-        return None
+        return self._index_get('power_supply', 'models_by_series', series_id)
 
     def get_datalogger_models(self, series_id):
         """
@@ -93,13 +505,9 @@ class LoadInstruments:
         Args:
             series_id (str): ID della serie dei datalogger.
         Returns:
-            list: Lista dei modelli di datalogger per la serie specificata.
+            tuple: Modelli di datalogger per la serie specificata (immutabile, non copiare).
         """
-        dataloggers = self.get_dataloggers_series()
-        for series in dataloggers:
-            if series['series_id'] == series_id:
-                return series.get('models')
-        return None
+        return self._index_get('datalogger', 'models_by_series', series_id)
     
     def get_powersupply_series_name(self, series_id):
         """
@@ -109,11 +517,7 @@ class LoadInstruments:
         Returns:
             str: Nome della serie di alimentatori.
         """
-        power_supplies = self.get_powersupplys_series()
-        for series in power_supplies:
-            if series['series_id'] == series_id:
-                return series.get('series_name')
-        return None
+        return self._series_field('power_supply', series_id, 'series_name')
 
     def get_datalogger_series_name(self, series_id):
         """
@@ -123,31 +527,23 @@ class LoadInstruments:
         Returns:
             str: Nome della serie di datalogger.
         """
-        dataloggers = self.get_dataloggers_series()
-        for series in dataloggers:
-            if series['series_id'] == series_id:
-                return series.get('series_name')
-        return None
+        return self._series_field('datalogger', series_id, 'series_name')
 
     def get_powersupply_series_name_list(self):
         """
         Recupera la lista dei nomi delle serie di alimentatori disponibili.
         Returns:
-            list: Lista dei nomi delle serie di alimentatori.
+            tuple: Nomi delle serie di alimentatori (immutabile).
         """
-        power_supplies = self.get_powersupplys_series()
-        series_names = [series['series_name'] for series in power_supplies]
-        return series_names
+        return self._ps_series_names
     
     def get_datalogger_series_name_list(self):
         """
         Recupera la lista dei nomi delle serie di datalogger disponibili.
         Returns:
-            list: Lista dei nomi delle serie di datalogger.
+            tuple: Nomi delle serie di datalogger (immutabile).
         """
-        dataloggers = self.get_dataloggers_series()
-        series_names = [series['series_name'] for series in dataloggers]
-        return series_names
+        return self._dl_series_names
     
     def get_powersupply_model_name(self, series_id, model_id):
         """
@@ -157,12 +553,7 @@ class LoadInstruments:
         Returns:
             str: Nome del modello di alimentatore.
         """
-        power_supplies = self.get_powersupplys_series()
-        for series in power_supplies:
-            for model in series['models']:
-                if model['id'] == model_id:
-                    return model['name']
-        return None
+        return self._model_field('power_supply', model_id, 'name')
     
     def get_datalogger_model_name(self, series_id, model_id):
         """
@@ -172,12 +563,7 @@ class LoadInstruments:
         Returns:
             str: Nome del modello di datalogger.
         """
-        dataloggers = self.get_dataloggers_series()
-        for series in dataloggers:
-            for model in series['models']:
-                if model['id'] == model_id:
-                    return model['name']
-        return None
+        return self._model_field('datalogger', model_id, 'name')
 
     def get_powersupply_common_scpi(self, series_id):
         """
@@ -187,13 +573,7 @@ class LoadInstruments:
         Returns:
             dict: Dizionario contenente i comandi SCPI comuni per la serie specificata.
         """
-        power_supplies = self.get_powersupplys_series()
-        for series in power_supplies:
-            if series['series_id'] == series_id:
-                return series['common_scpi_commands']
-        return None
-    
-    # Note: get_datalogger_common_scpi is already defined above; avoid duplicates
+        return self._series_field('power_supply', series_id, 'common_scpi_commands')
 
     def get_powersupply_capabilities(self, model_id):
         """
@@ -203,12 +583,7 @@ class LoadInstruments:
         Returns:
             dict: Dizionario contenente le capacità del modello di alimentatore specificato.
         """
-        power_supplies = self.get_powersupplys_series()
-        for series in power_supplies:
-            for model in series['models']:
-                if model['id'] == model_id:
-                    return model['capabilities']
-        return None
+        return self._model_field('power_supply', model_id, 'capabilities')
 
     def get_powersupply_number_channels(self, model_id):
         """
@@ -218,10 +593,7 @@ class LoadInstruments:
         Returns:
             int: Numero di canali del modello di alimentatore specificato.
         """
-        capabilities = self.get_powersupply_capabilities(model_id)
-        if capabilities:
-            return capabilities['number_of_channels']
-        return None
+        return self._number_channels('power_supply', model_id, 'number_of_channels')
 
     def get_powersupply_model_scpi_commands(self, model_id):
         """
@@ -231,12 +603,7 @@ class LoadInstruments:
         Returns:
             dict: Dizionario contenente i comandi SCPI specifici per il modello di alimentatore specificato.
         """
-        power_supplies = self.get_powersupplys_series()
-        for series in power_supplies:
-            for model in series['models']:
-                if model['id'] == model_id:
-                    return model['scpi_commands']
-        return None
+        return self._model_field('power_supply', model_id, 'scpi_commands')
     
     def get_powersupply_supported_connection(self, model_id):
         """
@@ -244,14 +611,9 @@ class LoadInstruments:
         Args:
             model_id (str): ID del modello di alimentatore.
         Returns:
-            list: Lista dei tipi di connessione supportati per il modello di alimentatore specificato.
+            tuple: Tipi di connessione supportati per il modello specificato (immutabile).
         """
-        power_supplies = self.get_powersupplys_series()
-        for series in power_supplies:
-            for model in series['models']:
-                if model['id'] == model_id:
-                    return model['interface']['supported_connection_types']
-        return None
+        return self._index_get('power_supply', 'connections_by_model', model_id)
     
     def get_powersupply_supported_connection_type_list(self, model_id):
         """
@@ -261,12 +623,7 @@ class LoadInstruments:
         Returns:
             list: Lista dei tipi di connessione supportati per il modello di alimentatore specificato.
         """
-        power_supplies = self.get_powersupplys_series()
-        for series in power_supplies:
-            for model in series['models']:
-                if model['id'] == model_id:
-                    return [connection['type'] for connection in model['interface']['supported_connection_types']]
-        return None
+        return self._connection_type_list('power_supply', model_id)
     
     def get_datalogger_common_scpi(self, series_id):
         """
@@ -276,11 +633,7 @@ class LoadInstruments:
         Returns:
             dict: Dizionario contenente i comandi SCPI comuni per la serie specificata.
         """
-        dataloggers = self.get_dataloggers_series()
-        for series in dataloggers:
-            if series['series_id'] == series_id:
-                return series['common_scpi_commands']
-        return None
+        return self._series_field('datalogger', series_id, 'common_scpi_commands')
 
     def get_datalogger_capabilities(self, model_id):
         """
@@ -290,12 +643,7 @@ class LoadInstruments:
         Returns:
             dict: Dizionario contenente le capacità del modello di datalogger specificato.
         """
-        dataloggers = self.get_dataloggers_series()
-        for series in dataloggers:
-            for model in series['models']:
-                if model['id'] == model_id:
-                    return model['capabilities']
-        return None
+        return self._model_field('datalogger', model_id, 'capabilities')
 
     def get_datalogger_number_channels(self, model_id):
         """
@@ -305,10 +653,7 @@ class LoadInstruments:
         Returns:
             int: Numero di canali del modello di datalogger specificato.
         """
-        capabilities = self.get_datalogger_capabilities(model_id)
-        if capabilities:
-            return capabilities['channels']
-        return None
+        return self._number_channels('datalogger', model_id, 'channels')
 
     def get_datalogger_model_scpi_commands(self, model_id):
         """
@@ -318,12 +663,7 @@ class LoadInstruments:
         Returns:
             dict: Dizionario contenente i comandi SCPI specifici per il modello di datalogger specificato.
         """
-        dataloggers = self.get_dataloggers_series()
-        for series in dataloggers:
-            for model in series['models']:
-                if model['id'] == model_id:
-                    return model['scpi_commands']
-        return None
+        return self._model_field('datalogger', model_id, 'scpi_commands')
 
     def get_datalogger_supported_connection(self, model_id):
         """
@@ -331,27 +671,17 @@ class LoadInstruments:
         Args:
             model_id (str): ID del modello di datalogger.
         Returns:
-            list: Lista dei tipi di connessione supportati per il modello di datalogger specificato.
+            tuple: Tipi di connessione supportati per il modello specificato (immutabile).
         """
-        dataloggers = self.get_dataloggers_series()
-        for series in dataloggers:
-            for model in series['models']:
-                if model['id'] == model_id:
-                    return model['interface']['supported_connection_types']
-        return None
+        return self._index_get('datalogger', 'connections_by_model', model_id)
 
     def get_datalogger_supported_connection_list(self):
         """
         Recupera l'elenco dei tipi di connessione supportati per tutti i modelli di datalogger.
         Returns:
-            list: Lista dei tipi di connessione supportati per tutti i modelli di datalogger.
+            tuple: Tipi di connessione supportati da tutti i modelli di datalogger (immutabile).
         """
-        dataloggers = self.get_dataloggers_series()
-        supported_connections = []
-        for series in dataloggers:
-            for model in series['models']:
-                supported_connections.extend(model['interface']['supported_connection_types'])
-        return supported_connections
+        return self._dl_all_connections
 
     def get_datalogger_supported_connection_type_list(self, model_id):
         """
@@ -361,12 +691,7 @@ class LoadInstruments:
         Returns:
             list: Lista dei tipi di connessione supportati per il modello di datalogger specificato.
         """
-        dataloggers = self.get_dataloggers_series()
-        for series in dataloggers:
-            for model in series['models']:
-                if model['id'] == model_id:
-                    return [connection['type'] for connection in model['interface']['supported_connection_types']]
-        return None
+        return self._connection_type_list('datalogger', model_id)
     
     def get_series(self, type_name):
         """
@@ -374,18 +699,13 @@ class LoadInstruments:
         Args:
             type_name (str): Tipo di strumento (es. 'power_supply', 'datalogger', 'oscilloscope', 'electronic_load').
         Returns:
-            list | None: Lista delle serie disponibili per il tipo di strumento specificato.
+            tuple | None: Serie disponibili per il tipo di strumento specificato
+            (vuota se la libreria non ne contiene), None se il tipo non è riconosciuto.
         """
-        key_by_type = {
-            'power_supply': 'power_supplies_series',
-            'datalogger': 'dataloggers_series',
-            'oscilloscope': 'oscilloscopes_series',
-            'electronic_load': 'electronic_loads_series',
-        }
-        key = key_by_type.get(type_name)
-        if not key:
+        idx = self._by_type.get(type_name)
+        if idx is None:
             return None
-        return self.instruments.get(key)
+        return idx['series_list']
 
     def get_models(self, type_name, series_id):
         """
@@ -394,13 +714,10 @@ class LoadInstruments:
             type_name (str): Tipo di strumento (es. 'power_supply', 'datalogger', 'oscilloscope', 'electronic_load').
             series_id (str): ID della serie di strumenti.
         Returns:
-            list | None: Lista dei modelli disponibili per la serie e il tipo specificati.
+            tuple | None: Modelli disponibili per la serie e il tipo specificati (immutabile).
         """
-        series_list = self.get_series(type_name) or []
-        for series in series_list:
-            if series.get('series_id') == series_id:
-                return series.get('models')
-        return None
+        idx = self._by_type.get(type_name)
+        return idx['models_by_series'].get(series_id) if idx else None
 
     def get_visible_models(self, type_name, series_id, include_experimental=False):
         """
@@ -410,7 +727,7 @@ class LoadInstruments:
             series_id (str): ID della serie di strumenti.
             include_experimental (bool): Se True, include anche i modelli sperimentali.
         Returns:
-            list | None: Lista dei modelli filtrati.
+            tuple | None: Modelli filtrati (immutabile).
         """
         models = self.get_models(type_name, series_id)
         if not models:
@@ -419,10 +736,11 @@ class LoadInstruments:
         if include_experimental:
             return models
         
-        visible_models = []
-        for model in models:
-            if not model.get('experimental', False):
-                visible_models.append(model)
+        memo_key = ('visible_models', type_name, series_id)
+        visible_models = self._memo.get(memo_key)
+        if visible_models is None:
+            visible_models = tuple(model for model in models if not model.get('experimental', False))
+            self._memo[memo_key] = visible_models
         return visible_models
 
     def get_visible_series(self, type_name, include_experimental=False):
@@ -432,19 +750,41 @@ class LoadInstruments:
             type_name (str): Tipo di strumento.
             include_experimental (bool): Se True, include anche le serie con modelli sperimentali.
         Returns:
-            list | None: Lista delle serie con modelli visibili.
+            tuple | None: Serie con modelli visibili (immutabile; le serie sono copie condivise, non modificarle).
         """
         series_list = self.get_series(type_name) or []
         if include_experimental:
             return series_list
         
+        # Le copie filtrate delle serie vengono costruite una sola volta per tipo
+        memo_key = ('visible_series', type_name)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
         visible_series = []
         for series in series_list:
             models = series.get('models', [])
             visible_models = [m for m in models if not m.get('experimental', False)]
             if visible_models:
-                visible_series.append({**series, 'models': visible_models})
-        return visible_series if visible_series else None
+                visible_series.append({**series, 'models': tuple(visible_models)})
+        result = tuple(visible_series) if visible_series else None
+        self._memo[memo_key] = result
+        return result
+
+    def get_model_bundle(self, type_name, series_id, model_id):
+        """
+        Recupera in un solo accesso capabilities, comandi SCPI, canali e tipi di
+        connessione di un modello, da preferire a più chiamate ai singoli getter.
+        Args:
+            type_name (str): Tipo di strumento (es. 'power_supply', 'datalogger').
+            series_id (str): ID della serie di strumenti.
+            model_id (str): ID del modello di strumenti.
+        Returns:
+            ModelBundle | None: Dati precalcolati del modello (condivisi, non modificare).
+        """
+        entry = self._find_model(type_name, series_id, model_id)
+        if entry is None:
+            return None
+        return self._by_type[type_name]['bundle_by_key'][(entry[0].get('series_id'), model_id)]
 
     def get_model_capabilities(self, type_name, series_id, model_id):
         """
@@ -456,13 +796,8 @@ class LoadInstruments:
         Returns:
             dict | None: Dizionario contenente le capabilities del modello specificato.
         """
-        series_list = self.get_series(type_name) or []
-        for series in series_list:
-            if series.get('series_id') == series_id:
-                for model in series.get('models', []):
-                    if model.get('id') == model_id:
-                        return model.get('capabilities')
-        return None
+        bundle = self.get_model_bundle(type_name, series_id, model_id)
+        return bundle.capabilities if bundle is not None else None
 
     def get_model_scpi(self, type_name, series_id, model_id):
         """
@@ -472,17 +807,11 @@ class LoadInstruments:
             series_id (str): ID della serie di strumenti.
             model_id (str): ID del modello di strumenti.
         Returns:
-            dict: Dizionario contenente i comandi SCPI del modello specificato.
+            dict: Dizionario contenente i comandi SCPI del modello specificato
+            (precalcolato e condiviso, non modificare).
         """
-        series_list = self.get_series(type_name) or []
-        for series in series_list:
-            if series.get('series_id') == series_id:
-                common = series.get('common_scpi_commands', {})
-                for model in series.get('models', []):
-                    if model.get('id') == model_id:
-                        specific = model.get('scpi_commands', {})
-                        return {**common, **specific}
-        return None
+        bundle = self.get_model_bundle(type_name, series_id, model_id)
+        return bundle.scpi if bundle is not None else None
 
     def get_supported_connections(self, type_name, series_id, model_id):
         """
@@ -492,24 +821,12 @@ class LoadInstruments:
             series_id (str): ID della serie di strumenti.
             model_id (str): ID del modello di strumenti.
         Returns:
-            list: Lista dei tipi di connessione supportati dal modello specificato.
-        """
-        if type_name == 'power_supply':
-            power_supplies = self.get_powersupplys_series()
-            for series in power_supplies:
-                if series['series_id'] == series_id:
-                    for model in series['models']:
-                        if model['id'] == model_id:
-                            return model['interface']['supported_connection_types']
-        elif type_name == 'datalogger':
-            dataloggers = self.get_dataloggers_series()
-            for series in dataloggers:
-                if series['series_id'] == series_id:
-                    for model in series['models']:
-                        if model['id'] == model_id:
-                            return model['interface']['supported_connection_types']
-        else:
+            tuple: Tipi di connessione supportati dal modello specificato (immutabile).
+        """
+        if type_name not in ('power_supply', 'datalogger'):
             return None
+        bundle = self.get_model_bundle(type_name, series_id, model_id)
+        return bundle.supported_connections if bundle is not None else None
 
     def get_channel_info(self, type_name, series_id, model_id):
         """
@@ -521,22 +838,10 @@ class LoadInstruments:
         Returns:
             list: Lista di dizionari contenenti info dettagliate sui canali del modello specificato.
         """
-        if type_name == 'power_supply':
-            power_supplies = self.get_powersupplys_series()
-            for series in power_supplies:
-                if series['series_id'] == series_id:
-                    for model in series['models']:
-                        if model['id'] == model_id:
-                            return model['channels']
-        elif type_name == 'datalogger':
-            dataloggers = self.get_dataloggers_series()
-            for series in dataloggers:
-                if series['series_id'] == series_id:
-                    for model in series['models']:
-                        if model['id'] == model_id:
-                            return model['channels']
-        else:
+        if type_name not in ('power_supply', 'datalogger'):
             return None
+        bundle = self.get_model_bundle(type_name, series_id, model_id)
+        return bundle.channels if bundle is not None else None
 
     def find_instrument(self, type_name=None, series_id=None, model_id=None):
         """
@@ -546,43 +851,25 @@ class LoadInstruments:
             series_id (str): ID della serie di strumenti.
             model_id (str): ID del modello di strumenti.
         Returns:
-            dict: Dizionario contenente le informazioni sullo strumento trovato.
+            dict | None: Il modello se model_id è indicato, altrimenti la serie;
+            None se non esiste una corrispondenza esatta.
         """
-        series_list = self.get_series(type_name) or []
-        for series in series_list:
-            if series_id and series.get('series_id') == series_id:
-                for model in series.get('models', []):
-                    if model_id and model.get('id') == model_id:
-                        return model
-                return series
+        if model_id:
+            entry = self._find_model(type_name, series_id or None, model_id)
+            return entry[1] if entry is not None else None
+        if series_id:
+            idx = self._by_type.get(type_name)
+            return idx['series_by_id'].get(series_id) if idx else None
         return None
 
     def get_all_types(self):
         """
         Restituisce tutti i tipi di strumenti disponibili nella libreria.
-        Rileva i tipi in base alle chiavi presenti nel file libreria.
+        Rileva i tipi in base alle chiavi presenti nel file libreria (calcolati al caricamento).
         Returns:
-            list: Lista dei tipi di strumenti disponibili.
+            tuple: Tipi di strumenti disponibili (immutabile).
         """
-        mapping = [
-            ('power_supplies_series', 'power_supply'),
-            ('dataloggers_series', 'datalogger'),
-            ('oscilloscopes_series', 'oscilloscope'),
-            ('electronic_loads_series', 'electronic_load'),
-        ]
-        available = []
-        for key, tname in mapping:
-            series = self.instruments.get(key)
-            if isinstance(series, list) and len(series) > 0:
-                available.append(tname)
-
-        # Assicura che tutte le categorie siano disponibili nella GUI di aggiunta
-        # anche quando la libreria non contiene ancora serie per quel tipo.
-        all_types = [tname for _, tname in mapping]
-        for tname in all_types:
-            if tname not in available:
-                available.append(tname)
-        return available
+        return self._all_types
 
     def get_series_name(self, type_name, series_id):
         """
@@ -593,11 +880,7 @@ class LoadInstruments:
         Returns:
             str: Nome leggibile della serie.
         """
-        series_list = self.get_series(type_name) or []
-        for series in series_list:
-            if series.get('series_id') == series_id:
-                return series.get('series_name')
-        return None
+        return self._series_field(type_name, series_id, 'series_name')
 
     def get_model_name(self, type_name, series_id, model_id):
         """
@@ -609,21 +892,52 @@ class LoadInstruments:
         Returns:
             str: Nome leggibile del modello.
         """
-        series_list = self.get_series(type_name) or []
-        for series in series_list:
-            if series.get('series_id') == series_id:
-                for model in series.get('models', []):
-                    if model.get('id') == model_id:
-                        return model.get('name')
-        return None
+        entry = self._find_model(type_name, series_id, model_id)
+        return entry[1].get('name') if entry is not None else None
+
+    def get_model_name_many(self, type_name, model_ids):
+        """
+        Restituisce i nomi leggibili di più modelli con un solo accesso all'indice,
+        da preferire a chiamate ripetute di get_model_name quando si popolano liste.
+        Args:
+            type_name (str): Tipo di strumento (es. 'power_supply', 'datalogger').
+            model_ids (Iterable[str]): ID dei modelli richiesti.
+        Returns:
+            dict: Mappa model_id -> nome; gli ID sconosciuti sono omessi.
+        """
+        idx = self._by_type.get(type_name)
+        if not idx:
+            return {}
+        model_by_id = idx['model_by_id']
+        names = {}
+        for model_id in model_ids:
+            entry = model_by_id.get(model_id)
+            if entry is not None:
+                names[model_id] = entry[1].get('name')
+        return names
+
+    def get_many_model_scpi(self, type_name, model_ids):
+        """
+        Restituisce i comandi SCPI (comuni e specifici) di più modelli in un solo passaggio.
+        Args:
+            type_name (str): Tipo di strumento (es. 'power_supply', 'datalogger').
+            model_ids (Iterable[str]): ID dei modelli richiesti.
+        Returns:
+            dict: Mappa model_id -> dizionario dei comandi SCPI; gli ID sconosciuti sono omessi.
+        """
+        idx = self._by_type.get(type_name)
+        if not idx:
+            return {}
+        scpi_by_model = idx['scpi_by_model']
+        return {model_id: scpi_by_model[model_id] for model_id in model_ids if model_id in scpi_by_model}
 
     def get_all_datalogger_modules(self):
         """
         Restituisce tutti i moduli datalogger disponibili nella libreria.
         Returns:
-            list: Lista di dizionari contenenti le informazioni sui moduli datalogger.
+            tuple: Dizionari con le informazioni sui moduli datalogger (immutabile).
         """
-        return self.instruments.get('datalogger_modules', [])
+        return self._dl_modules
 
     def get_module_info(self, module_id):
         """
@@ -666,16 +980,22 @@ class LoadInstruments:
             series_id (str): ID della serie del datalogger.
             model_id (str): ID del modello del datalogger.
         Returns:
-            list: Lista di dizionari con le informazioni dei moduli abilitati e compatibili.
-        """
-        compatible_ids = self.get_compatible_modules(type_name, series_id, model_id)
-        all_modules = self.get_all_datalogger_modules()
-        
-        enabled_modules = []
-        for module in all_modules:
-            module_id = module.get('module_id')
-            # Controlla se il modulo è nella lista dei compatibili e non è disabilitato
-            if module_id in compatible_ids and not module.get('not_enabled', False):
-                enabled_modules.append(module)
-        
-        return enabled_modules
\ No newline at end of file
+            tuple: Dizionari con le informazioni dei moduli abilitati e compatibili (immutabile).
+        """
+        memo_key = ('enabled_compatible_modules', type_name, series_id, model_id)
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            return cached
+
+        entry = self._find_model(type_name, series_id, model_id) if type_name == 'datalogger' else None
+        if entry is None:
+            return ()
+        # Insieme precalcolato: test di appartenenza O(1) per ogni modulo
+        compatible_ids = self._by_type[type_name]['compatible_modules_by_key'][(entry[0].get('series_id'), model_id)]
+        enabled_modules = [
+            module for module in self._dl_modules
+            if module.get('module_id') in compatible_ids and not module.get('not_enabled', False)
+        ]
+        enabled_modules = tuple(enabled_modules)
+        self._memo[memo_key] = enabled_modules
+        return enabled_modules
@@ -17,25 +17,163 @@ Ogni file .eff genera tabelle con numero incrementale per ogni esecuzione.
 Architettura:
 - 1 Progetto = 1 Database PostgreSQL
 - 1 Esecuzione efficienza = 1 Tabella (<nome_eff>_<numero>)
-- Struttura tabella: variabili di misura (stringhe) + array di dati (double)
+- Struttura tabella: variabili di misura (colonna JSONB) + array di dati (double)
 
 [ERROR-PJDB-XXX] per codici errore standardizzati
 """
 
-import psycopg2
-from psycopg2 import sql
-from psycopg2.extras import execute_values, Json
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple, Union
+import bisect
+import contextlib
+import functools
+import hashlib
+import io
 import json
+import os
+import threading
+import time
+import uuid
 from datetime import datetime
+from operator import itemgetter
 import re
 
 
+# psycopg2 (e libpq) vengono importati da _import_psycopg2 alla prima istanza
+# di ProjectDatabaseManager, non all'avvio dell'applicazione
+psycopg2 = None
+sql = None
+execute_batch = None
+ThreadedConnectionPool = None
+_PooledConnection = None
+
+# Colonna JSONB che raccoglie le variabili di misura di ogni esecuzione
+MEASUREMENT_COLUMN = 'measurement'
+
+_NON_ALNUM = re.compile(r'[^a-z0-9_]')
+# Stessa sostituzione di _NON_ALNUM per i nomi ASCII, in un solo passaggio di str.translate
+_ASCII_TO_IDENT = str.maketrans({
+    chr(c): '_' for c in range(128)
+    if not (chr(c).isdigit() or 'a' <= chr(c) <= 'z' or chr(c) == '_')
+})
+
+
+@functools.lru_cache(maxsize=512)
+def _sanitize_identifier(name: str, prefix: str, fallback: str) -> str:
+    """
+    Rende name un identificatore PostgreSQL valido (lowercase, underscores, alfanumerico).
+    
+    Args:
+        name: Nome originale
+        prefix: Prefisso aggiunto se il nome non inizia con una lettera
+        fallback: Nome usato se il risultato è vuoto
+    """
+    # Converts to lowercase, replaces spaces and special characters with underscores
+    sanitized = name.lower()
+    if sanitized.isascii():
+        sanitized = sanitized.translate(_ASCII_TO_IDENT)
+    else:
+        sanitized = _NON_ALNUM.sub('_', sanitized)
+    # Removes consecutive multiple underscores
+    while '__' in sanitized:
+        sanitized = sanitized.replace('__', '_')
+    # Removes leading/trailing underscores
+    sanitized = sanitized.strip('_')
+    # Ensures it starts with a letter
+    if sanitized and not sanitized[0].isalpha():
+        sanitized = prefix + sanitized
+    return sanitized or fallback
+
+
+def _json_default(value: Any) -> str:
+    """Serializza in JSON i valori non nativi (datetime in ISO 8601)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _dump_measurement(measurement: Dict[str, Any]) -> str:
+    """Testo JSON delle variabili di misura, passato come parametro alla colonna jsonb."""
+    return json.dumps(measurement, default=_json_default)
+
+
+def _point_layout(columns: Tuple[str, ...]) -> Tuple[Tuple[str, ...], frozenset, Callable]:
+    """
+    Colonne per punto di un inserimento: (ordine, insieme, estrattore dei valori di una riga).
+    """
+    if len(columns) > 1:
+        getter = itemgetter(*columns)
+    else:
+        # itemgetter restituisce una tupla solo con due o più chiavi
+        getter = lambda row, cols=columns: tuple(row[col] for col in cols)
+    return columns, frozenset(columns), getter
+
+
+def _import_psycopg2() -> None:
+    """Importa psycopg2 e definisce i nomi che ne dipendono, una sola volta."""
+    global psycopg2, sql, execute_batch, ThreadedConnectionPool, _PooledConnection
+    if psycopg2 is not None:
+        return
+    import psycopg2 as _psycopg2
+    from psycopg2 import extras as _extras, pool as _pool, sql as _sql
+    
+    class _PooledConnection(_psycopg2.extensions.connection):
+        """
+        Connessione dei pool di progetto che ricorda le INSERT preparate sulla
+        propria sessione: (tabella, colonne) -> nome dello statement.
+        """
+        
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.prepared_inserts: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+    
+    try:
+        import numpy
+    except ImportError:  # numpy è opzionale: senza, i valori arrivano già come float Python
+        numpy = None
+    if numpy is not None:
+        # Scalari numpy (es. da misure acquisite come array) adattati come float/int
+        # Python, NaN e infiniti compresi, invece di fallire con "can't adapt type"
+        _adapt = _psycopg2.extensions.adapt
+        _psycopg2.extensions.register_adapter(numpy.floating, lambda value: _adapt(float(value)))
+        _psycopg2.extensions.register_adapter(numpy.integer, lambda value: _adapt(int(value)))
+    
+    sql = _sql
+    execute_batch = _extras.execute_batch
+    ThreadedConnectionPool = _pool.ThreadedConnectionPool
+    # Assegnato per ultimo: segna l'import come completo
+    psycopg2 = _psycopg2
+
+
 class ProjectDatabaseManager:
     """
     Gestisce database PostgreSQL per progetti di automazione laboratorio.
+    
+    Le connessioni ai database di progetto sono prese da pool condivisi tra le
+    istanze (uno per server/credenziali/database), così ogni operazione non paga
+    l'handshake di una nuova connessione. Chi usa connect_project_db direttamente
+    deve restituire la connessione con release_connection, oppure usare
+    project_connection come context manager.
     """
     
+    # Dimensioni dei pool di connessioni ai database di progetto
+    POOL_MIN_SIZE = 2
+    POOL_MAX_SIZE = 10
+    
+    # Oltre questo numero di righe l'inserimento usa COPY invece di INSERT
+    COPY_THRESHOLD = 500
+    # Righe per singolo COPY: limita la memoria del buffer con sweep molto lunghi
+    COPY_CHUNK_ROWS = 20000
+    
+    # Righe scaricate per round trip dal cursore lato server di get_table_data(stream=True)
+    STREAM_ITERSIZE = 2000
+    
+    # Secondi di validità della lista tabelle restituita da list_project_tables
+    TABLES_CACHE_TTL = 2.0
+    
+    # (host, port, user, dbname, sha256 della password) -> ThreadedConnectionPool
+    _pools: Dict[Tuple[str, int, str, str, str], 'ThreadedConnectionPool'] = {}
+    _pools_lock = threading.Lock()
+    
     def __init__(self, host: str = 'localhost', port: int = 5432, 
                  user: str = 'postgres', password: str = '', 
                  project_name: str = None):
@@ -49,6 +187,7 @@ class ProjectDatabaseManager:
             password: Password PostgreSQL
             project_name: Nome del progetto (diventa nome database)
         """
+        _import_psycopg2()
         self.host = host
         self.port = port
         self.user = user
@@ -56,6 +195,19 @@ class ProjectDatabaseManager:
         self.project_name = project_name
         self.db_name = self._sanitize_db_name(project_name) if project_name else None
         self.conn = None
+        # Nome base -> numero più alto delle tabelle <base>_<n>; None finché non letto da pg_tables
+        self._table_cache: Optional[Dict[str, int]] = None
+        # Tabella -> colonne di sweep i cui indici sono rimandati a fine caricamento
+        self._pending_indexes: Dict[str, List[str]] = {}
+        # Tabella -> nomi delle colonne, letti da information_schema al primo uso
+        self._columns_cache: Dict[str, frozenset] = {}
+        # (istante monotonic della lettura, tabelle ordinate) di list_project_tables
+        self._tables_cache: Optional[Tuple[float, List[str]]] = None
+        # Tabella -> colonne di sweep e dati fissate alla creazione (vedi _point_layout)
+        self._insert_layouts: Dict[str, Tuple[Tuple[str, ...], frozenset, Callable]] = {}
+        # Frammenti SQL composti per tabella: ('select', tabella) -> Composed,
+        # ('copy', tabella, colonne) -> testo di COPY già reso con as_string
+        self._sql_cache: Dict[Tuple, Any] = {}
     
     def _sanitize_db_name(self, name: str) -> str:
         """
@@ -67,16 +219,7 @@ class ProjectDatabaseManager:
         Returns:
             Nome database valido (lowercase, underscores, alfanumerico)
         """
-        # Converts to lowercase, replaces spaces and special characters with underscores
-        sanitized = re.sub(r'[^a-z0-9_]', '_', name.lower())
-        # Removes consecutive multiple underscores
-        sanitized = re.sub(r'_+', '_', sanitized)
-        # Removes leading/trailing underscores
-        sanitized = sanitized.strip('_')
-        # Ensures it starts with a letter
-        if sanitized and not sanitized[0].isalpha():
-            sanitized = 'proj_' + sanitized
-        return sanitized or 'unnamed_project'
+        return _sanitize_identifier(name, 'proj_', 'unnamed_project')
     
     def _sanitize_table_name(self, eff_filename: str) -> str:
         """
@@ -88,17 +231,10 @@ class ProjectDatabaseManager:
         Returns:
             Valid table name
         """
-        # Removes .eff extension if present
-        name = eff_filename.replace('.eff', '')
-        # Sanitizes like db_name
-        sanitized = re.sub(r'[^a-z0-9_]', '_', name.lower())
-        sanitized = re.sub(r'_+', '_', sanitized)
-        sanitized = sanitized.strip('_')
-        if sanitized and not sanitized[0].isalpha():
-            sanitized = 'eff_' + sanitized
-        return sanitized or 'unnamed_eff'
+        # Removes .eff extension if present, then sanitizes like db_name
+        return _sanitize_identifier(eff_filename.replace('.eff', ''), 'eff_', 'unnamed_eff')
     
-    def connect_postgres(self) -> psycopg2.extensions.connection:
+    def connect_postgres(self) -> 'psycopg2.extensions.connection':
         """
         Connessione al server PostgreSQL (database 'postgres' per operazioni admin).
         
@@ -121,12 +257,17 @@ class ProjectDatabaseManager:
         except Exception as e:
             raise Exception(f"[PJDB-001] Errore connessione a PostgreSQL: {e}")
     
-    def connect_project_db(self) -> psycopg2.extensions.connection:
+    def connect_project_db(self) -> 'psycopg2.extensions.connection':
         """
-        Connessione al database del progetto.
+        Connessione al database del progetto, presa dal pool condiviso.
+        
+        La connessione va restituita con release_connection (non chiusa con
+        close(): il pool la considererebbe ancora in uso e, esauriti gli
+        POOL_MAX_SIZE posti, ogni nuova richiesta fallirebbe). Dove possibile
+        usare project_connection, che la restituisce automaticamente.
         
         Returns:
-            Connessione al database del progetto
+            Connessione al database del progetto (da restituire con release_connection)
             
         Raises:
             Exception: [PJDB-002] Database progetto non specificato o errore connessione
@@ -135,17 +276,80 @@ class ProjectDatabaseManager:
             raise Exception("[PJDB-002] Nome database progetto non specificato")
         
         try:
-            conn = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                dbname=self.db_name
-            )
-            return conn
+            return self._get_pool().getconn()
         except Exception as e:
             raise Exception(f"[PJDB-002] Errore connessione al database '{self.db_name}': {e}")
     
+    @contextlib.contextmanager
+    def project_connection(self) -> Iterator['psycopg2.extensions.connection']:
+        """
+        Context manager su connect_project_db: restituisce la connessione al
+        pool all'uscita dal blocco, anche in caso di eccezione.
+        
+        Raises:
+            Exception: [PJDB-002] Database progetto non specificato o errore connessione
+        """
+        conn = self.connect_project_db()
+        try:
+            yield conn
+        finally:
+            self.release_connection(conn)
+    
+    def _pool_key(self) -> Tuple[str, int, str, str, str]:
+        # La password entra nella chiave (solo come hash): cambiando credenziali
+        # si apre un nuovo pool invece di riusare connessioni autenticate con le vecchie
+        password_hash = hashlib.sha256((self.password or '').encode('utf-8')).hexdigest()
+        return (self.host, self.port, self.user, self.db_name, password_hash)
+    
+    def _get_pool(self) -> 'ThreadedConnectionPool':
+        """
+        Restituisce il pool di connessioni del database di progetto, creandolo al primo uso.
+        
+        Returns:
+            Pool di connessioni condiviso
+        """
+        key = self._pool_key()
+        pool = self._pools.get(key)
+        if pool is None:
+            with self._pools_lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    pool = ThreadedConnectionPool(
+                        self.POOL_MIN_SIZE,
+                        self.POOL_MAX_SIZE,
+                        host=self.host,
+                        port=self.port,
+                        user=self.user,
+                        password=self.password,
+                        dbname=self.db_name,
+                        connection_factory=_PooledConnection
+                    )
+                    self._pools[key] = pool
+        return pool
+    
+    def release_connection(self, conn: Optional['psycopg2.extensions.connection']) -> None:
+        """
+        Restituisce al pool una connessione ottenuta da connect_project_db.
+        Le transazioni lasciate aperte vengono annullate dal pool.
+        
+        Args:
+            conn: Connessione da restituire (None è ignorato)
+        """
+        if conn is None:
+            return
+        pool = self._pools.get(self._pool_key())
+        if pool is None or pool.closed:
+            conn.close()
+        else:
+            pool.putconn(conn)
+    
+    def close_pool(self) -> None:
+        """Chiude tutte le connessioni del pool del database di progetto."""
+        with self._pools_lock:
+            pool = self._pools.pop(self._pool_key(), None)
+        if pool is not None and not pool.closed:
+            pool.closeall()
+    
     def create_project_database(self) -> bool:
         """
         Crea il database del progetto se non esiste.
@@ -178,9 +382,7 @@ class ProjectDatabaseManager:
                         sql.Identifier(self.db_name)
                     )
                 )
-                print(f"Database created: {manager.db_name}")
-        
-        # Create the table
+                print(f"Database created: {self.db_name}")
             else:
                 print(f"[INFO] Database '{self.db_name}' già esistente")
             
@@ -208,54 +410,88 @@ class ProjectDatabaseManager:
         """
         sanitized_name = self._sanitize_table_name(eff_base_name)
         
+        if self._table_cache is None:
+            try:
+                self._table_cache = self._read_table_numbers()
+            except Exception as e:
+                raise Exception(f"[PJDB-004] Errore ricerca tabelle per '{eff_base_name}': {e}")
+        
+        return self._table_cache.get(sanitized_name, 0) + 1
+    
+    def _read_table_numbers(self) -> Dict[str, int]:
+        """
+        Legge da pg_tables, con una sola query, il numero più alto di ogni gruppo di tabelle <base>_<n>.
+        
+        Returns:
+            Dizionario nome base -> numero più alto
+        """
+        conn = None
         try:
             conn = self.connect_project_db()
             cursor = conn.cursor()
             
-            # Find all tables starting with the base name
-            cursor.execute("""
-                SELECT tablename 
+            # Highest numeric suffix per base name, computed server-side
+            cursor.execute(r"""
+                SELECT substring(tablename FROM '^(.*)_\d+$'),
+                       MAX(substring(tablename FROM '_(\d+)$')::int)
                 FROM pg_tables 
                 WHERE schemaname = 'public' 
-                AND tablename LIKE %s
-            """, (f"{sanitized_name}_%",))
+                AND tablename ~ '_\d+$'
+                GROUP BY 1
+            """)
             
-            tables = cursor.fetchall()
+            numbers = dict(cursor.fetchall())
             cursor.close()
-            conn.close()
-            
-            if not tables:
-                return 1
-            
-            # Extract numbers from existing tables
-            numbers = []
-            pattern = re.compile(rf"{re.escape(sanitized_name)}_(\d+)$")
-            for (table_name,) in tables:
-                match = pattern.match(table_name)
-                if match:
-                    numbers.append(int(match.group(1)))
-            
-            return max(numbers) + 1 if numbers else 1
             
-        except Exception as e:
-            raise Exception(f"[PJDB-004] Errore ricerca tabelle per '{eff_base_name}': {e}")
+            return numbers
+        finally:
+            self.release_connection(conn)
+    
+    def refresh_metadata(self) -> None:
+        """
+        Invalida le cache dei metadati (numeri di tabella, colonne, lista tabelle),
+        da usare se altre sessioni possono aver creato tabelle nel database del progetto.
+        """
+        self._table_cache = None
+        self._columns_cache.clear()
+        self._tables_cache = None
+        self._insert_layouts.clear()
+        self._sql_cache.clear()
     
     def create_efficiency_table(
         self, 
         eff_filename: str,
         measurement_vars: Dict[str, str],
         sweep_variables: List[str],
-        data_columns: List[str]
+        data_columns: List[str],
+        defer_indexes: bool = False,
+        unlogged: bool = False
     ) -> str:
         """
         Crea una nuova tabella per un'esecuzione di efficienza.
         
+        Le variabili di misura sono salvate in un'unica colonna JSONB (MEASUREMENT_COLUMN)
+        con indice GIN, così nuove variabili non richiedono colonne aggiuntive;
+        sweep e dati restano colonne DOUBLE PRECISION.
+        
+        Gli indici sulle variabili di sweep rallenterebbero ogni INSERT/COPY
+        successiva: con defer_indexes vengono creati da finalize_table (o
+        dall'ultimo batch di insert_measurement_data) a dati già caricati.
+        Gli indici in sospeso vivono solo in questa istanza: chi rimanda gli
+        indici deve chiamare finalize_table prima di scartare il manager.
+        
         Args:
             eff_filename: Nome del file .eff
             measurement_vars: Dizionario delle variabili di misura (nome: tipo_sql)
-                             es. {'operator': 'VARCHAR(100)', 'notes': 'TEXT', 'timestamp': 'TIMESTAMP'}
+                             es. {'operator': 'VARCHAR(100)', 'notes': 'TEXT', 'timestamp': 'TIMESTAMP'};
+                             se non vuoto la tabella ha la colonna JSONB delle misure
             sweep_variables: Lista delle variabili di sweep (es. ['vin', 'iout'])
             data_columns: Lista delle colonne dati (es. ['efficiency', 'power_loss', 'temperature'])
+            defer_indexes: Se True rimanda la creazione degli indici a finalize_table
+                (default False: indici creati subito insieme alla tabella)
+            unlogged: Se True crea una tabella UNLOGGED: le scritture non passano dal
+                WAL e sono molto più veloci, ma dopo un crash del server la tabella
+                viene svuotata e non è replicata. Da usare solo per dati ricalcolabili
             
         Returns:
             Nome completo della tabella creata (es. 'eff_1')
@@ -267,6 +503,7 @@ class ProjectDatabaseManager:
         table_number = self.get_next_table_number(base_name)
         table_name = f"{base_name}_{table_number}"
         
+        conn = None
         try:
             conn = self.connect_project_db()
             cursor = conn.cursor()
@@ -277,9 +514,9 @@ class ProjectDatabaseManager:
             # Auto-increment ID
             columns.append("id SERIAL PRIMARY KEY")
             
-            # Measurement variables (strings/timestamps)
-            for var_name, var_type in measurement_vars.items():
-                columns.append(f"{var_name} {var_type}")
+            # Measurement variables (one JSONB document per row)
+            if measurement_vars:
+                columns.append(f"{MEASUREMENT_COLUMN} JSONB NOT NULL DEFAULT '{{}}'")
             
             # Sweep variables (DOUBLE PRECISION)
             for sweep_var in sweep_variables:
@@ -293,7 +530,8 @@ class ProjectDatabaseManager:
             columns.append("created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP")
             
             # Create the table
-            create_query = sql.SQL("CREATE TABLE {} ({})").format(
+            create_query = sql.SQL("CREATE {}TABLE {} ({})").format(
+                sql.SQL("UNLOGGED " if unlogged else ""),
                 sql.Identifier(table_name),
                 sql.SQL(", ".join(columns))
             )
@@ -301,19 +539,26 @@ class ProjectDatabaseManager:
             cursor.execute(create_query)
             
             # Create indexes to improve queries
-            for sweep_var in sweep_variables:
-                index_name = f"idx_{table_name}_{sweep_var}"
-                cursor.execute(
-                    sql.SQL("CREATE INDEX {} ON {} ({})").format(
-                        sql.Identifier(index_name),
-                        sql.Identifier(table_name),
-                        sql.Identifier(sweep_var)
-                    )
-                )
+            index_columns = list(sweep_variables)
+            if measurement_vars:
+                index_columns.append(MEASUREMENT_COLUMN)
+            if not defer_indexes:
+                for column in index_columns:
+                    cursor.execute(self._index_query(table_name, column))
             
             conn.commit()
             cursor.close()
-            conn.close()
+            
+            if self._table_cache is not None:
+                self._table_cache[base_name] = table_number
+            if self._tables_cache is not None:
+                bisect.insort(self._tables_cache[1], table_name)
+            self._insert_layouts[table_name] = _point_layout(tuple(sweep_variables) + tuple(data_columns))
+            self._columns_cache[table_name] = frozenset(
+                column.split(' ', 1)[0] for column in columns
+            )
+            if defer_indexes and index_columns:
+                self._pending_indexes[table_name] = index_columns
             
             print(f"[INFO] Tabella '{table_name}' creata con successo")
             return table_name
@@ -321,14 +566,20 @@ class ProjectDatabaseManager:
         except Exception as e:
             if conn:
                 conn.rollback()
-                conn.close()
+            # Ad es. tabella creata da un'altra sessione: rilegge i numeri al prossimo tentativo
+            self.refresh_metadata()
             raise Exception(f"[PJDB-005] Errore creazione tabella '{table_name}': {e}")
+        finally:
+            self.release_connection(conn)
     
     def insert_measurement_data(
         self,
         table_name: str,
         measurement_info: Dict[str, Any],
-        data_rows: List[Dict[str, Any]]
+        data_rows: List[Dict[str, Any]],
+        page_size: int = 1000,
+        final_batch: bool = True,
+        fast_commit: bool = False
     ) -> int:
         """
         Inserisce dati di misura nella tabella.
@@ -339,66 +590,274 @@ class ProjectDatabaseManager:
                              es. {'operator': 'Mario', 'notes': 'Test 1', 'timestamp': datetime.now()}
             data_rows: Lista di dizionari con i dati punto per punto
                       es. [{'vin': 12.0, 'iout': 1.0, 'efficiency': 95.2, ...}, ...]
+            page_size: Righe inviate al server per ogni round trip (batch sotto COPY_THRESHOLD)
+            final_batch: Se True, dopo l'inserimento crea gli indici rimandati della
+                tabella; passare False per i batch intermedi di un caricamento a più passi
+            fast_commit: Se True la transazione usa synchronous_commit = off: il commit
+                non attende il flush del WAL su disco. Un crash del server può perdere
+                gli ultimi batch confermati (mai corromperli)
         
         Returns:
             Numero di righe inserite
             
         Raises:
             Exception: [PJDB-006] Errore inserimento dati
+            Exception: [PJDB-010] Errore creazione indici (righe già inserite)
         """
+        if not data_rows:
+            if final_batch:
+                self.finalize_table(table_name)
+            return 0
+        
+        conn = None
         try:
             conn = self.connect_project_db()
             cursor = conn.cursor()
             
-            # Prepare data to insert
-            data_to_insert = []
-            for point in measurement_points:
-                # Combine measurement_info with point data
-                point_data = {**measurement_info, **point}
-                data_to_insert.append(point_data)
-            
-            if not data_to_insert:
-                return
+            if fast_commit:
+                # Vale solo per questa transazione
+                cursor.execute("SET LOCAL synchronous_commit = OFF")
             
-            # Extract columns (excluding 'id' and 'created_at' which are auto-generated)
-            columns = [k for k in data_to_insert[0].keys() if k not in ('id', 'created_at')]
+            # Colonne per punto: quelle fissate alla creazione della tabella se la prima
+            # riga le contiene tutte, altrimenti le sue chiavi (escluse 'id' e 'created_at',
+            # generate automaticamente)
+            first_row = data_rows[0]
+            layout = self._insert_layouts.get(table_name)
+            if layout is None or not first_row.keys() >= layout[1]:
+                layout = _point_layout(tuple(k for k in first_row if k not in ('id', 'created_at')))
+            point_columns, point_keys, point_values = layout
+            # Point values override measurement_info ones with the same name
+            info_columns = [k for k in measurement_info
+                            if k not in ('id', 'created_at') and k not in point_keys]
             
-            # Prepare insert query
-            insert_query = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
-                sql.Identifier(table_name),
-                sql.SQL(", ").join(map(sql.Identifier, columns))
-            )
-            
-            # Prepara i valori
-            values = [[row[col] for col in columns] for row in insert_data]
-            
-            # Esegue l'inserimento batch
-            execute_values(cursor, insert_query.as_string(conn), values)
+            # Prepara i valori: la parte costante è una sola tupla, concatenata ai
+            # valori di ogni punto senza fondere dizionari riga per riga
+            if MEASUREMENT_COLUMN in self._table_columns(table_name, conn):
+                # Variabili di misura serializzate una volta sola nella colonna JSONB
+                info_values = (_dump_measurement({col: measurement_info[col] for col in info_columns}),)
+                info_columns = [MEASUREMENT_COLUMN]
+            else:
+                # Tabelle create prima della colonna JSONB: una colonna per variabile
+                info_values = tuple(measurement_info[col] for col in info_columns)
+            columns = info_columns + list(point_columns)
+            values = [info_values + point_values(row) for row in data_rows]
             
-            rows_inserted = cursor.rowcount
+            if len(values) > self.COPY_THRESHOLD:
+                # Sweep lunghi: COPY evita parsing e planning riga per riga
+                self._copy_rows(cursor, table_name, columns, values)
+                rows_inserted = len(values)
+            else:
+                # INSERT preparata una volta per sessione: ogni batch salta parsing e planning
+                statement = self._prepare_insert(cursor, table_name, columns)
+                execute_batch(
+                    cursor,
+                    f"EXECUTE {statement} ({', '.join(['%s'] * len(columns))})",
+                    values,
+                    page_size=page_size
+                )
+                rows_inserted = len(values)
             conn.commit()
             cursor.close()
-            conn.close()
             
             print(f"[INFO] {rows_inserted} righe inserite in '{table_name}'")
-            return rows_inserted
             
         except Exception as e:
             if conn:
                 conn.rollback()
-                conn.close()
+                self._deallocate_inserts(conn)
             raise Exception(f"[PJDB-006] Errore inserimento dati in '{table_name}': {e}")
+        finally:
+            self.release_connection(conn)
+        
+        # Fuori dal percorso di PJDB-006: le righe sono già confermate e un
+        # errore sugli indici non deve indurre il chiamante a reinserirle
+        if final_batch:
+            self.finalize_table(table_name)
+        return rows_inserted
+    
+    def finalize_table(self, table_name: str) -> None:
+        """
+        Crea gli indici rimandati da create_efficiency_table(defer_indexes=True).
+        
+        Args:
+            table_name: Nome della tabella
+            
+        Raises:
+            Exception: [PJDB-010] Errore creazione indici
+        """
+        if table_name not in self._pending_indexes:
+            return
+        
+        conn = None
+        try:
+            conn = self.connect_project_db()
+            self._create_pending_indexes(conn, table_name)
+        except Exception as e:
+            raise Exception(f"[PJDB-010] Errore creazione indici di '{table_name}': {e}")
+        finally:
+            self.release_connection(conn)
+    
+    @staticmethod
+    def _index_query(table_name: str, column: str, concurrently: bool = False) -> 'sql.Composed':
+        if column == MEASUREMENT_COLUMN:
+            # jsonb_path_ops: indice più compatto, sufficiente per le ricerche con @>
+            index_name, target = f"idx_{table_name}_meas", sql.SQL("USING GIN ({} jsonb_path_ops)")
+        else:
+            index_name, target = f"idx_{table_name}_{column}", sql.SQL("({})")
+        return sql.SQL("CREATE INDEX {}{} ON {} {}").format(
+            sql.SQL("CONCURRENTLY IF NOT EXISTS ") if concurrently else sql.SQL(""),
+            sql.Identifier(index_name),
+            sql.Identifier(table_name),
+            target.format(sql.Identifier(column))
+        )
+    
+    def _table_columns(self, table_name: str, conn=None) -> frozenset:
+        """
+        Restituisce i nomi delle colonne di table_name (vuoto se la tabella non esiste).
+        
+        Args:
+            table_name: Nome della tabella
+            conn: Connessione da usare; se None ne prende una dal pool
+        """
+        columns = self._columns_cache.get(table_name)
+        if columns is not None:
+            return columns
+        
+        own_conn = conn is None
+        try:
+            if own_conn:
+                conn = self.connect_project_db()
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT column_name FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = %s
+                """,
+                (table_name,)
+            )
+            columns = frozenset(row[0] for row in cursor.fetchall())
+            cursor.close()
+        finally:
+            if own_conn:
+                self.release_connection(conn)
+        if columns:
+            self._columns_cache[table_name] = columns
+        return columns
+    
+    def _create_pending_indexes(self, conn, table_name: str) -> None:
+        """
+        Crea con CONCURRENTLY gli indici in sospeso di table_name, senza bloccare
+        le scritture. Gli indici sono costruiti uno alla volta: due CREATE INDEX
+        CONCURRENTLY sulla stessa tabella si attenderebbero comunque a vicenda.
+        """
+        # CREATE INDEX CONCURRENTLY non può essere eseguito dentro una transazione
+        conn.autocommit = True
+        try:
+            cursor = conn.cursor()
+            for column in self._pending_indexes[table_name]:
+                cursor.execute(self._index_query(table_name, column, concurrently=True))
+            cursor.close()
+        finally:
+            conn.autocommit = False
+        del self._pending_indexes[table_name]
+    
+    def _prepare_insert(self, cursor, table_name: str, columns: List[str]) -> str:
+        """
+        Prepara sulla sessione corrente la INSERT per table_name/columns, se non lo è già.
+        
+        Returns:
+            Nome dello statement preparato
+        """
+        prepared = cursor.connection.prepared_inserts
+        key = (table_name, tuple(columns))
+        statement = prepared.get(key)
+        if statement is None:
+            statement = f"pjdb_insert_{len(prepared) + 1}"
+            cursor.execute(
+                sql.SQL("PREPARE {} AS INSERT INTO {} ({}) VALUES ({})").format(
+                    sql.Identifier(statement),
+                    sql.Identifier(table_name),
+                    sql.SQL(", ").join(map(sql.Identifier, columns)),
+                    sql.SQL(", ").join(sql.SQL(f"${i}") for i in range(1, len(columns) + 1))
+                )
+            )
+            prepared[key] = statement
+        return statement
+    
+    @staticmethod
+    def _deallocate_inserts(conn) -> None:
+        """Rimuove gli statement preparati della sessione, il cui stato non è più certo dopo un errore."""
+        prepared = getattr(conn, 'prepared_inserts', None)
+        if not prepared:
+            return
+        prepared.clear()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("DEALLOCATE ALL")
+            conn.commit()
+        except Exception:
+            pass
+    
+    @staticmethod
+    def _copy_text_value(value: Any) -> str:
+        """Codifica un valore nel formato testo di COPY (NULL = \\N, caratteri di controllo con escape)."""
+        if type(value) is float:
+            # Caso più frequente (colonne DOUBLE PRECISION): repr è già un
+            # letterale valido per PostgreSQL, senza escape
+            return repr(value)
+        if value is None:
+            return '\\N'
+        if isinstance(value, datetime):
+            return value.isoformat(' ')
+        return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
+    
+    def _copy_rows(self, cursor, table_name: str, columns: List[str], values: List[List[Any]]) -> None:
+        """
+        Inserisce le righe con COPY ... FROM STDIN (formato testo), a blocchi di
+        COPY_CHUNK_ROWS righe nella stessa transazione.
+        
+        Args:
+            cursor: Cursore della connessione al database di progetto
+            table_name: Nome della tabella
+            columns: Colonne nell'ordine dei valori
+            values: Righe da inserire
+        """
+        encode = self._copy_text_value
+        key = ('copy', table_name, tuple(columns))
+        copy_query = self._sql_cache.get(key)
+        if copy_query is None:
+            # Le connessioni del pool condividono server ed encoding: il testo è riusabile
+            copy_query = self._sql_cache[key] = sql.SQL("COPY {} ({}) FROM STDIN").format(
+                sql.Identifier(table_name),
+                sql.SQL(", ").join(map(sql.Identifier, columns))
+            ).as_string(cursor.connection)
+        for start in range(0, len(values), self.COPY_CHUNK_ROWS):
+            buffer = io.StringIO()
+            buffer.writelines('\t'.join(map(encode, row)) + '\n'
+                              for row in values[start:start + self.COPY_CHUNK_ROWS])
+            buffer.seek(0)
+            cursor.copy_expert(copy_query, buffer)
     
     def list_project_tables(self) -> List[str]:
         """
         Lista tutte le tabelle nel database del progetto.
         
+        Il risultato resta in cache per TABLES_CACHE_TTL secondi (aggiornato dalle
+        tabelle create da questo manager), così i refresh ripetuti della UI non
+        interrogano pg_tables ogni volta.
+        
         Returns:
             Lista dei nomi delle tabelle
             
         Raises:
             Exception: [PJDB-007] Errore lettura tabelle
         """
+        cached = self._tables_cache
+        if cached is not None and time.monotonic() - cached[0] < self.TABLES_CACHE_TTL:
+            return list(cached[1])
+        
+        conn = None
         try:
             conn = self.connect_project_db()
             cursor = conn.cursor()
@@ -413,66 +872,167 @@ class ProjectDatabaseManager:
             tables = [row[0] for row in cursor.fetchall()]
             
             cursor.close()
-            conn.close()
             
-            return tables
+            self._tables_cache = (time.monotonic(), tables)
+            return list(tables)
             
         except Exception as e:
             raise Exception(f"[PJDB-007] Errore lettura tabelle: {e}")
+        finally:
+            self.release_connection(conn)
     
     def get_table_data(
         self,
         table_name: str,
         conditions: Optional[Dict[str, Any]] = None,
-        limit: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+        limit: Optional[int] = None,
+        stream: bool = False
+    ) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
         """
         Recupera dati da una tabella con filtri opzionali.
         
         Args:
             table_name: Nome della tabella
-            conditions: Dizionario di condizioni WHERE (es. {'vin': 12.0})
+            conditions: Dizionario di condizioni WHERE (es. {'vin': 12.0}); le chiavi
+                che non sono colonne vengono cercate tra le variabili di misura JSONB
             limit: Numero massimo di righe da restituire
+            stream: Se True restituisce un generatore che legge le righe a blocchi
+                di STREAM_ITERSIZE da un cursore lato server, senza caricare
+                l'intero risultato in memoria
             
         Returns:
-            Lista di dizionari con i dati
+            Lista di righe (RealDictRow, sottoclasse di dict) con i dati,
+            oppure un generatore delle stesse righe se stream è True
             
         Raises:
             Exception: [PJDB-008] Errore lettura dati
         """
+        # Costruisce la query
+        key = ('select', table_name)
+        query = self._sql_cache.get(key)
+        if query is None:
+            query = self._sql_cache[key] = sql.SQL("SELECT * FROM {}").format(sql.Identifier(table_name))
+        params = []
+        
+        if conditions:
+            try:
+                table_columns = self._table_columns(table_name)
+            except Exception as e:
+                raise Exception(f"[PJDB-008] Errore lettura dati da '{table_name}': {e}")
+            use_measurement = MEASUREMENT_COLUMN in table_columns
+            where_clauses = []
+            measurement_filter = {}
+            for col, val in conditions.items():
+                if use_measurement and col not in table_columns:
+                    measurement_filter[col] = val
+                    continue
+                where_clauses.append(sql.SQL("{} = %s").format(sql.Identifier(col)))
+                params.append(val)
+            if measurement_filter:
+                # Contenimento JSONB: usa l'indice GIN della colonna delle misure
+                where_clauses.append(sql.SQL("{} @> %s::jsonb").format(sql.Identifier(MEASUREMENT_COLUMN)))
+                params.append(_dump_measurement(measurement_filter))
+            
+            query = sql.SQL("{} WHERE {}").format(
+                query,
+                sql.SQL(" AND ").join(where_clauses)
+            )
+        
+        if limit:
+            query = sql.SQL("{} LIMIT %s").format(query)
+            params.append(limit)
+        
+        if stream:
+            return self._stream_table_data(table_name, query, params)
+        
+        conn = None
         try:
             conn = self.connect_project_db()
             cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-            
-            # Costruisce la query
-            query = sql.SQL("SELECT * FROM {}").format(sql.Identifier(table_name))
-            params = []
-            
-            if conditions:
-                where_clauses = []
-                for col, val in conditions.items():
-                    where_clauses.append(sql.SQL("{} = %s").format(sql.Identifier(col)))
-                    params.append(val)
-                
-                query = sql.SQL("{} WHERE {}").format(
-                    query,
-                    sql.SQL(" AND ").join(where_clauses)
-                )
-            
-            if limit:
-                query = sql.SQL("{} LIMIT %s").format(query)
-                params.append(limit)
-            
             cursor.execute(query, params)
+            # Le RealDictRow sono già sottoclassi di dict: nessuna copia per riga
             results = cursor.fetchall()
             
             cursor.close()
-            conn.close()
             
-            return [dict(row) for row in results]
+            return results
             
         except Exception as e:
             raise Exception(f"[PJDB-008] Errore lettura dati da '{table_name}': {e}")
+        finally:
+            self.release_connection(conn)
+    
+    def _stream_table_data(
+        self,
+        table_name: str,
+        query: 'sql.Composed',
+        params: List[Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generatore delle righe di query tramite un cursore con nome (lato server).
+        
+        La connessione resta fuori dal pool finché il generatore non è esaurito
+        o chiuso; il rollback eseguito dal pool alla restituzione chiude anche
+        il cursore sul server.
+        
+        Raises:
+            Exception: [PJDB-008] Errore lettura dati
+        """
+        conn = None
+        try:
+            conn = self.connect_project_db()
+            cursor = conn.cursor(
+                name=f"pjdb_{uuid.uuid4().hex[:8]}",
+                cursor_factory=psycopg2.extras.RealDictCursor
+            )
+            cursor.itersize = self.STREAM_ITERSIZE
+            cursor.execute(query, params)
+            yield from cursor
+            cursor.close()
+        except Exception as e:
+            raise Exception(f"[PJDB-008] Errore lettura dati da '{table_name}': {e}")
+        finally:
+            self.release_connection(conn)
+    
+    def export_table(self, table_name: str, destination: Any, format: str = 'csv') -> None:
+        """
+        Esporta l'intera tabella con COPY ... TO STDOUT, senza costruire oggetti
+        Python per riga: è il modo più rapido per portare uno sweep in analisi.
+        
+        Args:
+            table_name: Nome della tabella
+            destination: Percorso del file o file-like aperto in scrittura
+                (binario; testo solo per 'csv'). Per l'uso in memoria: io.BytesIO()
+            format: 'csv' (con intestazione) oppure 'binary' (formato binario di COPY)
+            
+        Raises:
+            Exception: [PJDB-011] Formato non supportato o errore esportazione
+        """
+        if format == 'csv':
+            options = sql.SQL("FORMAT CSV, HEADER")
+        elif format == 'binary':
+            options = sql.SQL("FORMAT BINARY")
+        else:
+            raise Exception(f"[PJDB-011] Formato di esportazione non supportato: '{format}'")
+        
+        conn = None
+        try:
+            conn = self.connect_project_db()
+            cursor = conn.cursor()
+            copy_query = sql.SQL("COPY {} TO STDOUT WITH ({})").format(
+                sql.Identifier(table_name),
+                options
+            ).as_string(conn)
+            if isinstance(destination, (str, bytes, os.PathLike)):
+                with open(destination, 'wb') as f:
+                    cursor.copy_expert(copy_query, f)
+            else:
+                cursor.copy_expert(copy_query, destination)
+            cursor.close()
+        except Exception as e:
+            raise Exception(f"[PJDB-011] Errore esportazione tabella '{table_name}': {e}")
+        finally:
+            self.release_connection(conn)
     
     def delete_project_database(self) -> bool:
         """
@@ -487,6 +1047,10 @@ class ProjectDatabaseManager:
         if not self.db_name:
             raise Exception("[PJDB-009] Nome database progetto non specificato")
         
+        # Le connessioni in pool impedirebbero il DROP DATABASE
+        self.close_pool()
+        self.refresh_metadata()
+        
         conn = None
         try:
             conn = self.connect_postgres()
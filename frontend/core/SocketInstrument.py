@@ -0,0 +1,192 @@
+"""
+Raw-socket SCPI transport for LAN instruments.
+
+Instruments that expose a raw SCPI port (usually 5025) can be driven over a
+plain TCP connection, avoiding the per-call RPC overhead of VXI-11. The
+SocketInstrument class mirrors the small subset of the PyVISA resource API
+used by the application (write/read/query/query_binary_values/close/timeout),
+so it can be stored alongside PyVISA sessions and used interchangeably.
+"""
+
+import re
+import socket
+import struct
+from typing import Any, Callable, Optional, Tuple
+
+DEFAULT_SCPI_PORT = 5025
+
+_SOCKET_ADDRESS_RE = re.compile(r'^TCPIP\d*::([^:]+)::(\d+)::SOCKET$', re.IGNORECASE)
+
+
+def parse_socket_address(visa_address: str) -> Optional[Tuple[str, int]]:
+    """
+    Extract host and port from a VISA raw-socket address.
+
+    Args:
+        visa_address: VISA address, e.g. ``'TCPIP0::192.168.1.10::5025::SOCKET'``.
+
+    Returns:
+        ``(host, port)`` for ``::SOCKET`` addresses, None for any other form.
+    """
+    match = _SOCKET_ADDRESS_RE.match(visa_address.strip())
+    if not match:
+        return None
+    return match.group(1), int(match.group(2))
+
+
+class SocketInstrument:
+    """
+    Minimal SCPI session over a raw TCP socket.
+
+    Attributes:
+        resource_name (str): VISA-style address of the session.
+        write_termination (str): Appended to every written command.
+        read_termination (str): Terminator of instrument replies.
+    """
+
+    def __init__(self, host: str, port: int = DEFAULT_SCPI_PORT, timeout: int = 2000,
+                 resource_name: Optional[str] = None):
+        """
+        Open the TCP connection to the instrument.
+
+        Args:
+            host: Instrument hostname or IP address.
+            port: Raw SCPI port.
+            timeout: I/O timeout in milliseconds (same unit as PyVISA).
+            resource_name: Address reported by ``resource_name``.
+
+        Raises:
+            OSError: If the connection cannot be established.
+        """
+        self.resource_name = resource_name or f"TCPIP0::{host}::{port}::SOCKET"
+        self.write_termination = '\n'
+        self.read_termination = '\n'
+        self._sock = socket.create_connection((host, port), timeout=timeout / 1000.0)
+        # SCPI commands are tiny: disable Nagle so each one leaves immediately
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile('rb')
+        self._timeout = timeout
+
+    @property
+    def timeout(self) -> int:
+        """I/O timeout in milliseconds."""
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: int) -> None:
+        self._timeout = value
+        self._sock.settimeout(value / 1000.0)
+
+    def write(self, command: str) -> None:
+        """
+        Send a command to the instrument.
+
+        Args:
+            command: SCPI command without terminator.
+        """
+        self._sock.sendall((command + self.write_termination).encode('ascii'))
+
+    def read_raw(self) -> bytes:
+        """
+        Read one terminated reply from the instrument.
+
+        Returns:
+            Raw reply bytes, terminator included.
+
+        Raises:
+            ConnectionError: If the instrument closed the connection.
+        """
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError(f"Connection closed by {self.resource_name}")
+        return line
+
+    def read(self) -> str:
+        """
+        Read one reply from the instrument.
+
+        Returns:
+            The reply without the read terminator.
+        """
+        return self.read_raw().decode('ascii', errors='replace').rstrip('\r\n')
+
+    def query(self, command: str) -> str:
+        """
+        Send a query and return its reply.
+
+        Args:
+            command: SCPI query.
+
+        Returns:
+            The reply without the read terminator.
+        """
+        self.write(command)
+        return self.read()
+
+    def _read_exact(self, size: int) -> bytes:
+        data = self._reader.read(size)
+        if len(data) < size:
+            raise ConnectionError(f"Connection closed by {self.resource_name}")
+        return data
+
+    def read_binary_values(self, datatype: str = 'f', is_big_endian: bool = False,
+                           container: Callable = list) -> Any:
+        """
+        Read an IEEE 488.2 binary block (``#<n><length><data>``) and decode it.
+
+        Args:
+            datatype: struct format character of one value ('f', 'd', 'h', ...).
+            is_big_endian: Byte order of the values.
+            container: list, tuple or numpy.ndarray (decoded without copying).
+
+        Returns:
+            The decoded values in the requested container.
+
+        Raises:
+            ValueError: If the reply is not a binary block.
+        """
+        header = self._read_exact(2)
+        if header[:1] != b'#' or not header[1:2].isdigit():
+            raise ValueError(f"Invalid binary block header {header!r} from {self.resource_name}")
+        num_digits = int(header[1:2])
+        if num_digits == 0:
+            # Indefinite-length block: data runs up to the terminator
+            data = self.read_raw()[:-len(self.read_termination)]
+        else:
+            length = int(self._read_exact(num_digits))
+            data = self._read_exact(length)
+            self._reader.readline()  # discard the terminator after the block
+        byte_order = '>' if is_big_endian else '<'
+        if container in (list, tuple):
+            count = len(data) // struct.calcsize(datatype)
+            return container(struct.unpack(f"{byte_order}{count}{datatype}", data[:count * struct.calcsize(datatype)]))
+        import numpy
+        values = numpy.frombuffer(data, dtype=numpy.dtype(byte_order + datatype))
+        return values if container is numpy.ndarray else container(values)
+
+    def query_binary_values(self, command: str, datatype: str = 'f', is_big_endian: bool = False,
+                            container: Callable = list) -> Any:
+        """
+        Send a query and decode its binary block reply (same signature subset as PyVISA).
+
+        Args:
+            command: SCPI query.
+            datatype: struct format character of one value.
+            is_big_endian: Byte order of the values.
+            container: list, tuple or numpy.ndarray.
+
+        Returns:
+            The decoded values in the requested container.
+        """
+        self.write(command)
+        return self.read_binary_values(datatype, is_big_endian, container)
+
+    def close(self) -> None:
+        """Close the connection; safe to call more than once."""
+        try:
+            self._reader.close()
+        finally:
+            self._sock.close()
+
+    def __repr__(self) -> str:
+        return f"<SocketInstrument {self.resource_name}>"
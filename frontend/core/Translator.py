@@ -1,5 +1,30 @@
 import os
 import json
+import sys
+
+try:
+    import orjson
+except ImportError:  # orjson is optional: fall back to the standard json module
+    orjson = None
+
+# Absolute path to the lang folder inside frontend (parent directory of core)
+DEFAULT_LANG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lang')
+
+
+def _intern_translations(data):
+    """
+    Intern the translation keys, so lookups with key literals from the code
+    (already interned by the compiler) match by identity, and share one copy
+    of repeated translated strings.
+    """
+    if not isinstance(data, dict):
+        return {}
+    values = {}
+    return {
+        sys.intern(key): values.setdefault(value, value) if isinstance(value, str) else value
+        for key, value in data.items()
+    }
+
 
 class Translator:
     """
@@ -13,11 +38,12 @@ class Translator:
         :param default_lang: Default language code.
         """
         if lang_dir is None:
-            # Absolute path to the lang folder inside frontend (parent directory of core)
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            lang_dir = os.path.join(base_dir, 'lang')
+            lang_dir = DEFAULT_LANG_DIR
         self.lang_dir = lang_dir
+        self.languages_loaded_from = None  # lang_dir scanned by the last load_languages()
         self.translations = {}
+        # lang -> (mtime_ns of its JSON file, parsed translations)
+        self._trans_cache = {}
         self.current_lang = default_lang
         self.load_languages()
         self.set_language(default_lang)
@@ -29,10 +55,11 @@ class Translator:
         self.available_langs = []
         if not os.path.exists(self.lang_dir):
             os.makedirs(self.lang_dir)
-        for fname in os.listdir(self.lang_dir):
-            if fname.endswith('.json'):
-                lang = fname[:-5]
-                self.available_langs.append(lang)
+        with os.scandir(self.lang_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    self.available_langs.append(entry.name[:-5])
+        self.languages_loaded_from = self.lang_dir
 
     def set_language(self, lang):
         """
@@ -40,16 +67,31 @@ class Translator:
         :param lang: Language code to set.
         """
         try:
-            with open(os.path.join(self.lang_dir, f'{lang}.json'), encoding='utf-8') as f:
-                self.translations = json.load(f)
+            path = os.path.join(self.lang_dir, f'{lang}.json')
+            mtime = os.stat(path).st_mtime_ns
+            cached = self._trans_cache.get(lang)
+            if cached is None or cached[0] != mtime:
+                # Parse only if the file changed since it was last loaded
+                with open(path, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                cached = (mtime, _intern_translations(data))
+                self._trans_cache[lang] = cached
+            self.translations = cached[1]
             self.current_lang = lang
         except Exception:
             self.translations = {}
             self.current_lang = lang
+        # Shadow the t() method with a closure over the new dict: each lookup is a
+        # single dict.get, without resolving self.translations on every call
+        self.t = lambda key, _get=self.translations.get: _get(key, key)
 
     def t(self, key):
         """
         Translate a key using the current language.
+        Replaced per instance by set_language with an equivalent, faster closure:
+        look translator.t up at each call instead of storing it, or the stored
+        closure keeps translating into the previous language.
         :param key: The translation key.
         :return: Translated string or the key if not found.
         """
@@ -0,0 +1,183 @@
+"""
+Bounded pool of open instrument sessions.
+
+Each VISA session holds OS handles and instrument-side resources, so the pool
+caps the number of open sessions (least-recently-used eviction) and closes the
+ones left idle for too long. Every close goes through the per-address I/O lock
+held by workers: a session in use is never closed under a running transaction.
+Eviction and reaping skip busy sessions; an explicit close (discard, replace,
+close_all) of a busy one is deferred until its lock is released (close_stale).
+It keeps the mapping interface previously used for the plain
+``visa_connections`` dict, so callers can look sessions up by address as before.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterator, List, Mapping, Optional, Tuple
+
+
+def _close_quietly(instr: Any) -> None:
+    """Close a session, ignoring errors from already-broken connections."""
+    try:
+        instr.close()
+    except Exception:
+        pass
+
+
+class VisaPool:
+    """
+    Address-keyed pool of open sessions with LRU eviction and idle reaping.
+
+    Attributes:
+        max_size (int): Maximum number of sessions kept open.
+        idle_s (float): Seconds of inactivity after which reap_idle closes a session.
+    """
+
+    def __init__(self, max_size: int = 32, idle_s: float = 300, locks: Optional[Mapping[str, Any]] = None):
+        """
+        Args:
+            max_size: Maximum number of sessions kept open.
+            idle_s: Seconds of inactivity after which reap_idle closes a session.
+            locks: address -> lock held while a worker does I/O on that session.
+                Looked up on every close, so it may be filled in later.
+        """
+        self.max_size = max_size
+        self.idle_s = idle_s
+        self._locks = locks if locks is not None else {}
+        # address -> [last_used_monotonic, session]; order = least recently used first
+        self._sessions: "OrderedDict[str, list]" = OrderedDict()
+        # (address, session) already removed from the pool whose close waits for the lock
+        self._stale: List[Tuple[str, Any]] = []
+
+    def get(self, addr: str, opener: Optional[Callable[[str], Any]] = None) -> Any:
+        """
+        Return the session for addr, marking it as recently used.
+
+        Args:
+            addr: VISA address.
+            opener: Called as opener(addr) to open the session when it is not
+                pooled yet. Exceptions from the opener propagate.
+
+        Returns:
+            The session, or None if not pooled and no opener was given.
+        """
+        entry = self._sessions.get(addr)
+        if entry is not None:
+            entry[0] = time.monotonic()
+            self._sessions.move_to_end(addr)
+            return entry[1]
+        if opener is None:
+            return None
+        instr = opener(addr)
+        self[addr] = instr
+        return instr
+
+    def __setitem__(self, addr: str, instr: Any) -> None:
+        """Add or replace a session, closing the replaced one and evicting the LRU overflow."""
+        previous = self._sessions.pop(addr, None)
+        if previous is not None and previous[1] is not instr:
+            self._close_session(addr, previous[1])
+        self._sessions[addr] = [time.monotonic(), instr]
+        # Evict least recently used first; busy sessions are skipped, so the
+        # pool may stay over max_size until their I/O completes
+        overflow = len(self._sessions) - self.max_size
+        for old_addr in list(self._sessions):
+            if overflow <= 0 or old_addr == addr:
+                break
+            if self._close_if_free(old_addr):
+                overflow -= 1
+
+    def __getitem__(self, addr: str) -> Any:
+        if addr not in self._sessions:
+            raise KeyError(addr)
+        return self.get(addr)
+
+    def __contains__(self, addr: object) -> bool:
+        return addr in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._sessions))
+
+    def pop(self, addr: str, default: Any = None) -> Any:
+        """Remove a session from the pool without closing it and return it."""
+        entry = self._sessions.pop(addr, None)
+        return default if entry is None else entry[1]
+
+    def discard(self, addr: str) -> None:
+        """Remove the session for addr, if any, and close it (once idle, if busy)."""
+        instr = self.pop(addr)
+        if instr is not None:
+            self._close_session(addr, instr)
+
+    def values(self) -> List[Any]:
+        return [entry[1] for entry in self._sessions.values()]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(addr, entry[1]) for addr, entry in self._sessions.items()]
+
+    def _close_session(self, addr: str, instr: Any) -> bool:
+        """
+        Close a session already removed from the pool, holding its address lock.
+        If a worker holds the lock the session is queued in _stale instead.
+
+        Returns:
+            True if the session was closed now.
+        """
+        lock = self._locks.get(addr)
+        if lock is not None and not lock.acquire(blocking=False):
+            self._stale.append((addr, instr))
+            return False
+        try:
+            _close_quietly(instr)
+        finally:
+            if lock is not None:
+                lock.release()
+        return True
+
+    def close_stale(self) -> int:
+        """
+        Close the sessions whose close was deferred, if their lock is now free.
+        Meant to be called when a worker releases an address lock.
+
+        Returns:
+            Number of sessions closed.
+        """
+        if not self._stale:
+            return 0
+        pending, self._stale = self._stale, []
+        return sum(1 for addr, instr in pending if self._close_session(addr, instr))
+
+    def _close_if_free(self, addr: str) -> bool:
+        """
+        Close and remove the session for addr unless its lock is held.
+
+        Returns:
+            False if a worker is using the session (left pooled), True otherwise.
+        """
+        lock = self._locks.get(addr)
+        if lock is not None and lock.locked():
+            return False
+        self.discard(addr)
+        return True
+
+    def reap_idle(self) -> int:
+        """
+        Close sessions unused for more than idle_s seconds, skipping busy ones.
+
+        Returns:
+            Number of sessions closed.
+        """
+        self.close_stale()
+        cutoff = time.monotonic() - self.idle_s
+        stale = [addr for addr, (last_used, _) in self._sessions.items() if last_used < cutoff]
+        return sum(1 for addr in stale if self._close_if_free(addr))
+
+    def close_all(self) -> None:
+        """Empty the pool, closing every session (busy ones once their I/O completes)."""
+        while self._sessions:
+            addr, (_, instr) = self._sessions.popitem(last=False)
+            self._close_session(addr, instr)
+        self.close_stale()
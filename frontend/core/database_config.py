@@ -7,11 +7,116 @@ Cross-platform support for Linux and Windows.
 import os
 import json
 import platform
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
-from cryptography.fernet import Fernet
+from typing import Dict, Any, Optional, Tuple
+from cryptography.fernet import Fernet, InvalidToken
 import base64
-import hashlib
+import binascii
+
+try:
+    import rfernet
+except ImportError:  # rfernet is optional: cryptography's Fernet is used instead
+    rfernet = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional: fall back to the standard json module
+    orjson = None
+
+
+
+class _FernetCipher:
+    """
+    Fernet cipher with one API over both backends: rfernet (Rust, used when
+    installed) and cryptography. Tokens are str, plaintext is bytes, and a bad
+    token always raises cryptography's InvalidToken.
+    """
+    
+    def __init__(self, key: bytes):
+        """
+        Args:
+            key: urlsafe-base64 Fernet key as read from the key file
+        """
+        key = key.strip()
+        self._rust = rfernet is not None
+        if self._rust:
+            # rfernet takes the key as str
+            self._fernet = rfernet.Fernet(key.decode('ascii'))
+        else:
+            self._fernet = Fernet(key)
+    
+    def encrypt(self, data: bytes) -> str:
+        """Encrypt data and return the Fernet token."""
+        token = self._fernet.encrypt(data)
+        # cryptography returns the token as bytes, rfernet as str
+        return token.decode('ascii') if isinstance(token, bytes) else token
+    
+    def decrypt(self, token: str) -> bytes:
+        """
+        Decrypt a Fernet token.
+        
+        Raises:
+            InvalidToken: If the token is malformed or was made with another key
+        """
+        if not self._rust:
+            return self._fernet.decrypt(token.encode('ascii'))
+        try:
+            data = self._fernet.decrypt(token)
+        except _RFERNET_ERRORS as e:
+            raise InvalidToken() from e
+        return data.encode('utf-8') if isinstance(data, str) else data
+
+
+# Exceptions raised by rfernet for tokens it cannot decrypt
+_RFERNET_ERRORS = (getattr(rfernet, 'DecryptionError', ValueError), ValueError) if rfernet is not None else ()
+
+# The OS cannot change while the process runs: query it (uname) only once
+_SYSTEM = platform.system()
+IS_WINDOWS = _SYSTEM == 'Windows'
+
+
+def _read_json(path: str) -> Any:
+    """Read a JSON file, with orjson when available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as UTF-8 JSON indented by 2 spaces, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _write_private_file(path: str, payload: bytes, tmp_path: Optional[str] = None) -> None:
+    """
+    Atomically replace path with payload, readable and writable by the owner only.
+    
+    The data goes to a temporary file created with mode 0600 (so no separate
+    chmod), is flushed to disk and then renamed over path: readers never see
+    a truncated file, even if the process dies mid-write.
+    """
+    if tmp_path is None:
+        tmp_path = path + '.tmp'
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    try:
+        fd = os.open(tmp_path, flags, 0o600)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
 class DatabaseConfigManager:
@@ -28,20 +133,51 @@ class DatabaseConfigManager:
     CONFIG_FILENAME = 'database_config.json'
     KEY_FILENAME = '.db_key'
     APP_NAME = 'OpenLabAutomation'
+    # Maximum number of ciphertext -> plaintext pairs kept by _decrypt_password
+    DECRYPT_CACHE_SIZE = 32
+    # Every Fernet token starts with version byte 0x80, i.e. 'gA' in urlsafe base64
+    _FERNET_TOKEN_PREFIX = 'gA'
+    # Result of _find_old_config (None = no old config); _UNSET until first looked up
+    _UNSET = object()
+    _old_config_path_cache: Any = _UNSET
     
     def __init__(self):
         """Initialize database configuration manager."""
-        self.config_dir = self._get_config_directory()
-        self.config_file = os.path.join(self.config_dir, self.CONFIG_FILENAME)
-        self.key_file = os.path.join(self.config_dir, self.KEY_FILENAME)
+        self.config_dir = CONFIG_DIR
+        self.config_file = CONFIG_FILE
+        self.key_file = KEY_FILE
+        self.config_tmp_file = CONFIG_TMP_FILE
+        self.old_ui_config_path = OLD_UI_CONFIG_FILE
         
         # Ensure config directory exists
         os.makedirs(self.config_dir, exist_ok=True)
         
-        # Initialize encryption key
-        self.cipher = self._get_cipher()
+        # Encryption cipher, created on first use by the cipher property
+        self._cipher = None
+        self._cipher_lock = threading.Lock()
+        
+        # Encrypted password -> plain text, so repeated load_config() calls skip Fernet
+        self._decrypt_cache: Dict[str, str] = {}
+    
+    @property
+    def cipher(self) -> _FernetCipher:
+        """
+        Encryption cipher, loading (or creating) the key file on first access.
+        
+        Paths that never encrypt or decrypt, such as get_config_location() or
+        loading a config without password, do not touch the key file.
+        """
+        cipher = self._cipher
+        if cipher is None:
+            # Serialized so concurrent first uses cannot both create the key file
+            with self._cipher_lock:
+                if self._cipher is None:
+                    self._cipher = self._get_cipher()
+                cipher = self._cipher
+        return cipher
     
-    def _get_config_directory(self) -> str:
+    @classmethod
+    def _get_config_directory(cls) -> str:
         """
         Get platform-specific configuration directory.
         
@@ -53,34 +189,37 @@ class DatabaseConfigManager:
         - Windows: %APPDATA%/OpenLabAutomation/
         - macOS: ~/Library/Application Support/OpenLabAutomation/
         """
-        system = platform.system()
+        system = _SYSTEM
         
         if system == 'Windows':
             # Windows: use APPDATA
             appdata = os.environ.get('APPDATA')
             if appdata:
-                return os.path.join(appdata, self.APP_NAME)
+                return os.path.join(appdata, cls.APP_NAME)
             else:
                 # Fallback to user profile
-                return os.path.join(Path.home(), 'AppData', 'Roaming', self.APP_NAME)
+                return os.path.join(Path.home(), 'AppData', 'Roaming', cls.APP_NAME)
         
         elif system == 'Darwin':  # macOS
-            return os.path.join(Path.home(), 'Library', 'Application Support', self.APP_NAME)
+            return os.path.join(Path.home(), 'Library', 'Application Support', cls.APP_NAME)
         
         else:  # Linux and others
             # Follow XDG Base Directory specification
             xdg_config = os.environ.get('XDG_CONFIG_HOME')
             if xdg_config:
-                return os.path.join(xdg_config, self.APP_NAME)
+                return os.path.join(xdg_config, cls.APP_NAME)
             else:
-                return os.path.join(Path.home(), '.config', self.APP_NAME)
+                return os.path.join(Path.home(), '.config', cls.APP_NAME)
     
-    def _get_cipher(self) -> Fernet:
+    def _get_cipher(self) -> _FernetCipher:
         """
         Get or create encryption cipher.
         
+        Uses the Rust implementation from rfernet when installed (several times
+        faster than cryptography's); tokens and key file are compatible with both.
+        
         Returns:
-            Fernet: Encryption cipher object
+            _FernetCipher: Encryption cipher object
         """
         if os.path.exists(self.key_file):
             # Load existing key
@@ -95,10 +234,10 @@ class DatabaseConfigManager:
                 f.write(key)
             
             # Set file permissions (Unix only)
-            if platform.system() != 'Windows':
+            if not IS_WINDOWS:
                 os.chmod(self.key_file, 0o600)  # Read/write for owner only
         
-        return Fernet(key)
+        return _FernetCipher(key)
     
     def _encrypt_password(self, password: str) -> str:
         """
@@ -108,20 +247,25 @@ class DatabaseConfigManager:
             password: Plain text password
             
         Returns:
-            str: Encrypted password (base64 encoded)
+            str: Encrypted password (Fernet token, already urlsafe base64)
         """
         if not password:
             return ''
         
-        encrypted = self.cipher.encrypt(password.encode('utf-8'))
-        return base64.b64encode(encrypted).decode('utf-8')
+        encrypted_password = self.cipher.encrypt(password.encode('utf-8'))
+        # The next load_config() will read back exactly this ciphertext
+        self._cache_decrypted(encrypted_password, password)
+        return encrypted_password
     
     def _decrypt_password(self, encrypted_password: str) -> str:
         """
         Decrypt password.
         
+        Accepts both the Fernet token and the base64-wrapped token written by
+        older versions; the latter is rewritten in the new form on the next save.
+        
         Args:
-            encrypted_password: Encrypted password (base64 encoded)
+            encrypted_password: Encrypted password (Fernet token)
             
         Returns:
             str: Plain text password
@@ -129,13 +273,35 @@ class DatabaseConfigManager:
         if not encrypted_password:
             return ''
         
+        cached = self._decrypt_cache.get(encrypted_password)
+        if cached is not None:
+            return cached
+        
         try:
-            encrypted = base64.b64decode(encrypted_password.encode('utf-8'))
-            decrypted = self.cipher.decrypt(encrypted)
-            return decrypted.decode('utf-8')
-        except Exception:
-            # If decryption fails, might be plain text (migration case)
+            token = encrypted_password
+            if not token.startswith(self._FERNET_TOKEN_PREFIX):
+                # Legacy format: Fernet token wrapped in a second base64 layer
+                token = base64.b64decode(token.encode('ascii'), validate=True).decode('ascii')
+            password = self.cipher.decrypt(token).decode('utf-8')
+        except (InvalidToken, binascii.Error, UnicodeError):
+            # Not a token for this key: might be plain text (migration case).
+            # Not cached, so a later key fix or save is picked up
             return encrypted_password
+        self._cache_decrypted(encrypted_password, password)
+        return password
+    
+    def _cache_decrypted(self, encrypted_password: str, password: str) -> None:
+        """
+        Remember the plain text of a ciphertext, evicting the oldest entry when full.
+        
+        Args:
+            encrypted_password: Fernet token as stored in the configuration (possibly legacy base64-wrapped)
+            password: Corresponding plain text password
+        """
+        cache = self._decrypt_cache
+        if encrypted_password not in cache and len(cache) >= self.DECRYPT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[encrypted_password] = password
     
     def load_config(self) -> Dict[str, Any]:
         """
@@ -155,8 +321,7 @@ class DatabaseConfigManager:
         # Try to load from new location
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = _read_json(self.config_file)
                 
                 # Decrypt password if present
                 if config.get('password'):
@@ -197,13 +362,8 @@ class DatabaseConfigManager:
             if config_to_save.get('password'):
                 config_to_save['password'] = self._encrypt_password(config_to_save['password'])
             
-            # Save to file
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_to_save, f, indent=2)
-            
-            # Set file permissions (Unix only)
-            if platform.system() != 'Windows':
-                os.chmod(self.config_file, 0o600)  # Read/write for owner only
+            # Save to file (atomic, created with owner-only permissions)
+            _write_private_file(self.config_file, _dump_json(config_to_save), self.config_tmp_file)
             
             return True
             
@@ -215,20 +375,22 @@ class DatabaseConfigManager:
         """
         Find old configuration file in application directory.
         
+        The lookup runs once per process: the application directory does not
+        change, so later calls (including negative results) skip the filesystem.
+        
         Returns:
             str or None: Path to old config file if found
         """
+        cls = type(self)
+        if cls._old_config_path_cache is not cls._UNSET:
+            return cls._old_config_path_cache
+        
         # Look for old config in ui directory
-        try:
-            ui_dir = os.path.join(os.path.dirname(__file__), '..', 'ui')
-            old_path = os.path.join(ui_dir, 'database_config.json')
-            
-            if os.path.exists(old_path):
-                return old_path
-        except Exception:
-            pass
+        old_path = self.old_ui_config_path
+        found = old_path if os.path.exists(old_path) else None
         
-        return None
+        cls._old_config_path_cache = found
+        return found
     
     def _migrate_old_config(self, old_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -241,8 +403,7 @@ class DatabaseConfigManager:
             dict or None: Migrated configuration
         """
         try:
-            with open(old_path, 'r', encoding='utf-8') as f:
-                old_config = json.load(f)
+            old_config = _read_json(old_path)
             
             # Save to new location with encryption
             self.save_config(old_config)
@@ -308,8 +469,34 @@ class DatabaseConfigManager:
         return params
 
 
+def _compute_paths() -> Tuple[str, str, str, str, str]:
+    """
+    Compute the configuration paths, which are fixed for the whole process.
+    
+    Returns:
+        tuple: (config directory, config file, key file, temporary file used
+        by atomic saves, config file location of older versions)
+    """
+    config_dir = DatabaseConfigManager._get_config_directory()
+    config_file = os.path.join(config_dir, DatabaseConfigManager.CONFIG_FILENAME)
+    old_ui_config = os.path.realpath(
+        os.path.join(os.path.dirname(__file__), '..', 'ui', DatabaseConfigManager.CONFIG_FILENAME)
+    )
+    return (
+        config_dir,
+        config_file,
+        os.path.join(config_dir, DatabaseConfigManager.KEY_FILENAME),
+        config_file + '.tmp',
+        old_ui_config,
+    )
+
+
+CONFIG_DIR, CONFIG_FILE, KEY_FILE, CONFIG_TMP_FILE, OLD_UI_CONFIG_FILE = _compute_paths()
+
+
 # Singleton instance
 _config_manager = None
+_config_manager_lock = threading.Lock()
 
 def get_database_config_manager() -> DatabaseConfigManager:
     """
@@ -319,6 +506,12 @@ def get_database_config_manager() -> DatabaseConfigManager:
         DatabaseConfigManager: Singleton instance
     """
     global _config_manager
-    if _config_manager is None:
-        _config_manager = DatabaseConfigManager()
-    return _config_manager
+    manager = _config_manager
+    if manager is not None:
+        # Fast path: no locking once the instance exists
+        return manager
+    with _config_manager_lock:
+        # Another thread may have created it (and the key file) while we waited
+        if _config_manager is None:
+            _config_manager = DatabaseConfigManager()
+        return _config_manager
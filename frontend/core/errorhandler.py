@@ -14,13 +14,31 @@ Examples:
 - [VALID-005]: Invalid email format
 """
 import logging
-from enum import Enum
-from PyQt6.QtWidgets import QMessageBox
+import re
+import threading
 from PyQt6.QtCore import QObject, pyqtSignal
 
+# QtWidgets is imported by show_error_dialog on first use, so headless users
+# of the handler (workers, scripts) only load QtCore
+_QMessageBox = None
 
-class ErrorCode(Enum):
-    """Standardized error codes for the application"""
+
+def _message_box_class():
+    """Return QMessageBox, importing PyQt6.QtWidgets the first time."""
+    global _QMessageBox
+    if _QMessageBox is None:
+        from PyQt6.QtWidgets import QMessageBox
+        _QMessageBox = QMessageBox
+    return _QMessageBox
+
+
+class ErrorCode:
+    """
+    Standardized error codes for the application.
+    
+    Plain string constants rather than an Enum: the code is used as-is in
+    exception messages and logs, with no .value lookup on the error path.
+    """
     
     # VISA related errors (VISA-XXX)
     VISA_CONNECTION_FAILED = "[VISA-001]"
@@ -157,114 +175,126 @@ class ErrorCode(Enum):
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class VISAError(Exception):
     """Custom exception for VISA-related errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class FileError(Exception):
     """Custom exception for file-related errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class UIError(Exception):
     """Custom exception for UI-related errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class DataloggerError(Exception):
     """Custom exception for datalogger-related errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class ToolError(Exception):
     """Custom exception for tool-related errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class ProjectError(Exception):
     """Custom exception for project-related errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class InstrumentError(Exception):
     """Custom exception for instrument configuration errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class ConfigError(Exception):
     """Custom exception for configuration-related errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class LibraryError(Exception):
     """Custom exception for instrument library errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class SCPIError(Exception):
     """Custom exception for SCPI command errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class DataError(Exception):
     """Custom exception for data acquisition/processing errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class ProjectDatabaseError(Exception):
     """Custom exception for project database errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
 
 
 class SystemError(Exception):
     """Custom exception for system-level errors"""
-    def __init__(self, error_code: ErrorCode, message: str = ""):
+    def __init__(self, error_code: str, message: str = ""):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{error_code.value}: {message}")
+        super().__init__(f"{error_code}: {message}")
+
+
+# handle_visa_error: (lowercase substring of the exception text, error code, description);
+# the first matching entry wins
+_VISA_PATTERNS = (
+    ("vi_error_rsrc_nfound", ErrorCode.VISA_RESOURCE_NOT_FOUND, "Resource not found or not available"),
+    ("can't connect to server", ErrorCode.VISA_CONNECTION_FAILED, "Unable to connect to instrument server"),
+    ("timeout", ErrorCode.VISA_TIMEOUT_ERROR, "Communication timeout"),
+)
+
+# handle_ui_error: PyQt message for an access to an already deleted widget
+_UI_DELETED_RE = re.compile(r"wrapped C/C\+\+ object.*has been deleted")
 
 
 class ErrorHandler(QObject):
@@ -295,10 +325,11 @@ class ErrorHandler(QObject):
         technical_message = str(exception)
         
         # Extract error code if it's one of our custom exceptions
-        if hasattr(exception, 'error_code'):
-            error_code_enum = exception.error_code
+        # (third-party exceptions such as pyvisa's VisaIOError carry a numeric error_code)
+        code = getattr(exception, 'error_code', None)
+        if isinstance(code, str):
             # Remove brackets from error code for structured format
-            error_code = error_code_enum.value.strip('[]')
+            error_code = code.strip('[]')
             if hasattr(exception, 'message') and exception.message:
                 technical_message = exception.message
         
@@ -326,6 +357,7 @@ class ErrorHandler(QObject):
             technical_message: Technical details for support
         """
         try:
+            QMessageBox = _message_box_class()
             msg_box = QMessageBox()
             msg_box.setIcon(QMessageBox.Icon.Critical)
             msg_box.setWindowTitle("Error")
@@ -360,25 +392,16 @@ class ErrorHandler(QObject):
             context: Context where the error occurred
             show_dialog: Whether to show an error dialog (default True)
         """
-        if "VI_ERROR_RSRC_NFOUND" in str(exception):
-            visa_error = VISAError(
-                ErrorCode.VISA_RESOURCE_NOT_FOUND,
-                f"{context}: Resource not found or not available"
-            )
-        elif "can't connect to server" in str(exception).lower():
-            visa_error = VISAError(
-                ErrorCode.VISA_CONNECTION_FAILED,
-                f"{context}: Unable to connect to instrument server"
-            )
-        elif "timeout" in str(exception).lower():
-            visa_error = VISAError(
-                ErrorCode.VISA_TIMEOUT_ERROR,
-                f"{context}: Communication timeout"
-            )
+        text = str(exception)
+        text_lower = text.lower()
+        for needle, error_code, description in _VISA_PATTERNS:
+            if needle in text_lower:
+                visa_error = VISAError(error_code, f"{context}: {description}")
+                break
         else:
             visa_error = VISAError(
                 ErrorCode.VISA_COMMUNICATION_ERROR,
-                f"{context}: {str(exception)}"
+                f"{context}: {text}"
             )
         
         self.handle_error(visa_error, f"Instrument communication error during {context}", show_dialog=show_dialog)
@@ -391,7 +414,8 @@ class ErrorHandler(QObject):
             exception: The UI exception
             context: Context where the error occurred
         """
-        if "wrapped C/C++ object" in str(exception) and "has been deleted" in str(exception):
+        text = str(exception)
+        if _UI_DELETED_RE.search(text):
             ui_error = UIError(
                 ErrorCode.UI_WIDGET_DELETED,
                 f"{context}: Widget was deleted while still being accessed"
@@ -399,7 +423,7 @@ class ErrorHandler(QObject):
         else:
             ui_error = UIError(
                 ErrorCode.UI_INVALID_STATE,
-                f"{context}: {str(exception)}"
+                f"{context}: {text}"
             )
         
         self.handle_error(ui_error, f"User interface error during {context}")
@@ -407,6 +431,7 @@ class ErrorHandler(QObject):
 
 # Global error handler instance
 _global_error_handler = None
+_global_error_handler_lock = threading.Lock()
 
 
 def get_error_handler(logger=None):
@@ -420,9 +445,15 @@ def get_error_handler(logger=None):
         ErrorHandler: The global error handler instance
     """
     global _global_error_handler
-    if _global_error_handler is None:
-        _global_error_handler = ErrorHandler(logger)
-    return _global_error_handler
+    handler = _global_error_handler
+    if handler is not None:
+        # Fast path: no locking once the handler exists
+        return handler
+    with _global_error_handler_lock:
+        # Another thread may have created it while we waited for the lock
+        if _global_error_handler is None:
+            _global_error_handler = ErrorHandler(logger)
+        return _global_error_handler
 
 
 def handle_error(exception, user_message="An error occurred", show_dialog=True):
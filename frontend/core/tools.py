@@ -445,4 +445,45 @@ def diagnose_connection(visa_address: str) -> dict:
         )
         results['recommendations'].append("Verify firewall is not blocking the connection.")
 
-    return results
\ No newline at end of file
+    return results
+
+def join_scpi_queries(commands: List[str]) -> str:
+    """
+    Concatenate several SCPI queries into a single program message.
+
+    SCPI allows multiple commands in one message separated by ``;``. Every
+    command after the first is made root-relative with a leading ``:`` (common
+    ``*`` commands are left untouched) so the header path of the previous
+    command does not leak into the next one.
+
+    Args:
+        commands: SCPI query strings, e.g. ``['MEAS:VOLT? (@101)', 'MEAS:CURR?']``.
+
+    Returns:
+        The compound message, e.g. ``'MEAS:VOLT? (@101);:MEAS:CURR?'``.
+    """
+    parts = []
+    for index, cmd in enumerate(commands):
+        cmd = cmd.strip()
+        if index and not cmd.startswith((':', '*')):
+            cmd = ':' + cmd
+        parts.append(cmd)
+    return ';'.join(parts)
+
+
+def split_scpi_response(response: str, expected: int) -> Optional[List[str]]:
+    """
+    Split the reply to a compound SCPI query into one value per query.
+
+    Args:
+        response: Raw instrument reply.
+        expected: Number of queries that were concatenated.
+
+    Returns:
+        List of stripped values, or None if the reply does not contain exactly
+        ``expected`` fields (the caller should fall back to single queries).
+    """
+    values = [value.strip() for value in response.strip().split(';')]
+    if len(values) != expected:
+        return None
+    return values
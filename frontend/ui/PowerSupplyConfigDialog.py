@@ -1,9 +1,27 @@
 import json
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QTableWidget, QTableWidgetItem,
-                              QCheckBox, QLineEdit, QDialogButtonBox, QLabel,
-                              QSizePolicy, QHeaderView)
+                              QLineEdit, QDialogButtonBox,
+                              QSizePolicy, QHeaderView, QStyledItemDelegate)
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QDoubleValidator
 
+
+class BoundedDoubleDelegate(QStyledItemDelegate):
+    """Editor delegate for numeric cells: every editor of the column shares one validator."""
+    def __init__(self, vmax=None, parent=None):
+        super().__init__(parent)
+        self._v = QDoubleValidator(self)
+        self._v.setBottom(0.0)
+        self._v.setDecimals(3)
+        if vmax is not None:
+            self._v.setTop(float(vmax))
+
+    def createEditor(self, parent, option, index):
+        editor = QLineEdit(parent)
+        editor.setValidator(self._v)
+        return editor
+
+
 class PowerSupplyConfigDialog(QDialog):
     def __init__(self, instrument, parent=None):
         super().__init__(parent)
@@ -33,20 +51,21 @@ class PowerSupplyConfigDialog(QDialog):
         # Tabella canali
         self.table = QTableWidget(len(self.channels), 3)
         self.table.setHorizontalHeaderLabels(["Abilita", "Nome variabile", "Corrente max (A)"])
+        self.table.setItemDelegateForColumn(2, BoundedDoubleDelegate(parent=self.table))
+        # Celle come semplici item: un solo slot itemChanged smista per riga/colonna
+        self.table.blockSignals(True)
         for row, ch in enumerate(self.channels):
             # Abilita
-            chk = QCheckBox()
-            chk.setChecked(ch.get('enabled', False))
-            chk.stateChanged.connect(lambda state, r=row: self.on_enabled_changed(r, state))
-            self.table.setCellWidget(row, 0, chk)
+            chk_item = QTableWidgetItem("")
+            chk_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
+            chk_item.setCheckState(Qt.CheckState.Checked if ch.get('enabled', False) else Qt.CheckState.Unchecked)
+            self.table.setItem(row, 0, chk_item)
             # Nome variabile
-            name_edit = QLineEdit(ch.get('name', f'CH{row+1}'))
-            name_edit.textChanged.connect(lambda val, r=row: self.on_name_changed(r, val))
-            self.table.setCellWidget(row, 1, name_edit)
+            self.table.setItem(row, 1, QTableWidgetItem(ch.get('name', f'CH{row+1}')))
             # Corrente max
-            curr_edit = QLineEdit(str(ch.get('max_current', 0.0)))
-            curr_edit.textChanged.connect(lambda val, r=row: self.on_current_changed(r, val))
-            self.table.setCellWidget(row, 2, curr_edit)
+            self.table.setItem(row, 2, QTableWidgetItem(str(ch.get('max_current', 0.0))))
+        self.table.blockSignals(False)
+        self.table.itemChanged.connect(self._on_item_changed)
         self.table.resizeColumnsToContents()
         # Configurazione ridimensionamento tabella per adattarsi al dialog
         self.table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -62,6 +81,15 @@ class PowerSupplyConfigDialog(QDialog):
         btns.rejected.connect(self.reject)
         layout.addWidget(btns)
 
+    def _on_item_changed(self, item):
+        row, col = item.row(), item.column()
+        if col == 0:
+            self.on_enabled_changed(row, item.checkState() == Qt.CheckState.Checked)
+        elif col == 1:
+            self.on_name_changed(row, item.text())
+        elif col == 2:
+            self.on_current_changed(row, item.text())
+
     def on_enabled_changed(self, row, state):
         self.channels[row]['enabled'] = bool(state)
         self.save_channels()
@@ -82,27 +110,40 @@ class PowerSupplyConfigDialog(QDialog):
         table = QTableWidget(len(channels), 5, parent)
         headers = ["Abilita", "ID Canale", "Corrente max (A)", "Tensione max (V)", "Nome variabile"]
         table.setHorizontalHeaderLabels(headers)
+        # Un delegate (e quindi un solo validator) per colonna numerica
+        table.setItemDelegateForColumn(2, BoundedDoubleDelegate(max_current, table))
+        table.setItemDelegateForColumn(3, BoundedDoubleDelegate(max_voltage, table))
+        table.blockSignals(True)
         for row, ch in enumerate(channels):
-            chk = QCheckBox()
-            chk.setChecked(ch.get('enabled', False))
-            chk.stateChanged.connect(lambda state, r=row: callbacks['enabled'](r, state))
-            table.setCellWidget(row, 0, chk)
-            id_label = QLabel(channel_ids[row] if row < len(channel_ids) else f'CH{row+1}')
-            table.setCellWidget(row, 1, id_label)
-            curr_edit = QLineEdit(str(ch.get('max_current', 0.0)))
+            chk_item = QTableWidgetItem("")
+            chk_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
+            chk_item.setCheckState(Qt.CheckState.Checked if ch.get('enabled', False) else Qt.CheckState.Unchecked)
+            table.setItem(row, 0, chk_item)
+            id_item = QTableWidgetItem(channel_ids[row] if row < len(channel_ids) else f'CH{row+1}')
+            id_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+            table.setItem(row, 1, id_item)
+            curr_item = QTableWidgetItem(str(ch.get('max_current', 0.0)))
             if max_current is not None:
-                curr_edit.setPlaceholderText(f"max {max_current}")
-                curr_edit.setValidator(QDoubleValidator(0.0, float(max_current), 3, curr_edit))
-            curr_edit.textChanged.connect(lambda val, r=row: callbacks['max_current'](r, val))
-            table.setCellWidget(row, 2, curr_edit)
-            volt_edit = QLineEdit(str(ch.get('max_voltage', 0.0)))
+                curr_item.setToolTip(f"max {max_current}")
+            table.setItem(row, 2, curr_item)
+            volt_item = QTableWidgetItem(str(ch.get('max_voltage', 0.0)))
             if max_voltage is not None:
-                volt_edit.setPlaceholderText(f"max {max_voltage}")
-                volt_edit.setValidator(QDoubleValidator(0.0, float(max_voltage), 3, volt_edit))
-            volt_edit.textChanged.connect(lambda val, r=row: callbacks['max_voltage'](r, val))
-            table.setCellWidget(row, 3, volt_edit)
-            name_edit = QLineEdit(ch.get('name', f'CH{row+1}'))
-            name_edit.textChanged.connect(lambda val, r=row: callbacks['name'](r, val))
-            table.setCellWidget(row, 4, name_edit)
+                volt_item.setToolTip(f"max {max_voltage}")
+            table.setItem(row, 3, volt_item)
+            table.setItem(row, 4, QTableWidgetItem(ch.get('name', f'CH{row+1}')))
+        table.blockSignals(False)
+
+        def on_item_changed(item):
+            row, col = item.row(), item.column()
+            if col == 0:
+                callbacks['enabled'](row, item.checkState().value)
+            elif col == 2:
+                callbacks['max_current'](row, item.text())
+            elif col == 3:
+                callbacks['max_voltage'](row, item.text())
+            elif col == 4:
+                callbacks['name'](row, item.text())
+
+        table.itemChanged.connect(on_item_changed)
         table.resizeColumnsToContents()
         return table
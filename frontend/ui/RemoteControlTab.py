@@ -1,6 +1,9 @@
 import os
 import json
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 try:
     import pyvisa
     PYVISA_AVAILABLE = True
@@ -8,9 +11,73 @@ except (ImportError, ValueError) as e:
     pyvisa = None
     PYVISA_AVAILABLE = False
     print(f"PyVISA non disponibile: {e}")
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGroupBox, QLineEdit, QPushButton, QHBoxLayout, QCheckBox, QSlider
-from PyQt6.QtCore import QTimer, Qt
+# VISA status codes meaning the session itself is gone (timeouts and command
+# errors leave the session usable)
+_VISA_SESSION_LOST = frozenset()
+if PYVISA_AVAILABLE:
+    _VISA_SESSION_LOST = frozenset((
+        pyvisa.constants.StatusCode.error_connection_lost,
+        pyvisa.constants.StatusCode.error_invalid_object,
+    ))
+try:
+    import orjson
+except ImportError:  # orjson è opzionale: si ricade sul modulo json standard
+    orjson = None
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGroupBox, QLineEdit, QPushButton, QHBoxLayout, QCheckBox, QSlider, QScrollArea
+from PyQt6.QtCore import QTimer, Qt, QObject, QRunnable, QThreadPool, QSettings, pyqtSignal
 from frontend.core.errorhandler import ErrorHandler
+from frontend.core.tools import join_scpi_queries, split_scpi_response
+from frontend.core.SocketInstrument import SocketInstrument, parse_socket_address
+from frontend.core.VisaPool import VisaPool
+
+# Marks a key missing from _scpi_cache, which also memoizes None (unsupported action)
+_NOT_CACHED = object()
+
+
+def _load_inst_file(path):
+    """Read and decode a .inst file, using orjson when available."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# =========================
+# ScpiJob
+# =========================
+
+class _ScpiJobSignals(QObject):
+    """Signals of a ScpiJob; emitted from the worker thread, delivered on the GUI thread."""
+    done = pyqtSignal(object, object, object)  # (job, result, error)
+
+
+class ScpiJob(QRunnable):
+    """
+    Runs one blocking SCPI transaction on a QThreadPool worker.
+    VISA sessions are not re-entrant, so the transaction holds the lock of its
+    resource for its whole duration.
+    """
+    def __init__(self, lock, io, callback):
+        """
+        :param lock: threading.Lock guarding the instrument session.
+        :param io: Callable performing the I/O; its return value is the job result.
+        :param callback: Called on the GUI thread as callback(result, error).
+        """
+        super().__init__()
+        self.signals = _ScpiJobSignals()
+        self.callback = callback
+        self._lock = lock
+        self._io = io
+
+    def run(self):
+        try:
+            with self._lock:
+                result = self._io()
+        except Exception as e:
+            self.signals.done.emit(self, None, e)
+        else:
+            self.signals.done.emit(self, result, None)
 
 
 # =========================
@@ -26,7 +93,16 @@ class RemoteControlTab(QWidget):
     """
     _MANUAL_ICON = '\u2699'  # ⚙ gear icon for manual instruments
     _MAX_RETRY_ATTEMPTS = 5   # Stop auto-retrying after this many failed attempts
-    _RETRY_BASE_DELAY_MS = 5000  # Initial retry delay in ms; doubles each attempt (capped at 60 s)
+    _RETRY_BASE_DELAY_MS = 1000  # Initial retry delay in ms; doubles each attempt
+    _RETRY_MAX_DELAY_MS = 30000  # Cap of the retry delay
+    _CHANNEL_PLACEHOLDER_HEIGHT = 180  # Approximate height of a channel widget not built yet
+    _POWER_TYPES = ('power_supply', 'power_supplies', 'electronic_load', 'electronic_loads')
+    # Actions used by the channel controls, resolved once when the instrument connects
+    _SCPI_ACTIONS = ('set_voltage', 'set_current', 'read_voltage', 'read_current',
+                     'output_on', 'output_off', 'output_state_query')
+    _SCPI_SET_ACTIONS = ('set_voltage', 'set_current')
+    # (inst, connect button, future) of a background auto-connect; delivered on the GUI thread
+    _auto_connect_done = pyqtSignal(object, object, object)
     def __init__(self, load_instruments):
         """
         Initialize the RemoteControlTab.
@@ -108,25 +184,47 @@ class RemoteControlTab(QWidget):
         self.channels_container = QWidget()
         self.channels_layout = QHBoxLayout()  # Cambiato da QVBoxLayout a QHBoxLayout per supportare colonne
         self.channels_container.setLayout(self.channels_layout)
-        self.main_layout.addWidget(self.channels_container)
+        # I canali stanno in un'area scorrevole: i loro widget vengono costruiti solo quando entrano nel viewport
+        self.channels_scroll = QScrollArea()
+        self.channels_scroll.setWidgetResizable(True)
+        self.channels_scroll.setWidget(self.channels_container)
+        self.channels_scroll.verticalScrollBar().valueChanged.connect(self._build_visible_channels)
+        self.channels_scroll.horizontalScrollBar().valueChanged.connect(self._build_visible_channels)
+        self.main_layout.addWidget(self.channels_scroll, 1)
         
         # Crea le colonne per i canali
         self.left_column = QVBoxLayout()
         self.right_column = QVBoxLayout()
         self.channels_layout.addLayout(self.left_column)
         self.channels_layout.addLayout(self.right_column)
-        self.main_layout.addStretch()
         self.setLayout(self.main_layout)
         self.current_channel_widgets = []  # Stores references to current channel widgets
+        self._pending_channels = []  # (placeholder, layout, inst, ch) of channels not built yet
+        self._group_by_key = {}  # _group_key(inst) -> (instrument QGroupBox, inst, connect button)
+        self._auto_connect_done.connect(self._on_auto_connect_done)
         # Initialize VISA resource manager with lazy loading to avoid segmentation fault
         self.rm = None
         self._visa_init_attempted = False
-        self.visa_connections = {}  # Stores active VISA connections
+        self._visa_locks = {}  # VISA address -> threading.Lock serializing I/O on that session
+        # Active VISA sessions: opened lazily, LRU-capped, idle ones closed by the reap timer
+        # (sessions whose lock is held by a running job are left open)
+        self.visa_connections = VisaPool(max_size=32, idle_s=300, locks=self._visa_locks)
+        self._pool_reap_timer = QTimer(self)
+        self._pool_reap_timer.timeout.connect(self.visa_connections.reap_idle)
+        self._pool_reap_timer.start(60000)
         self.meas_labels = {}  # Stores measurement labels for dataloggers
         self.connection_timers = {}  # Stores connection retry timers
         self.connection_retry_counts = {}  # Tracks per-timer retry attempt count
+        self._scpi_cache = {}  # (type, series, model, action) -> resolved SCPI template or None
+        self._scpi_set_cache = {}  # (type, series, model, action) -> (prefix, suffix) around {value}
+        self._scpi_jobs = set()  # Jobs submitted and not yet completed (keeps them alive)
+        self._scpi_inflight = set()  # Keys of operations with a job still running
+        # Single auto-refresh timer, reused across .inst reloads
+        self.measurement_timer = QTimer(self)
+        self.measurement_timer.timeout.connect(self._on_measurement_tick)
         # Translator is provided later via update_translation() by the shared application state
         self.translator = None
+        self._last_lang = None  # Language applied by the last update_translation()
 
     def _reload_instruments_from_mainwindow(self):
         """Richiama la funzione di reload strumenti dal MainWindow se disponibile."""
@@ -223,8 +321,7 @@ class RemoteControlTab(QWidget):
             return []
         
         try:
-            with open(inst_path, 'r', encoding='utf-8') as f:
-                inst_data = json.load(f)
+            inst_data = _load_inst_file(inst_path)
             
             # Filtra solo gli oscilloscopi (gestisce sia 'oscilloscope' che 'oscilloscopes')
             oscilloscopes = []
@@ -264,25 +361,30 @@ class RemoteControlTab(QWidget):
             return
         
         # Connessione VISA
-        if not self._ensure_visa_initialized():
+        if not self._transport_available(visa_addr):
             print(f"[RemoteControlTab] VISA non inizializzato")
             return
         
         try:
             # Connetti all'oscilloscopio
-            if visa_addr in self.visa_connections:
-                instr = self.visa_connections[visa_addr]
-            else:
-                instr = self.rm.open_resource(visa_addr)
-                self.visa_connections[visa_addr] = instr
-            
-            print(f"[RemoteControlTab] Connesso a {osc_name} su {visa_addr}")
-            
-            # Applica le impostazioni dal file .was
-            self._apply_was_settings_to_oscilloscope(instr, scpi_commands, was_data)
-            
+            instr = self.visa_connections.get(visa_addr, self._open_resource)
         except Exception as e:
             print(f"[RemoteControlTab] Errore connessione a {osc_name}: {e}")
+            return
+        
+        print(f"[RemoteControlTab] Connesso a {osc_name} su {visa_addr}")
+        
+        def _done(_, error):
+            if error is not None:
+                print(f"[RemoteControlTab] Errore durante applicazione impostazioni a {osc_name}: {error}")
+        
+        # Applica le impostazioni dal file .was su un worker, serializzate dal lock
+        # dell'indirizzo con gli altri job sulla stessa sessione
+        self._submit_scpi(
+            osc_inst, instr,
+            lambda i: self._apply_was_settings_to_oscilloscope(i, scpi_commands, was_data),
+            _done
+        )
     
     def _get_oscilloscope_scpi_commands(self, model_id):
         """Recupera i comandi SCPI per il modello di oscilloscopio dalla libreria."""
@@ -313,100 +415,100 @@ class RemoteControlTab(QWidget):
             return {}
     
     def _apply_was_settings_to_oscilloscope(self, instr, scpi_commands, was_data):
-        """Applica le impostazioni specifiche del file .was all'oscilloscopio."""
-        try:
-            # Reset oscilloscopio
-            if 'reset' in scpi_commands:
-                reset_cmd = self._get_scpi_set_syntax(scpi_commands.get('reset'))
-                if reset_cmd:
-                    instr.write(reset_cmd)
-                print("[RemoteControlTab] Reset oscilloscopio")
+        """
+        Applica le impostazioni specifiche del file .was all'oscilloscopio.
+        Eseguito su un worker da _submit_scpi (con il lock dell'indirizzo): solo I/O
+        sulla sessione, nessun widget; gli errori sono riportati dal callback del job.
+        """
+        # Reset oscilloscopio
+        if 'reset' in scpi_commands:
+            reset_cmd = self._get_scpi_set_syntax(scpi_commands.get('reset'))
+            if reset_cmd:
+                instr.write(reset_cmd)
+            print("[RemoteControlTab] Reset oscilloscopio")
+        
+        # Applica impostazioni timebase
+        if 'timebase_scale' in was_data and 'set_timebase_scale' in scpi_commands:
+            timebase_value = was_data['timebase_scale']
+            syntax = self._get_scpi_set_syntax(scpi_commands.get('set_timebase_scale'))
+            if syntax:
+                cmd = syntax.format(value=timebase_value)
+                instr.write(cmd)
+                print(f"[RemoteControlTab] Timebase: {timebase_value}")
+        
+        # Applica impostazioni canali
+        channels = was_data.get('channels', {})
+        for ch_num, ch_settings in channels.items():
+            channel_number = ch_num.replace('CH', '').replace('CHAN', '')
             
-            # Applica impostazioni timebase
-            if 'timebase_scale' in was_data and 'set_timebase_scale' in scpi_commands:
-                timebase_value = was_data['timebase_scale']
-                syntax = self._get_scpi_set_syntax(scpi_commands.get('set_timebase_scale'))
+            # Scala canale
+            if 'scale' in ch_settings and 'set_channel_scale' in scpi_commands:
+                scale_value = ch_settings['scale']
+                syntax = self._get_scpi_set_syntax(scpi_commands.get('set_channel_scale'))
                 if syntax:
-                    cmd = syntax.format(value=timebase_value)
+                    cmd = syntax.format(channel_number=channel_number, value=scale_value)
                     instr.write(cmd)
-                    print(f"[RemoteControlTab] Timebase: {timebase_value}")
+                    print(f"[RemoteControlTab] Canale {channel_number} scala: {scale_value}")
             
-            # Applica impostazioni canali
-            channels = was_data.get('channels', {})
-            for ch_num, ch_settings in channels.items():
-                channel_number = ch_num.replace('CH', '').replace('CHAN', '')
-                
-                # Scala canale
-                if 'scale' in ch_settings and 'set_channel_scale' in scpi_commands:
-                    scale_value = ch_settings['scale']
-                    syntax = self._get_scpi_set_syntax(scpi_commands.get('set_channel_scale'))
-                    if syntax:
-                        cmd = syntax.format(channel_number=channel_number, value=scale_value)
-                        instr.write(cmd)
-                        print(f"[RemoteControlTab] Canale {channel_number} scala: {scale_value}")
-                
-                # Offset canale
-                if 'offset' in ch_settings and 'set_channel_offset' in scpi_commands:
-                    offset_value = ch_settings['offset']
-                    syntax = self._get_scpi_set_syntax(scpi_commands.get('set_channel_offset'))
-                    if syntax:
-                        cmd = syntax.format(channel_number=channel_number, value=offset_value)
-                        instr.write(cmd)
-                        print(f"[RemoteControlTab] Canale {channel_number} offset: {offset_value}")
-                
-                # Accoppiamento canale
-                if 'coupling' in ch_settings and 'set_channel_coupling' in scpi_commands:
-                    coupling_value = ch_settings['coupling']
-                    syntax = self._get_scpi_set_syntax(scpi_commands.get('set_channel_coupling'))
-                    if syntax:
-                        cmd = syntax.format(channel_number=channel_number, coupling_type=coupling_value)
-                        instr.write(cmd)
-                        print(f"[RemoteControlTab] Canale {channel_number} coupling: {coupling_value}")
+            # Offset canale
+            if 'offset' in ch_settings and 'set_channel_offset' in scpi_commands:
+                offset_value = ch_settings['offset']
+                syntax = self._get_scpi_set_syntax(scpi_commands.get('set_channel_offset'))
+                if syntax:
+                    cmd = syntax.format(channel_number=channel_number, value=offset_value)
+                    instr.write(cmd)
+                    print(f"[RemoteControlTab] Canale {channel_number} offset: {offset_value}")
             
-            # Applica impostazioni trigger
-            trigger = was_data.get('trigger', {})
-            if trigger:
-                # Sorgente trigger
-                if 'source' in trigger and 'set_trigger_source' in scpi_commands:
-                    source = trigger['source']
-                    # Estrai numero canale da stringhe come 'CH1', 'CHAN1'
-                    if source.upper().startswith(('CH', 'CHAN')):
-                        channel_number = source.replace('CH', '').replace('CHAN', '').replace('ch', '').replace('chan', '')
-                        syntax = self._get_scpi_set_syntax(scpi_commands.get('set_trigger_source'))
-                        if syntax:
-                            cmd = syntax.format(channel_number=channel_number)
-                            instr.write(cmd)
-                            print(f"[RemoteControlTab] Trigger source: {source}")
-                
-                # Livello trigger
-                if 'level' in trigger and 'set_trigger_level' in scpi_commands:
-                    level_value = trigger['level']
-                    syntax = self._get_scpi_set_syntax(scpi_commands.get('set_trigger_level'))
-                    if syntax:
-                        cmd = syntax.format(value=level_value)
-                        instr.write(cmd)
-                        print(f"[RemoteControlTab] Trigger level: {level_value}")
-                
-                # Modalità trigger
-                if 'mode' in trigger and 'set_trigger_mode' in scpi_commands:
-                    mode_value = trigger['mode']
-                    syntax = self._get_scpi_set_syntax(scpi_commands.get('set_trigger_mode'))
+            # Accoppiamento canale
+            if 'coupling' in ch_settings and 'set_channel_coupling' in scpi_commands:
+                coupling_value = ch_settings['coupling']
+                syntax = self._get_scpi_set_syntax(scpi_commands.get('set_channel_coupling'))
+                if syntax:
+                    cmd = syntax.format(channel_number=channel_number, coupling_type=coupling_value)
+                    instr.write(cmd)
+                    print(f"[RemoteControlTab] Canale {channel_number} coupling: {coupling_value}")
+        
+        # Applica impostazioni trigger
+        trigger = was_data.get('trigger', {})
+        if trigger:
+            # Sorgente trigger
+            if 'source' in trigger and 'set_trigger_source' in scpi_commands:
+                source = trigger['source']
+                # Estrai numero canale da stringhe come 'CH1', 'CHAN1'
+                if source.upper().startswith(('CH', 'CHAN')):
+                    channel_number = source.replace('CH', '').replace('CHAN', '').replace('ch', '').replace('chan', '')
+                    syntax = self._get_scpi_set_syntax(scpi_commands.get('set_trigger_source'))
                     if syntax:
-                        cmd = syntax.format(mode=mode_value)
+                        cmd = syntax.format(channel_number=channel_number)
                         instr.write(cmd)
-                        print(f"[RemoteControlTab] Trigger mode: {mode_value}")
-            
-            # Auto setup se disponibile
-            if 'auto_setup' in scpi_commands:
-                auto_setup_cmd = self._get_scpi_set_syntax(scpi_commands.get('auto_setup'))
-                if auto_setup_cmd:
-                    instr.write(auto_setup_cmd)
-                    print("[RemoteControlTab] Auto setup eseguito")
+                        print(f"[RemoteControlTab] Trigger source: {source}")
             
-            print(f"[RemoteControlTab] Configurazione completata con successo")
+            # Livello trigger
+            if 'level' in trigger and 'set_trigger_level' in scpi_commands:
+                level_value = trigger['level']
+                syntax = self._get_scpi_set_syntax(scpi_commands.get('set_trigger_level'))
+                if syntax:
+                    cmd = syntax.format(value=level_value)
+                    instr.write(cmd)
+                    print(f"[RemoteControlTab] Trigger level: {level_value}")
             
-        except Exception as e:
-            print(f"[RemoteControlTab] Errore durante applicazione impostazioni: {e}")
+            # Modalità trigger
+            if 'mode' in trigger and 'set_trigger_mode' in scpi_commands:
+                mode_value = trigger['mode']
+                syntax = self._get_scpi_set_syntax(scpi_commands.get('set_trigger_mode'))
+                if syntax:
+                    cmd = syntax.format(mode=mode_value)
+                    instr.write(cmd)
+                    print(f"[RemoteControlTab] Trigger mode: {mode_value}")
+        
+        # Auto setup se disponibile
+        if 'auto_setup' in scpi_commands:
+            auto_setup_cmd = self._get_scpi_set_syntax(scpi_commands.get('auto_setup'))
+            if auto_setup_cmd:
+                instr.write(auto_setup_cmd)
+                print("[RemoteControlTab] Auto setup eseguito")
+        
+        print(f"[RemoteControlTab] Configurazione completata con successo")
 
     def _get_scpi_set_syntax(self, command_def):
         """Restituisce la sintassi SCPI per i comandi di set, compatibile con vecchio formato."""
@@ -456,6 +558,94 @@ class RemoteControlTab(QWidget):
         print("Controllo strumenti disabilitato - problemi con PyVISA")
         return False
 
+    def _transport_available(self, visa_addr):
+        """
+        Verifica che esista un trasporto per l'indirizzo: gli indirizzi TCPIP
+        ``::<porta>::SOCKET`` usano un socket diretto e non richiedono PyVISA.
+        """
+        if parse_socket_address(visa_addr) is not None:
+            return True
+        return self._ensure_visa_initialized()
+
+    def _open_resource(self, visa_addr):
+        """
+        Apre una sessione verso lo strumento.
+        Gli indirizzi raw-socket (es. 'TCPIP0::192.168.1.10::5025::SOCKET') sono
+        gestiti da SocketInstrument su TCP diretto, evitando l'overhead RPC di
+        VXI-11; tutti gli altri passano dal resource manager PyVISA.
+        """
+        socket_target = parse_socket_address(visa_addr)
+        if socket_target is not None:
+            host, port = socket_target
+            return SocketInstrument(host, port, resource_name=visa_addr)
+        return self.rm.open_resource(visa_addr)
+
+    def _auto_connect_instruments(self):
+        """
+        Open the sessions of all disconnected remote instruments in parallel.
+        Each open runs on its own worker; results come back through _auto_connect_done.
+        """
+        targets = []
+        for _, inst, btn in self._group_by_key.values():
+            visa_addr = inst.get('visa_address')
+            if inst.get('is_manual', False) or not visa_addr or btn.isChecked():
+                continue
+            if visa_addr in self.visa_connections or not self._transport_available(visa_addr):
+                continue
+            targets.append((inst, btn, visa_addr))
+        if not targets:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(32, len(targets)))
+        for inst, btn, visa_addr in targets:
+            btn.setChecked(True)
+            btn.setStyleSheet('border: 2px solid orange;')
+            future = executor.submit(self._open_resource, visa_addr)
+            future.add_done_callback(lambda f, i=inst, b=btn: self._auto_connect_done.emit(i, b, f))
+        # Workers keep running the submitted opens; the executor just accepts no more work
+        executor.shutdown(wait=False)
+
+    def _on_auto_connect_done(self, inst, btn, future):
+        """GUI-thread completion of an auto-connect: store the session and restyle the button."""
+        visa_addr = inst.get('visa_address')
+        try:
+            instr = future.result()
+        except Exception as e:
+            self.error_handler.handle_visa_error(e, f"auto-connect to {visa_addr}", show_dialog=False)
+            try:
+                btn.setStyleSheet('border: 2px solid red;')
+                btn.setChecked(False)
+            except RuntimeError:
+                pass  # button destroyed by a reload
+            return
+        try:
+            wanted = btn.isChecked()
+        except RuntimeError:
+            wanted = False  # button destroyed by a reload
+        if not wanted:
+            # User cancelled (or the instrument went away) while the session was opening
+            try:
+                instr.close()
+            except Exception:
+                pass
+            return
+        self.visa_connections[visa_addr] = instr
+        self._preresolve_scpi(inst)
+        btn.setStyleSheet('border: 2px solid green;')
+        btn.setToolTip('')
+
+    def _schedule_connection_retry(self, inst, btn, timer_key, delay_ms):
+        """
+        (Re)arm the single-shot retry timer of a connect button.
+        The timer is created on the first failure and restarted for the following ones.
+        """
+        timer = self.connection_timers.get(timer_key)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self.safe_retry_connection(inst, btn, timer_key))
+            self.connection_timers[timer_key] = timer
+        timer.start(delay_ms)
+
     def safe_retry_connection(self, inst, btn, timer_key):
         """
         Background auto-retry for a failed VISA connection.
@@ -487,36 +677,29 @@ class RemoteControlTab(QWidget):
                 self.connection_retry_counts.pop(timer_key, None)
                 return
 
-            # Prova a connetterti di nuovo
-            if not self._ensure_visa_initialized():
-                btn.setStyleSheet('border: 2px solid orange;')
-                btn.setChecked(False)
-                btn.setToolTip("VISA non disponibile")
-                self.connection_retry_counts.pop(timer_key, None)
-                return
-                
             visa_addr = inst.get('visa_address', None)
             if not visa_addr:
                 btn.setStyleSheet('border: 2px solid red;')
                 btn.setChecked(False)
                 self.connection_retry_counts.pop(timer_key, None)
                 return
+
+            # Prova a connetterti di nuovo
+            if not self._transport_available(visa_addr):
+                btn.setStyleSheet('border: 2px solid orange;')
+                btn.setChecked(False)
+                btn.setToolTip("VISA non disponibile")
+                self.connection_retry_counts.pop(timer_key, None)
+                return
                 
             try:
-                existing_instr = self.visa_connections.get(visa_addr)
-                if existing_instr is not None:
-                    try:
-                        existing_instr.close()
-                    except Exception as close_error:
-                        self.error_handler.handle_visa_error(
-                            close_error,
-                            f"close existing connection to {visa_addr}",
-                            show_dialog=False
-                        )
-                    self.visa_connections.pop(visa_addr, None)
-                instr = self.rm.open_resource(visa_addr)
+                # Close any existing session (once its running job, if any, completes)
+                self.visa_connections.discard(visa_addr)
+                instr = self._open_resource(visa_addr)
                 self.visa_connections[visa_addr] = instr
+                self._preresolve_scpi(inst)
                 btn.setStyleSheet('border: 2px solid green;')
+                btn.setToolTip('')
                 btn.setChecked(True)
                 # Connection succeeded – cancel timer and reset retry counter.
                 if timer_key in self.connection_timers:
@@ -537,6 +720,7 @@ class RemoteControlTab(QWidget):
                     # failed state so the user can decide when to reconnect.
                     btn.setStyleSheet('border: 2px solid red;')
                     btn.setChecked(False)
+                    btn.setToolTip(f"Connessione non riuscita dopo {attempt} tentativi: clicca per riprovare")
                     if timer_key in self.connection_timers:
                         try:
                             self.connection_timers[timer_key].stop()
@@ -552,22 +736,10 @@ class RemoteControlTab(QWidget):
                 btn.setStyleSheet('border: 2px solid orange;')
                 btn.setChecked(True)
 
-                # Exponential back-off: 5 s, 10 s, 20 s, 40 s, 60 s (capped).
-                delay_ms = min(self._RETRY_BASE_DELAY_MS * (2 ** (attempt - 1)), 60000)
-
-                # Create a fresh single-shot timer for the next retry attempt.
-                # (The previous timer already fired and cannot be restarted.)
-                if timer_key in self.connection_timers:
-                    try:
-                        self.connection_timers[timer_key].stop()
-                        self.connection_timers[timer_key].deleteLater()
-                    except Exception:
-                        pass
-                new_timer = QTimer(self)
-                new_timer.setSingleShot(True)
-                new_timer.timeout.connect(lambda: self.safe_retry_connection(inst, btn, timer_key))
-                self.connection_timers[timer_key] = new_timer
-                new_timer.start(delay_ms)
+                # Exponential back-off: 2 s, 4 s, 8 s, ... capped at _RETRY_MAX_DELAY_MS.
+                delay_ms = min(self._RETRY_BASE_DELAY_MS * (2 ** attempt), self._RETRY_MAX_DELAY_MS)
+                btn.setToolTip(f"Tentativo {attempt}/{self._MAX_RETRY_ATTEMPTS} fallito, nuovo tentativo tra {delay_ms // 1000} s")
+                self._schedule_connection_retry(inst, btn, timer_key, delay_ms)
                     
         except Exception as e:
             # Gestisci qualsiasi errore inaspettato, inclusi crash UI
@@ -800,11 +972,140 @@ class RemoteControlTab(QWidget):
         """
         Get the SCPI command for the given instrument/channel/action from the library.
         action: 'set_voltage', 'set_current', 'read_voltage', 'read_current', 'read_measurement'
+        Resolved templates, including None for unsupported actions, are memoized per
+        (type, series, model, action) until the next load.
         """
         type_name = inst.get('instrument_type', '')
         series_id = inst.get('series', '')
         model_id = inst.get('model_id', inst.get('model', ''))
-        
+        key = (type_name, series_id, model_id, action)
+        cmd = self._scpi_cache.get(key, _NOT_CACHED)
+        if cmd is _NOT_CACHED:
+            cmd = self._resolve_scpi_cmd(type_name, series_id, model_id, action)
+            self._scpi_cache[key] = cmd
+        return cmd
+
+    def _preresolve_scpi(self, inst):
+        """
+        Resolve all channel-control templates of inst right after it connects, so the
+        first Set/Read/Output click only hits the memo caches.
+        """
+        for action in self._SCPI_ACTIONS:
+            self.get_scpi_cmd(inst, None, action)
+        for action in self._SCPI_SET_ACTIONS:
+            self.get_scpi_set_parts(inst, None, action)
+
+    @staticmethod
+    def _is_session_error(error):
+        """
+        True if error means the session itself is lost (connection dropped or
+        session invalidated), not a timeout or a bad command/reply.
+        """
+        if isinstance(error, TimeoutError):
+            return False  # socket timeout: slow or unsupported query
+        if isinstance(error, OSError):
+            return True
+        if not PYVISA_AVAILABLE:
+            return False
+        if isinstance(error, pyvisa.errors.InvalidSession):
+            return True
+        return isinstance(error, pyvisa.errors.VisaIOError) and error.error_code in _VISA_SESSION_LOST
+
+    def _submit_scpi(self, inst, instr, io, callback, inflight_key=None):
+        """
+        Run a SCPI transaction off the GUI thread.
+        If the session is lost (see _is_session_error) the worker, still holding the
+        address lock, closes it, opens a new one and retries the transaction once;
+        the new session then replaces the lost one in the pool on the GUI thread.
+        :param inst: Instrument instance data (selects the per-session lock).
+        :param instr: Open session, passed to io.
+        :param io: Callable io(instr) doing the blocking I/O.
+        :param callback: Called on the GUI thread as callback(result, error).
+        :param inflight_key: If given, the job is skipped while a previous job
+                             with the same key is still running.
+        :return: True if the job was queued.
+        """
+        if inflight_key is not None:
+            if inflight_key in self._scpi_inflight:
+                return False
+            self._scpi_inflight.add(inflight_key)
+        visa_addr = inst.get('visa_address')
+
+        def _run():
+            # Worker thread, address lock held: returns (result, error, reopened session)
+            try:
+                return io(instr), None, None
+            except Exception as e:
+                if not visa_addr or not self._is_session_error(e):
+                    return None, e, None
+                print(f"[RemoteControlTab] Sessione {visa_addr} persa ({e}), riapertura")
+            try:
+                instr.close()
+            except Exception:
+                pass
+            try:
+                new_instr = self._open_resource(visa_addr)
+            except Exception as e:
+                return None, e, None
+            try:
+                return io(new_instr), None, new_instr
+            except Exception as e:
+                return None, e, new_instr
+
+        def _finish(outcome, job_error):
+            result, error, new_instr = outcome if job_error is None else (None, job_error, None)
+            if new_instr is not None:
+                if visa_addr in self.visa_connections and self.visa_connections.get(visa_addr) is instr:
+                    self.visa_connections[visa_addr] = new_instr
+                else:
+                    # Disconnected, or already reopened by another job, meanwhile
+                    try:
+                        new_instr.close()
+                    except Exception:
+                        pass
+            if inflight_key is not None:
+                self._scpi_inflight.discard(inflight_key)
+            callback(result, error)
+
+        addr = visa_addr or inst.get('instance_name', '')
+        lock = self._visa_locks.setdefault(addr, threading.Lock())
+        job = ScpiJob(lock, _run, _finish)
+        job.setAutoDelete(False)
+        job.signals.done.connect(self._on_scpi_job_done)
+        self._scpi_jobs.add(job)
+        QThreadPool.globalInstance().start(job)
+        return True
+
+    def _on_scpi_job_done(self, job, result, error):
+        """GUI-thread completion of a ScpiJob: release it and run its callback."""
+        self._scpi_jobs.discard(job)
+        # The job has released its address lock: close sessions discarded while it ran
+        self.visa_connections.close_stale()
+        try:
+            job.callback(result, error)
+        except RuntimeError:
+            pass  # target widget was destroyed while the job was running
+
+    def get_scpi_set_parts(self, inst, ch, action):
+        """
+        Get a set-command template pre-split around its '{value}' placeholder.
+        The split is done once per (type, series, model, action); callers build the
+        command as prefix + value + suffix.
+        :return: (prefix, suffix) tuple, or None if the template has no '{value}'.
+        """
+        key = (inst.get('instrument_type', ''), inst.get('series', ''),
+               inst.get('model_id', inst.get('model', '')), action)
+        if key not in self._scpi_set_cache:
+            template = self._get_scpi_set_syntax(self.get_scpi_cmd(inst, ch, action))
+            parts = None
+            if template and template.count('{value}') == 1:
+                prefix, suffix = template.split('{value}')
+                parts = (prefix, suffix)
+            self._scpi_set_cache[key] = parts
+        return self._scpi_set_cache[key]
+
+    def _resolve_scpi_cmd(self, type_name, series_id, model_id, action):
+        """Resolve the SCPI template for an action from the library, with standard fallbacks."""
         # Check if instruments_manager is available
         if self.instruments_manager is None:
             scpi_dict = None
@@ -843,7 +1144,10 @@ class RemoteControlTab(QWidget):
             'read_measurement': ['read_measurement', 'MEAS?'],
             'output_on': ['output_on', 'OUTP ON'],
             'output_off': ['output_off', 'OUTP OFF'],
-            'output_state_query': ['output_state_query', 'OUTP?']
+            'output_state_query': ['output_state_query', 'OUTP?'],
+            # Opzionali: lettura a blocco binario (IEEE 488.2) e tipo dei valori ('f', 'd', 'h')
+            'read_measurement_binary': ['read_measurement_binary'],
+            'binary_datatype': ['binary_datatype'],
         }
         for key in action_map.get(action, []):
             if key in scpi_dict:
@@ -857,20 +1161,29 @@ class RemoteControlTab(QWidget):
         :param translator: Translator instance for language translation.
         """
         self.translator = translator
+        # Nothing to retranslate if the language did not change since the last call
+        lang = getattr(translator, 'current_lang', None)
+        if lang is not None and lang == self._last_lang:
+            return
+        self._last_lang = lang
         self.label.setText(translator.t('remote_control'))
         self.meas_group.setTitle(translator.t('measurements') if hasattr(translator, 't') else 'Measurements (Datalogger/Multimeter only)')
-        # Optionally update channel group titles
-        for group in self.current_channel_widgets:
-            inst = group.property('instrument')
-            ch = group.property('channel')
-            if inst and ch:
-                group.setTitle(self._format_channel_title(inst, ch))
-            banner_label = group.property('manual_mode_banner_label')
-            if banner_label is not None:
-                try:
-                    banner_label.setText(f"{self._MANUAL_ICON} {self._t('manual_instrument_label')}")
-                except RuntimeError:
-                    pass  # widget was destroyed
+        # Optionally update channel group titles, repainted once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            for group in self.current_channel_widgets:
+                inst = group.property('instrument')
+                ch = group.property('channel')
+                if inst and ch:
+                    group.setTitle(self._format_channel_title(inst, ch))
+                banner_label = group.property('manual_mode_banner_label')
+                if banner_label is not None:
+                    try:
+                        banner_label.setText(f"{self._MANUAL_ICON} {self._t('manual_instrument_label')}")
+                    except RuntimeError:
+                        pass  # widget was destroyed
+        finally:
+            self.setUpdatesEnabled(True)
 
     def load_instruments(self, inst_file_path):
         """
@@ -883,6 +1196,26 @@ class RemoteControlTab(QWidget):
             self.logger.info(msg)
             
         try:
+            # Stop auto-refresh first so no tick fires into labels being destroyed
+            self.measurement_timer.stop()
+
+            inst_data = {}
+            if inst_file_path and os.path.isfile(inst_file_path):
+                inst_data = _load_inst_file(inst_file_path)
+            instruments = inst_data.get('instruments', [])
+
+            # Gruppi strumento e label di misura invariati vengono riusati invece di essere ricostruiti
+            new_group_keys = {self._group_key(inst) for inst in instruments
+                              if inst.get('instrument_type', '') in self._POWER_TYPES
+                              and any(ch.get('enabled', False) for ch in inst.get('channels', []))}
+            reused_groups = {}
+            for key, entry in self._group_by_key.items():
+                if key in new_group_keys:
+                    reused_groups[key] = entry
+                else:
+                    self._discard_instrument_group(*entry)
+            self._group_by_key = {}
+
             # Clear previous controls - pulisci colonne
             for i in reversed(range(self.left_column.count())):
                 item = self.left_column.itemAt(i)
@@ -907,8 +1240,34 @@ class RemoteControlTab(QWidget):
                         if widget:
                             widget.setParent(None)
             
-            self.current_channel_widgets.clear()
-            
+            # Tieni solo i canali (costruiti o in attesa) dei gruppi riusati
+            kept = [group for group, _, _ in reused_groups.values()]
+            self.current_channel_widgets = [w for w in self.current_channel_widgets
+                                            if any(g.isAncestorOf(w) for g in kept)]
+            self._pending_channels = [e for e in self._pending_channels
+                                      if any(g.isAncestorOf(e[0]) for g in kept)]
+
+            # --- First, collect all datalogger/multimeter channels for measurement area ---
+            # Note: Oscilloscopes are excluded as they cannot perform continuous automatic measurements
+            self.meas_vars = []  # [(inst, ch)]
+            for inst in instruments:
+                inst_type = inst.get('instrument_type', '')
+                # Gestisce varianti di naming: datalogger/dataloggers, multimeter/multimeters
+                if inst_type in ['datalogger', 'dataloggers', 'multimeter', 'multimeters']:
+                    for ch in inst.get('channels', []):
+                        is_enabled = ch.get('enabled', True)  # Solo canali abilitati
+                        if is_enabled:
+                            self.meas_vars.append((inst, ch))
+                            print(f"    → Canale misura aggiunto: {inst.get('instance_name', 'N/A')} - {ch.get('name', 'N/A')}")
+
+            # Stacca le label di misura ancora in uso prima di distruggere la griglia che le contiene
+            old_meas_labels = self.meas_labels
+            new_meas_keys = {(inst.get('instance_name', ''), ch.get('measured_variable', ch.get('name', 'Unknown')))
+                             for inst, ch in self.meas_vars}
+            for key, label in old_meas_labels.items():
+                if key in new_meas_keys:
+                    label.setParent(None)
+
             # Clear measurement area
             for i in reversed(range(self.meas_layout.count())):
                 item = self.meas_layout.itemAt(i)
@@ -917,56 +1276,27 @@ class RemoteControlTab(QWidget):
                     if widget:
                         widget.setParent(None)
             
-            # Stop measurement timer if exists
-            if hasattr(self, 'measurement_timer'):
-                self.measurement_timer.stop()
+            self._scpi_cache.clear()
+            self._scpi_set_cache.clear()
                 
-            # Clear connection timers to prevent crashes
-            for timer_key, timer in self.connection_timers.items():
-                try:
-                    timer.stop()
-                    timer.deleteLater()
-                except:
-                    pass
-            self.connection_timers.clear()
-            self.connection_retry_counts.clear()
-                
-            self.meas_labels.clear()
-            # Close previous VISA connections
-            for inst in self.visa_connections.values():
-                try:
-                    inst.close()
-                except Exception:
-                    pass
-            self.visa_connections = {}
-            if not inst_file_path or not os.path.isfile(inst_file_path):
+            self.meas_labels = {}
+            # Close VISA connections of instruments no longer in the file
+            keep_addrs = {inst.get('visa_address') for inst in instruments}
+            for addr in list(self.visa_connections):
+                if addr not in keep_addrs:
+                    self.visa_connections.discard(addr)
+            if not instruments:
                 return
             
-            with open(inst_file_path, 'r', encoding='utf-8') as f:
-                inst_data = json.load(f)
-            
             # DEBUG: Stampa tutti gli strumenti caricati
             print(f"\n=== DEBUG: Strumenti caricati da {inst_file_path} ===")
-            for idx, inst in enumerate(inst_data.get('instruments', [])):
+            for idx, inst in enumerate(instruments):
                 print(f"  [{idx}] {inst.get('instance_name', 'N/A')} - Tipo: {inst.get('instrument_type', 'N/A')}")
                 print(f"       Canali: {len(inst.get('channels', []))}")
                 for ch_idx, ch in enumerate(inst.get('channels', [])):
                     print(f"         [{ch_idx}] {ch.get('name', 'N/A')} - Enabled: {ch.get('enabled', False)}")
             print("=" * 50 + "\n")
             
-            # --- First, collect all datalogger/multimeter channels for measurement area ---
-            # Note: Oscilloscopes are excluded as they cannot perform continuous automatic measurements
-            self.meas_vars = []  # [(inst, ch)]
-            for inst in inst_data.get('instruments', []):
-                inst_type = inst.get('instrument_type', '')
-                # Gestisce varianti di naming: datalogger/dataloggers, multimeter/multimeters
-                if inst_type in ['datalogger', 'dataloggers', 'multimeter', 'multimeters']:
-                    for ch in inst.get('channels', []):
-                        is_enabled = ch.get('enabled', True)  # Solo canali abilitati
-                        if is_enabled:
-                            self.meas_vars.append((inst, ch))
-                            print(f"    → Canale misura aggiunto: {inst.get('instance_name', 'N/A')} - {ch.get('name', 'N/A')}")
-            
             if self.meas_vars:
                 # Crea un layout a griglia per le misure
                 from PyQt6.QtWidgets import QGridLayout
@@ -979,30 +1309,13 @@ class RemoteControlTab(QWidget):
                 for inst, ch in self.meas_vars:
                     # meas_vars only contains datalogger/multimeter channels
                     var_name = ch.get('measured_variable', ch.get('name', 'Unknown'))
-                    inst_type = inst.get('instrument_type', '')
-                    if inst_type in ['multimeter', 'multimeters', 'datalogger', 'dataloggers']:
-                        unit = ch.get('unit', 'V')  # Campo 'unit' nel file .inst
-                    else:
-                        unit = ch.get('unit_of_measure', 'V')  # Default per altri strumenti
-                    
-                    # Crea etichetta con formato: Nome_variabile = --- unità
-                    label = QLabel(f"{var_name} = --- {unit}")
-                    label.setProperty("class", "measurement")
-                    label.setStyleSheet("""
-                        QLabel {
-                            border: 2px solid #45475a;
-                            padding: 8px;
-                            margin: 2px;
-                            border-radius: 6px;
-                            font-family: 'Courier New', monospace;
-                            font-size: 12px;
-                            min-width: 150px;
-                            font-weight: 600;
-                        }
-                    """)
+                    label_key = (inst.get('instance_name',''), var_name)
+                    label = old_meas_labels.get(label_key)
+                    if label is None:
+                        label = self._create_measurement_label(inst, ch, var_name)
                     
                     meas_grid.addWidget(label, row, col)
-                    self.meas_labels[(inst.get('instance_name',''), var_name)] = label
+                    self.meas_labels[label_key] = label
                     
                     col += 1
                     if col >= max_cols:
@@ -1046,19 +1359,17 @@ class RemoteControlTab(QWidget):
                 control_widget.setLayout(control_layout)
                 self.meas_layout.addWidget(control_widget)
                 
-                # Setup timer per aggiornamento automatico
-                self.measurement_timer = QTimer()
-                self.measurement_timer.timeout.connect(self.refresh_measurements_auto)
+                # Avvia l'aggiornamento automatico
                 if self.auto_refresh_cb.isChecked():
-                    self.measurement_timer.start(2000)  # Start con 2 secondi
+                    self.measurement_timer.start(self.interval_slider.value() * 1000)
                     
             # --- Analizza la struttura degli strumenti per ottimizzare il layout ---
             power_instruments = []
             total_enabled_channels = 0
             
-            for inst in inst_data.get('instruments', []):
+            for inst in instruments:
                 inst_type = inst.get('instrument_type', '')
-                if inst_type in ['power_supply', 'power_supplies', 'electronic_load', 'electronic_loads']:
+                if inst_type in self._POWER_TYPES:
                     enabled_channels = [ch for ch in inst.get('channels', []) if ch.get('enabled', False)]
                     if enabled_channels:
                         power_instruments.append({
@@ -1118,6 +1429,17 @@ class RemoteControlTab(QWidget):
                 
                 print(f"Elaborazione strumento: {inst.get('instance_name', 'N/A')} - {channel_count} canali")
                 
+                group_key = self._group_key(inst)
+                reused = reused_groups.pop(group_key, None)
+                if reused is not None:
+                    # Strumento invariato: riposiziona il gruppo esistente senza ricostruirlo
+                    best_column_idx = column_loads.index(min(column_loads))
+                    columns[best_column_idx].addWidget(reused[0])
+                    column_loads[best_column_idx] += channel_count
+                    self._group_by_key[group_key] = reused
+                    print(f"  ✓ Strumento invariato riusato nella colonna {best_column_idx + 1}")
+                    continue
+                
                 # --- Pulsante di connessione per strumento ---
                 conn_btn = QPushButton(f"Connect {inst.get('instance_name','')}")
                 conn_btn.setCheckable(True)
@@ -1138,25 +1460,18 @@ class RemoteControlTab(QWidget):
                     # Compute timer_key once so it is available in both success and failure paths
                     timer_key = f"{inst.get('instance_name', 'unknown')}_{id(btn)}"
                     try:
-                        if not self._ensure_visa_initialized():
+                        if not self._transport_available(visa_addr):
                             btn.setStyleSheet('border: 2px solid red;')
                             btn.setChecked(False)
                             return
                         # Close any existing connection for this address before opening a new one
-                        previous_instr = self.visa_connections.get(visa_addr)
-                        if previous_instr is not None:
-                            try:
-                                previous_instr.close()
-                            except Exception as close_error:
-                                self.error_handler.handle_visa_error(
-                                    close_error,
-                                    f"close existing connection to {visa_addr}",
-                                    show_dialog=False
-                                )
-                            self.visa_connections.pop(visa_addr, None)
-                        instr = self.rm.open_resource(visa_addr)
+                        # (the pool defers the close while a job is using the session)
+                        self.visa_connections.discard(visa_addr)
+                        instr = self._open_resource(visa_addr)
                         self.visa_connections[visa_addr] = instr
+                        self._preresolve_scpi(inst)
                         btn.setStyleSheet('border: 2px solid green;')
+                        btn.setToolTip('')
                         btn.setChecked(True)
                         # Cancel any pending retry timer for this instrument on successful connect
                         if timer_key in self.connection_timers:
@@ -1250,15 +1565,8 @@ class RemoteControlTab(QWidget):
                         btn.setChecked(True)
                         # Reset the retry counter for this instrument so the backoff starts fresh.
                         self.connection_retry_counts.pop(timer_key, None)
-                        if timer_key in self.connection_timers:
-                            self.connection_timers[timer_key].stop()
-                            self.connection_timers[timer_key].deleteLater()
-
-                        timer = QTimer(self)
-                        timer.setSingleShot(True)
-                        timer.timeout.connect(lambda: self.safe_retry_connection(inst, btn, timer_key))
-                        self.connection_timers[timer_key] = timer
-                        timer.start(self._RETRY_BASE_DELAY_MS)
+                        btn.setToolTip('')
+                        self._schedule_connection_retry(inst, btn, timer_key, self._RETRY_BASE_DELAY_MS)
 
                 def handle_connect_clicked(checked, i=inst, b=conn_btn):
                     """
@@ -1278,23 +1586,16 @@ class RemoteControlTab(QWidget):
                             timer.deleteLater()
                         # Clear retry history so re-connecting starts with a fresh counter
                         self.connection_retry_counts.pop(t_key, None)
-                        # Close the VISA connection if one is open
+                        # Close the VISA connection if one is open; a job still using it
+                        # finishes its transaction first (the pool defers the close)
                         v_addr = (
                             i.get('visa_address')
                             or i.get('resource_name')
                             or i.get('resource')
                             or i.get('address')
                         )
-                        if v_addr and v_addr in self.visa_connections:
-                            try:
-                                self.visa_connections[v_addr].close()
-                            except Exception as close_err:
-                                self.error_handler.handle_visa_error(
-                                    close_err,
-                                    f"close connection to {v_addr} on user disconnect",
-                                    show_dialog=False
-                                )
-                            self.visa_connections.pop(v_addr, None)
+                        if v_addr:
+                            self.visa_connections.discard(v_addr)
                         b.setStyleSheet('')
                         return
                     # checked=True → attempt connection
@@ -1317,12 +1618,8 @@ class RemoteControlTab(QWidget):
                     
                     # Distribuisci i canali nelle sotto-colonne
                     for ch_idx, ch in enumerate(enabled_channels):
-                        channel_widget = self._create_channel_widget(inst, ch)
-                        if ch_idx % 2 == 0:
-                            left_sub_column.addWidget(channel_widget)
-                        else:
-                            right_sub_column.addWidget(channel_widget)
-                        self.current_channel_widgets.append(channel_widget)
+                        sub_column = left_sub_column if ch_idx % 2 == 0 else right_sub_column
+                        self._add_channel_placeholder(sub_column, inst, ch)
                     
                     # Aggiungi stretch per allineare in alto
                     left_sub_column.addStretch()
@@ -1344,6 +1641,7 @@ class RemoteControlTab(QWidget):
                     best_column_idx = column_loads.index(min(column_loads))
                     columns[best_column_idx].addWidget(inst_main_group)
                     column_loads[best_column_idx] += channel_count
+                    self._group_by_key[group_key] = (inst_main_group, inst, conn_btn)
                     
                     print(f"  ✓ Strumento con sotto-colonne aggiunto alla colonna {best_column_idx + 1}")
                     
@@ -1355,9 +1653,7 @@ class RemoteControlTab(QWidget):
                     
                     # Aggiungi tutti i canali abilitati
                     for ch in enabled_channels:
-                        channel_widget = self._create_channel_widget(inst, ch)
-                        inst_vbox.addWidget(channel_widget)
-                        self.current_channel_widgets.append(channel_widget)
+                        self._add_channel_placeholder(inst_vbox, inst, ch)
                     
                     inst_group.setLayout(inst_vbox)
                     
@@ -1365,18 +1661,24 @@ class RemoteControlTab(QWidget):
                     best_column_idx = column_loads.index(min(column_loads))
                     columns[best_column_idx].addWidget(inst_group)
                     column_loads[best_column_idx] += channel_count
+                    self._group_by_key[group_key] = (inst_group, inst, conn_btn)
                     
                     print(f"  ✓ Strumento aggiunto alla colonna {best_column_idx + 1} (carico: {column_loads[best_column_idx]})")
             
             print(f"\n=== Distribuzione finale ===")
             for i, load in enumerate(column_loads):
                 print(f"Colonna {i+1}: {load} canali")
-            print(f"Totale widget canali creati: {len(self.current_channel_widgets)}")
+            print(f"Totale canali da costruire: {len(self._pending_channels)}")
             print("=" * 50 + "\n")
             
             # Aggiungi stretch alle colonne per allineamento in alto
             for column in columns:
                 column.addStretch()
+            # I widget dei canali visibili si costruiscono dopo che il layout è stato applicato
+            QTimer.singleShot(0, self._build_visible_channels)
+
+            if QSettings('LabAutomation', 'App').value('auto_connect_instruments', False, type=bool):
+                self._auto_connect_instruments()
             
         except Exception as e:
             error_msg = f"ERRORE in load_instruments: {str(e)}\nTraceback: {traceback.format_exc()}"
@@ -1385,6 +1687,50 @@ class RemoteControlTab(QWidget):
                 self.logger.error(error_msg)
             # Error already logged - no popup needed
     
+    @staticmethod
+    def _group_key(inst):
+        """
+        Identity of an instrument group across reloads. The whole instrument data is
+        part of the key because the group's callbacks are bound to it.
+        """
+        return json.dumps(inst, sort_keys=True, default=str)
+
+    def _discard_instrument_group(self, group, inst, conn_btn):
+        """Destroy an instrument group no longer in the .inst file and cancel its pending retry."""
+        t_key = f"{inst.get('instance_name', 'unknown')}_{id(conn_btn)}"
+        timer = self.connection_timers.pop(t_key, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+        self.connection_retry_counts.pop(t_key, None)
+        group.setParent(None)
+        group.deleteLater()
+
+    def _create_measurement_label(self, inst, ch, var_name):
+        """Create the label showing one datalogger/multimeter measurement."""
+        inst_type = inst.get('instrument_type', '')
+        if inst_type in ['multimeter', 'multimeters', 'datalogger', 'dataloggers']:
+            unit = ch.get('unit', 'V')  # Campo 'unit' nel file .inst
+        else:
+            unit = ch.get('unit_of_measure', 'V')  # Default per altri strumenti
+        
+        # Crea etichetta con formato: Nome_variabile = --- unità
+        label = QLabel(f"{var_name} = --- {unit}")
+        label.setProperty("class", "measurement")
+        label.setStyleSheet("""
+            QLabel {
+                border: 2px solid #45475a;
+                padding: 8px;
+                margin: 2px;
+                border-radius: 6px;
+                font-family: 'Courier New', monospace;
+                font-size: 12px;
+                min-width: 150px;
+                font-weight: 600;
+            }
+        """)
+        return label
+
     def _format_channel_title(self, inst, ch):
         """Build the channel group box title, including the manual-instrument badge when applicable."""
         title = f"{inst.get('instance_name', '')} - {ch.get('name', '')}"
@@ -1422,6 +1768,49 @@ class RemoteControlTab(QWidget):
         )
         return reply == QMessageBox.StandardButton.Ok
 
+    def _add_channel_placeholder(self, layout, inst, ch):
+        """
+        Reserve the slot of a channel in layout; the real widget is built by
+        _build_visible_channels once the slot scrolls into view.
+        """
+        placeholder = QWidget()
+        placeholder.setMinimumHeight(self._CHANNEL_PLACEHOLDER_HEIGHT)
+        layout.addWidget(placeholder)
+        self._pending_channels.append((placeholder, layout, inst, ch))
+
+    def _build_visible_channels(self, *_):
+        """Replace the placeholders currently inside the scroll viewport with channel widgets."""
+        if not self._pending_channels:
+            return
+        still_pending = []
+        built = False
+        for entry in self._pending_channels:
+            placeholder, layout, inst, ch = entry
+            try:
+                visible = not placeholder.visibleRegion().isEmpty()
+            except RuntimeError:
+                continue  # placeholder destroyed together with its instrument group
+            if not visible:
+                still_pending.append(entry)
+                continue
+            channel_widget = self._create_channel_widget(inst, ch)
+            layout.replaceWidget(placeholder, channel_widget)
+            placeholder.deleteLater()
+            self.current_channel_widgets.append(channel_widget)
+            built = True
+        self._pending_channels = still_pending
+        if built and still_pending:
+            # Built widgets may be shorter than their placeholder and uncover more slots
+            QTimer.singleShot(0, self._build_visible_channels)
+
+    def showEvent(self, a0):
+        super().showEvent(a0)
+        QTimer.singleShot(0, self._build_visible_channels)
+
+    def resizeEvent(self, a0):
+        super().resizeEvent(a0)
+        self._build_visible_channels()
+
     def _create_channel_widget(self, inst, ch):
         """
         Crea un widget per un singolo canale di strumento.
@@ -1460,7 +1849,7 @@ class RemoteControlTab(QWidget):
         v_validator = QDoubleValidator(0.0, max_voltage, 3)
         v_edit.setValidator(v_validator)
         set_v_btn = QPushButton('Set')
-        set_v_btn.clicked.connect(lambda _, i=inst, c=ch, e=v_edit: self.set_voltage(i, c, e))
+        set_v_btn.clicked.connect(lambda _, i=inst, c=ch, e=v_edit, b=set_v_btn: self.set_voltage(i, c, e, b))
         hbox_v.addWidget(v_edit)
         hbox_v.addWidget(set_v_btn)
         vbox.addLayout(hbox_v)
@@ -1477,7 +1866,7 @@ class RemoteControlTab(QWidget):
         c_validator = QDoubleValidator(0.0, max_current, 3)
         c_edit.setValidator(c_validator)
         set_c_btn = QPushButton('Set')
-        set_c_btn.clicked.connect(lambda _, i=inst, c=ch, e=c_edit: self.set_current(i, c, e))
+        set_c_btn.clicked.connect(lambda _, i=inst, c=ch, e=c_edit, b=set_c_btn: self.set_current(i, c, e, b))
         hbox_c.addWidget(c_edit)
         hbox_c.addWidget(set_c_btn)
         vbox.addLayout(hbox_c)
@@ -1534,25 +1923,24 @@ class RemoteControlTab(QWidget):
             print(f"[DEBUG] Strumento manuale - nessuna connessione VISA necessaria")
             return None
         
-        if not self._ensure_visa_initialized():
-            print("[DEBUG] VISA non inizializzato!")
-            return None
-            
         visa_addr = inst.get('visa_address', None)
         print(f"[DEBUG] VISA address: {visa_addr}")
         
         if not visa_addr:
             print("[DEBUG] VISA address mancante!")
             return None
+
+        if not self._transport_available(visa_addr):
+            print("[DEBUG] VISA non inizializzato!")
+            return None
             
         if visa_addr in self.visa_connections:
             print(f"[DEBUG] Connessione esistente trovata per {visa_addr}")
-            return self.visa_connections[visa_addr]
+            return self.visa_connections.get(visa_addr)
             
         print(f"[DEBUG] Tentativo apertura nuova connessione a {visa_addr}")
         try:
-            instr = self.rm.open_resource(visa_addr)
-            self.visa_connections[visa_addr] = instr
+            instr = self.visa_connections.get(visa_addr, self._open_resource)
             print(f"[DEBUG] Connessione aperta con successo: {instr}")
             return instr
         except Exception as e:
@@ -1562,12 +1950,15 @@ class RemoteControlTab(QWidget):
                 self.logger.error(error_msg, error_code="VISA-002")
             return None
 
-    def set_voltage(self, inst, ch, edit):
+    def set_voltage(self, inst, ch, edit, button=None):
         """
         Set the voltage for the given instrument and channel using the SCPI command.
+        Only one write per instrument/channel is queued at a time; button, if
+        given, stays disabled until that write completes.
         :param inst: Instrument instance data.
         :param ch: Channel data.
         :param edit: QLineEdit widget containing the voltage value.
+        :param button: Set button that triggered the write.
         """
         print(f"[DEBUG] set_voltage chiamato per {inst.get('instance_name', 'N/A')}")
         
@@ -1616,23 +2007,42 @@ class RemoteControlTab(QWidget):
         
         print(f"[DEBUG] Strumento VISA ottenuto: {instr}")
         
-        try:
-            cmd = self.get_scpi_cmd(inst, ch, 'set_voltage').replace('{value}', value_str)
-            print(f"[DEBUG] Comando SCPI: '{cmd}'")
-            instr.write(cmd)
-            print(f"[RemoteControlTab] Voltaggio impostato: {value_float}V per {inst.get('instance_name', 'N/A')}")
-        except Exception as e:
-            error_msg = f'Set Voltage Error: {str(e)}'
+        parts = self.get_scpi_set_parts(inst, ch, 'set_voltage')
+        if parts is None:
+            print("[RemoteControlTab] Template SCPI set_voltage non valido (manca '{value}')")
+            return
+
+        prefix, suffix = parts
+        cmd = prefix + value_str + suffix
+        print(f"[DEBUG] Comando SCPI: '{cmd}'")
+
+        def _done(_, error):
+            if button is not None:
+                button.setEnabled(True)
+            if error is None:
+                print(f"[RemoteControlTab] Voltaggio impostato: {value_float}V per {inst.get('instance_name', 'N/A')}")
+                return
+            error_msg = f'Set Voltage Error: {str(error)}'
             print(f"ERRORE: {error_msg}")
             if self.logger:
                 self.logger.error(error_msg)
 
-    def set_current(self, inst, ch, edit):
+        key = ('set_voltage', inst.get('instance_name', ''), ch.get('name', ''))
+        if not self._submit_scpi(inst, instr, lambda i: i.write(cmd), _done, inflight_key=key):
+            print(f"[RemoteControlTab] Set voltage già in corso per {inst.get('instance_name', 'N/A')}")
+            return
+        if button is not None:
+            button.setEnabled(False)
+
+    def set_current(self, inst, ch, edit, button=None):
         """
         Set the current for the given instrument and channel using the SCPI command.
+        Only one write per instrument/channel is queued at a time; button, if
+        given, stays disabled until that write completes.
         :param inst: Instrument instance data.
         :param ch: Channel data.
         :param edit: QLineEdit widget containing the current value.
+        :param button: Set button that triggered the write.
         """
         print(f"[DEBUG] set_current chiamato per {inst.get('instance_name', 'N/A')}")
         
@@ -1681,17 +2091,33 @@ class RemoteControlTab(QWidget):
         
         print(f"[DEBUG] Strumento VISA ottenuto: {instr}")
         
-        try:
-            cmd = self.get_scpi_cmd(inst, ch, 'set_current').replace('{value}', value_str)
-            print(f"[DEBUG] Comando SCPI: '{cmd}'")
-            instr.write(cmd)
-            print(f"[RemoteControlTab] Corrente impostata: {value_float}A per {inst.get('instance_name', 'N/A')}")
-        except Exception as e:
-            error_msg = f'Set Current Error: {str(e)}'
+        parts = self.get_scpi_set_parts(inst, ch, 'set_current')
+        if parts is None:
+            print("[RemoteControlTab] Template SCPI set_current non valido (manca '{value}')")
+            return
+
+        prefix, suffix = parts
+        cmd = prefix + value_str + suffix
+        print(f"[DEBUG] Comando SCPI: '{cmd}'")
+
+        def _done(_, error):
+            if button is not None:
+                button.setEnabled(True)
+            if error is None:
+                print(f"[RemoteControlTab] Corrente impostata: {value_float}A per {inst.get('instance_name', 'N/A')}")
+                return
+            error_msg = f'Set Current Error: {str(error)}'
             print(f"ERRORE: {error_msg}")
             if self.logger:
                 self.logger.error(error_msg)
 
+        key = ('set_current', inst.get('instance_name', ''), ch.get('name', ''))
+        if not self._submit_scpi(inst, instr, lambda i: i.write(cmd), _done, inflight_key=key):
+            print(f"[RemoteControlTab] Set current già in corso per {inst.get('instance_name', 'N/A')}")
+            return
+        if button is not None:
+            button.setEnabled(False)
+
     def toggle_output(self, inst, ch, button, checked):
         """
         Enable or disable the output for the given instrument and channel.
@@ -1832,6 +2258,7 @@ class RemoteControlTab(QWidget):
     def read_actual(self, inst, ch, label):
         """
         Read the actual voltage and current values from the instrument and update the label.
+        Both queries are sent as one compound SCPI message (one round-trip).
         :param inst: Instrument instance data.
         :param ch: Channel data.
         :param label: QLabel widget to update with the read values.
@@ -1839,14 +2266,35 @@ class RemoteControlTab(QWidget):
         instr = self.get_visa_instrument(inst)
         if not instr:
             return
-        try:
-            v_cmd = self.get_scpi_cmd(inst, ch, 'read_voltage')
-            c_cmd = self.get_scpi_cmd(inst, ch, 'read_current')
-            v = instr.query(v_cmd)
-            c = instr.query(c_cmd)
-            label.setText(f'V: {v.strip()}  I: {c.strip()}')
-        except Exception as e:
-            label.setText(f'Error: {e}')
+        v_cmd = self.get_scpi_cmd(inst, ch, 'read_voltage')
+        c_cmd = self.get_scpi_cmd(inst, ch, 'read_current')
+
+        def _io(instr):
+            values = split_scpi_response(instr.query(join_scpi_queries([v_cmd, c_cmd])), 2)
+            if values is None:
+                # Reply not in the expected compound form: query one by one
+                values = [instr.query(v_cmd).strip(), instr.query(c_cmd).strip()]
+            return values
+
+        def _done(values, error):
+            if error is not None:
+                label.setText(f'Error: {error}')
+            else:
+                v, c = values
+                label.setText(f'V: {v}  I: {c}')
+
+        # Ignore repeated clicks while the previous read of this label is running
+        self._submit_scpi(inst, instr, _io, _done, inflight_key=('read', id(label)))
+
+    def _on_measurement_tick(self):
+        """
+        Auto-refresh tick. Skipped while the tab is hidden; instruments whose
+        previous read is still in flight are skipped by refresh_measurements_auto,
+        so a slow link never accumulates queued requests.
+        """
+        if not self.isVisible():
+            return
+        self.refresh_measurements_auto()
 
     def refresh_measurements_manual(self):
         """Refresh measurements manually (called by button)."""
@@ -1856,12 +2304,16 @@ class RemoteControlTab(QWidget):
         """
         Refresh the measurements displayed in the UI by querying the instruments.
         Nuovo formato: <Nome variabile>=<Valore> <Unità>
+        Le letture dello stesso strumento sono raggruppate in un'unica query SCPI
+        composta, così ogni strumento costa un solo round-trip per aggiornamento.
         """
         if not hasattr(self, 'meas_vars'):
             return
-            
+
+        # Raggruppa le variabili per indirizzo VISA: {addr: (inst, [(var, unit, att, label, cmd, dtype)])}
+        # dtype è None per le letture ASCII, il tipo dei valori per quelle a blocco binario
+        groups = {}
         for inst, ch in self.meas_vars:
-            instr = self.get_visa_instrument(inst)
             var_name = ch.get('measured_variable', ch.get('name', 'Unknown'))
             
             # Determina l'unità di misura corretta
@@ -1869,59 +2321,112 @@ class RemoteControlTab(QWidget):
             if inst_type in ['multimeter', 'multimeters', 'datalogger', 'dataloggers']:
                 # Per multimetri e datalogger usa l'unità specifica dal canale
                 unit = ch.get('unit', 'V')
-                print(f"[DEBUG] {inst_type} - Unità da campo 'unit': {unit} per {var_name}")
             else:
                 # Per altri strumenti usa il default o unit_of_measure
                 unit = ch.get('unit_of_measure', 'V')
-                print(f"[DEBUG] {inst_type} - Unità da 'unit_of_measure': {unit} per {var_name}")
                 
             attenuation = ch.get('attenuation', 1.0)  # Default nessuna attenuazione
             
             label = self.meas_labels.get((inst.get('instance_name',''), var_name))
             if not label:
                 continue
-                
+
+            dtype = None
+            cmd = self.get_scpi_cmd(inst, ch, 'read_measurement_binary')
+            if cmd:
+                dtype = self.get_scpi_cmd(inst, ch, 'binary_datatype') or 'f'
+            else:
+                cmd = self.get_scpi_cmd(inst, ch, 'read_measurement')
+            if not cmd:
+                label.setText(f"{var_name} = N/A {unit}")
+                continue
+
+            key = inst.get('visa_address') or inst.get('instance_name', '')
+            groups.setdefault(key, (inst, []))[1].append((var_name, unit, attenuation, label, cmd, dtype))
+
+        for key, (inst, entries) in groups.items():
+            instr = self.get_visa_instrument(inst)
             if not instr:
                 # Strumento non connesso
-                label.setText(f"{var_name} = NC {unit}")
-                label.setProperty("state", "error")
+                for var_name, unit, _, label, _, _ in entries:
+                    label.setText(f"{var_name} = NC {unit}")
+                    label.setProperty("state", "error")
                 continue
-                
-            try:
-                cmd = self.get_scpi_cmd(inst, ch, 'read_measurement')
-                if not cmd:
-                    label.setText(f"{var_name} = N/A {unit}")
-                    continue
-                    
-                raw_val = instr.query(cmd)
-                # Pulisce il valore e applica attenuazione
-                try:
-                    numeric_val = float(raw_val.strip())
-                    final_val = numeric_val / attenuation if attenuation != 0 else numeric_val
-                    
-                    # Formatta il valore con precisione appropriata
-                    if abs(final_val) >= 1000:
-                        formatted_val = f"{final_val:.2f}"
-                    elif abs(final_val) >= 1:
-                        formatted_val = f"{final_val:.3f}"
-                    else:
-                        formatted_val = f"{final_val:.6f}"
-                        
-                    label.setText(f"{var_name} = {formatted_val} {unit}")
-                    label.setProperty("state", "normal")
-                    
-                except ValueError:
-                    # Il valore non è numerico, mostra così com'è
-                    clean_val = raw_val.strip()
-                    label.setText(f"{var_name} = {clean_val} {unit}")
-                    
-            except Exception as e:
+
+            # Un job per strumento: la lettura avviene fuori dal thread GUI e, se la
+            # precedente è ancora in corso, questo giro viene saltato.
+            self._submit_scpi(inst, instr, lambda i, e=entries: self._query_measurements(i, e),
+                              lambda raw, err, e=entries: self._show_measurements(e, raw, err),
+                              inflight_key=('meas', key))
+
+    @staticmethod
+    def _query_measurements(instr, entries):
+        """Legge tutte le misure di uno strumento (eseguito nel thread worker)."""
+        ascii_entries = [entry for entry in entries if entry[5] is None]
+        raw_values = None
+        if len(ascii_entries) > 1:
+            reply = instr.query(join_scpi_queries([entry[4] for entry in ascii_entries]))
+            raw_values = split_scpi_response(reply, len(ascii_entries))
+        if raw_values is None:
+            raw_values = [instr.query(entry[4]) for entry in ascii_entries]
+        # Le letture binarie restano separate: un blocco non può stare in una risposta composta
+        ascii_values = iter(raw_values)
+        return [next(ascii_values) if entry[5] is None
+                else instr.query_binary_values(entry[4], datatype=entry[5], container=np.ndarray)
+                for entry in entries]
+
+    def _show_measurements(self, entries, raw_values, error):
+        """Aggiorna le etichette di uno strumento con i valori letti (thread GUI)."""
+        if error is not None:
+            # Un errore su questo strumento non deve bloccare gli altri
+            for var_name, unit, _, label, _, _ in entries:
                 label.setText(f"{var_name} = ERR {unit}")
                 label.setProperty("state", "error")
+            return
+        for (var_name, unit, attenuation, label, _, _), raw_val in zip(entries, raw_values):
+            if isinstance(raw_val, np.ndarray):
+                self._show_measurement_block(label, var_name, unit, attenuation, raw_val)
+            else:
+                self._show_measurement(label, var_name, unit, attenuation, raw_val)
+
+    def _show_measurement_block(self, label, var_name, unit, attenuation, values):
+        """Mostra media, minimo e massimo di una lettura a blocco binario."""
+        if values.size == 0:
+            label.setText(f"{var_name} = --- {unit}")
+            return
+        scale = 1.0 / attenuation if attenuation != 0 else 1.0
+        mean = float(values.mean()) * scale
+        vmin = float(values.min()) * scale
+        vmax = float(values.max()) * scale
+        label.setText(f"{var_name} = {mean:.6g} {unit} [{vmin:.6g} .. {vmax:.6g}, n={values.size}]")
+        label.setProperty("state", "normal")
+
+    def _show_measurement(self, label, var_name, unit, attenuation, raw_val):
+        """Applica l'attenuazione al valore letto e lo mostra nell'etichetta di misura."""
+        # Pulisce il valore e applica attenuazione
+        try:
+            numeric_val = float(raw_val.strip())
+            final_val = numeric_val / attenuation if attenuation != 0 else numeric_val
+            
+            # Formatta il valore con precisione appropriata
+            if abs(final_val) >= 1000:
+                formatted_val = f"{final_val:.2f}"
+            elif abs(final_val) >= 1:
+                formatted_val = f"{final_val:.3f}"
+            else:
+                formatted_val = f"{final_val:.6f}"
+                
+            label.setText(f"{var_name} = {formatted_val} {unit}")
+            label.setProperty("state", "normal")
+            
+        except ValueError:
+            # Il valore non è numerico, mostra così com'è
+            clean_val = raw_val.strip()
+            label.setText(f"{var_name} = {clean_val} {unit}")
     
     def toggle_auto_refresh(self, enabled):
         """Abilita/disabilita aggiornamento automatico."""
-        if not hasattr(self, 'measurement_timer'):
+        if not hasattr(self, 'interval_slider'):
             return
             
         if enabled:
@@ -1933,7 +2438,7 @@ class RemoteControlTab(QWidget):
     def update_refresh_interval(self, value):
         """Aggiorna l'intervallo di refresh automatico."""
         self.interval_value_label.setText(f"{value}s")
-        if hasattr(self, 'measurement_timer') and self.measurement_timer.isActive():
+        if self.measurement_timer.isActive():
             self.measurement_timer.setInterval(value * 1000)
     
     def closeEvent(self, a0):
@@ -1942,8 +2447,7 @@ class RemoteControlTab(QWidget):
         """
         try:
             # Stop del timer di misurazione
-            if hasattr(self, 'measurement_timer'):
-                self.measurement_timer.stop()
+            self.measurement_timer.stop()
             
             # Pulizia di tutti i timer di connessione
             for timer_key, timer in self.connection_timers.items():
@@ -1953,12 +2457,8 @@ class RemoteControlTab(QWidget):
                 except:
                     pass
             self.connection_timers.clear()
-            for addr, instr in self.visa_connections.items():
-                try:
-                    instr.close()
-                except:
-                    pass
-            self.visa_connections.clear()
+            self._pool_reap_timer.stop()
+            self.visa_connections.close_all()
             self.connection_retry_counts.clear()
             
             if self.logger:
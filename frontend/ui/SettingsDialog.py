@@ -1,6 +1,6 @@
 import os
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QCheckBox, QComboBox, QLabel, QPushButton
-from PyQt6.QtCore import Qt, QSettings
+from PyQt6.QtCore import Qt, QSettings, QTimer
 
 # =========================
 # SettingsDialog
@@ -18,6 +18,11 @@ class SettingsDialog(QDialog):
         super().__init__(parent)
         
         self.translator = translator
+        # Toggle changes are written to QSettings once, 250 ms after the last change
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self.save_settings)
         
         print("[SettingsDialog DEBUG] Creating helper function t()...")
         # Helper function for safe translations
@@ -56,8 +61,10 @@ class SettingsDialog(QDialog):
         lang_layout = QHBoxLayout()
         self.lang_label = QLabel(t('language', 'Language')+':')
         self.lang_combo = QComboBox()
-        # Load available languages from the translator
+        # Load available languages from the translator (rescan only if lang_dir changed)
         self.lang_combo.clear()
+        if self.translator and getattr(self.translator, 'languages_loaded_from', None) != getattr(self.translator, 'lang_dir', None):
+            self.translator.load_languages()
         if self.translator and hasattr(self.translator, 'available_langs'):
             self.lang_combo.addItems(self.translator.available_langs)
             if hasattr(self.translator, 'current_lang'):
@@ -83,6 +90,9 @@ class SettingsDialog(QDialog):
         # Experimental instruments setting
         self.experimental_checkbox = QCheckBox(t('enable_experimental_instruments', 'Enable experimental instruments in the instrument list'))
         layout.addWidget(self.experimental_checkbox)
+        # Auto-connect setting
+        self.auto_connect_checkbox = QCheckBox(t('enable_auto_connect_instruments', 'Connect remote instruments automatically when loading'))
+        layout.addWidget(self.auto_connect_checkbox)
         # Apply button
         btn_layout = QHBoxLayout()
         self.apply_btn = QPushButton(t('apply', 'Apply'))
@@ -102,7 +112,7 @@ class SettingsDialog(QDialog):
         self.inst_toggle.setEnabled(enabled)
         self.eff_toggle.setEnabled(enabled)
         self.was_toggle.setEnabled(enabled)
-        self.save_settings()
+        self._schedule_save()
 
     def change_language(self, lang):
         """
@@ -118,13 +128,35 @@ class SettingsDialog(QDialog):
             if parent is not None and hasattr(parent, 'update_translations'):
                 parent.update_translations()
         
-        self.save_settings()
+        self._schedule_save()
         self.close()
 
+    def _schedule_save(self):
+        """
+        Schedule save_settings(), restarting the debounce interval.
+        """
+        self._save_timer.start()
+
+    def _flush_pending_save(self):
+        """
+        Run a scheduled save immediately, if one is pending.
+        """
+        if self._save_timer.isActive():
+            self.save_settings()
+
+    def closeEvent(self, event):
+        self._flush_pending_save()
+        super().closeEvent(event)
+
+    def done(self, result):
+        self._flush_pending_save()
+        super().done(result)
+
     def save_settings(self):
         """
         Save current settings to QSettings.
         """
+        self._save_timer.stop()
         settings = QSettings('LabAutomation', 'App')
         current_lang = 'en'  # default
         if self.translator and hasattr(self.translator, 'current_lang'):
@@ -137,6 +169,8 @@ class SettingsDialog(QDialog):
         settings.setValue('advanced_naming_eff', self.eff_toggle.isChecked())
         settings.setValue('advanced_naming_was', self.was_toggle.isChecked())
         settings.setValue('show_experimental_instruments', self.experimental_checkbox.isChecked())
+        settings.setValue('auto_connect_instruments', self.auto_connect_checkbox.isChecked())
+        settings.sync()
 
     def load_settings(self):
         """
@@ -171,6 +205,10 @@ class SettingsDialog(QDialog):
         show_exp = settings.value('show_experimental_instruments', False, type=bool)
         self.experimental_checkbox.setChecked(show_exp)
 
+        # Load auto-connect setting
+        auto_connect = settings.value('auto_connect_instruments', False, type=bool)
+        self.auto_connect_checkbox.setChecked(auto_connect)
+
     def apply_settings(self):
         """
         Apply and save settings, update main window, and close the dialog.
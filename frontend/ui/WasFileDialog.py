@@ -1,6 +1,43 @@
 import json
-from PyQt6.QtWidgets import QDialog, QHBoxLayout, QVBoxLayout, QLabel, QLineEdit, QPushButton, QTextEdit, QMessageBox
-from PyQt6.QtCore import Qt
+import os
+import re
+from PyQt6.QtWidgets import (QDialog, QHBoxLayout, QVBoxLayout, QFormLayout, QLabel, QLineEdit, QPushButton,
+                             QPlainTextEdit, QMessageBox, QGroupBox, QComboBox, QCheckBox)
+from PyQt6.QtCore import Qt, QTimer
+
+try:
+    import orjson
+except ImportError:  # orjson è opzionale: si ricade sul modulo json standard
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson è opzionale: senza, anche i file grandi vengono caricati per intero
+    ijson = None
+
+
+def _loads(raw):
+    """Decodifica JSON da str o bytes, usando orjson se disponibile."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data):
+    """Serializza data in JSON indentato di 2 spazi, come bytes UTF-8."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Moltiplicatori dei suffissi accettati per il tempo/div
+_MULT = {'': 1.0, 'k': 1e3, 'm': 1e-3, 'u': 1e-6, 'n': 1e-9, 'p': 1e-12}
+# Valore con suffisso opzionale in coda ('100n', '100 n', '1e-3') oppure suffisso usato
+# come separatore decimale ('1n1' = 1.1n, '4k7' = 4.7k)
+_TIME_RE = re.compile(
+    r'^(?:(?P<num>[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:e[+-]?\d+)?)\s*(?P<suffix>[kmunp]?)'
+    r'|(?P<whole>[+-]?\d+)(?P<infix>[kmunp])(?P<frac>\d+))$'
+)
 
 # =========================
 # WasFileDialog
@@ -10,6 +47,9 @@ class WasFileDialog(QDialog):
     Dialog per la modifica di un file .was (oscilloscope settings).
     Permette di configurare i canali abilitati, volt/div per canale e tempo/div globale.
     """
+    # Oltre questa dimensione il JSON completo viene caricato solo su richiesta
+    _LARGE_FILE_BYTES = 1 << 20
+
     def __init__(self, file_path, translator, project_data=None, parent=None):
         """
         Inizializza la finestra di dialogo per la modifica di un file .was.
@@ -19,11 +59,14 @@ class WasFileDialog(QDialog):
         :param parent: Widget genitore.
         """
         super().__init__(parent)
-        from PyQt6.QtWidgets import (QLineEdit, QFormLayout, QVBoxLayout, QHBoxLayout, 
-                                      QLabel, QTextEdit, QPushButton, QGroupBox, QComboBox, QCheckBox)
         self.translator = translator
         self.file_path = file_path
         self.project_data = project_data
+        self._last_settings = (None, None)  # (time_per_div, channels) mostrati nel form
+        self._deferred_path = None  # file il cui JSON completo non è ancora stato caricato
+        # Ultima serializzazione di self.data, valida finché _version non cambia
+        self._version = 0
+        self._serial_cache = (None, None)  # (version, bytes)
         self.setWindowTitle(self.translator.t('edit_was_file'))
         self.setModal(True)
         
@@ -47,19 +90,32 @@ class WasFileDialog(QDialog):
         
         # --- Sezione destra: editor JSON ---
         right_layout = QVBoxLayout()
-        self.data_edit = QTextEdit()
+        # Editor di testo semplice: layout molto più leggero di QTextEdit per il JSON
+        self.data_edit = QPlainTextEdit()
+        self.data_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        
+        self.load_full_btn = QPushButton(self.translator.t('load_full_json'))
+        self.load_full_btn.clicked.connect(self.show_full_json)
+        self.load_full_btn.setVisible(False)
         
         # Carica il contenuto del file .was
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
-            self.data_edit.setText(json.dumps(self.data, indent=2))
+            if ijson is not None and os.path.getsize(self.file_path) > self._LARGE_FILE_BYTES:
+                self._fast_populate()
+            else:
+                with open(self.file_path, 'rb') as f:
+                    self.data = _loads(f.read())
+                self._version += 1
+                self._set_editor_text(self._serialize().decode('utf-8'))
         except Exception as e:
+            self._deferred_path = None
             self.data = {"type": "oscilloscope_settings", "channels": [], "settings": {}}
-            self.data_edit.setText(json.dumps(self.data, indent=2))
+            self._version += 1
+            self._set_editor_text(self._serialize().decode('utf-8'))
         
         right_layout.addWidget(QLabel(self.translator.t('oscilloscope_settings_data')))
         right_layout.addWidget(self.data_edit)
+        right_layout.addWidget(self.load_full_btn)
         
         # Pulsante per salvare le modifiche
         save_btn = QPushButton(self.translator.t('save'))
@@ -74,8 +130,48 @@ class WasFileDialog(QDialog):
         # Precompila i parametri a sinistra se già presenti nel JSON
         self.populate_params_from_json()
         
-        # Sincronizza i parametri se il JSON viene modificato manualmente
-        self.data_edit.textChanged.connect(self.sync_params_from_json)
+        # Sincronizza i parametri se il JSON viene modificato manualmente,
+        # solo dopo 250 ms senza modifiche (non a ogni tasto premuto)
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(250)
+        self._sync_timer.timeout.connect(self.sync_params_from_json)
+        self.data_edit.textChanged.connect(self._sync_timer.start)
+
+    def _fast_populate(self):
+        """
+        Legge dal file solo 'settings' e 'channels' (le uniche parti usate dal form),
+        senza costruire in memoria il resto del documento. Il JSON completo viene
+        caricato da show_full_json quando serve.
+        """
+        with open(self.file_path, 'rb') as f:
+            settings = dict(ijson.kvitems(f, 'settings', use_float=True))
+            f.seek(0)
+            channels = list(ijson.items(f, 'channels.item', use_float=True))
+        self.data = {"type": "oscilloscope_settings", "channels": channels, "settings": settings}
+        self._version += 1
+        self._deferred_path = self.file_path
+        self._set_editor_text(self.translator.t('large_was_file_not_loaded'))
+        self.data_edit.setReadOnly(True)
+        self.load_full_btn.setVisible(True)
+
+    def show_full_json(self):
+        """
+        Carica il JSON completo di un file grande, mantenendo le modifiche già
+        applicate a 'settings' e 'channels', e lo mostra nell'editor.
+        """
+        if self._deferred_path is None:
+            return
+        with open(self._deferred_path, 'rb') as f:
+            full_data = _loads(f.read())
+        full_data['settings'] = self.data.get('settings', {})
+        full_data['channels'] = self.data.get('channels', [])
+        self.data = full_data
+        self._version += 1
+        self._deferred_path = None
+        self._set_editor_text(self._serialize().decode('utf-8'))
+        self.data_edit.setReadOnly(False)
+        self.load_full_btn.setVisible(False)
 
     def get_oscilloscope_channels(self):
         """
@@ -92,7 +188,6 @@ class WasFileDialog(QDialog):
             return []
         
         # Costruisci il percorso completo del file .inst
-        import os
         project_dir = os.path.dirname(self.file_path)
         inst_file_path = os.path.join(project_dir, inst_file)
         
@@ -116,8 +211,6 @@ class WasFileDialog(QDialog):
         """
         Crea la sezione per configurare i canali dell'oscilloscopio.
         """
-        from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QCheckBox, QLabel, QComboBox, QFormLayout
-        
         group = QGroupBox(self.translator.t('oscilloscope_channels'))
         group_layout = QVBoxLayout()
         
@@ -139,6 +232,7 @@ class WasFileDialog(QDialog):
             ]
         
         # Crea widget per ogni canale
+        volt_label_text = self.translator.t('volt_per_div')
         self.channel_widgets = []
         form = QFormLayout()
         
@@ -151,7 +245,7 @@ class WasFileDialog(QDialog):
             ch_layout.addWidget(ch_enable)
             
             # Combobox per Volt/div
-            volt_label = QLabel(self.translator.t('volt_per_div'))
+            volt_label = QLabel(volt_label_text)
             volt_combo = QComboBox()
             volt_options = ["1mV", "2mV", "5mV", "10mV", "20mV", "50mV",
                            "100mV", "200mV", "500mV", "1V", "2V", "5V", "10V", "20V", "50V", "100V"]
@@ -182,8 +276,6 @@ class WasFileDialog(QDialog):
         """
         Crea la sezione per configurare il tempo/div.
         """
-        from PyQt6.QtWidgets import QGroupBox, QFormLayout, QLineEdit
-        
         group = QGroupBox(self.translator.t('timing_settings'))
         form = QFormLayout()
         
@@ -199,25 +291,15 @@ class WasFileDialog(QDialog):
     def parse_time(self, s):
         """
         Converte una stringa tipo '100k', '1n1', '0.001' in float secondi.
-        Accetta anche notazione con suffissi k, m, u, n, p.
+        Accetta anche notazione con suffissi k, m, u, n, p, in coda ('100n')
+        o al posto della virgola ('1n1' = 1.1n).
         """
-        s = s.strip().lower().replace(',', '.')
-        try:
-            if 'k' in s:
-                return float(s.replace('k','')) * 1e3
-            if 'm' in s:
-                return float(s.replace('m','')) * 1e-3
-            if 'u' in s:
-                return float(s.replace('u','')) * 1e-6
-            if 'n' in s:
-                return float(s.replace('n','')) * 1e-9
-            if 'p' in s:
-                return float(s.replace('p','')) * 1e-12
-            if '1n1' in s:
-                return 1e-9
-            return float(s)
-        except Exception:
+        m = _TIME_RE.match(s.strip().lower().replace(',', '.'))
+        if m is None:
             return None
+        if m.group('num') is not None:
+            return float(m.group('num')) * _MULT[m.group('suffix')]
+        return float(f"{m.group('whole')}.{m.group('frac')}") * _MULT[m.group('infix')]
 
     def populate_params_from_json(self):
         """
@@ -225,12 +307,21 @@ class WasFileDialog(QDialog):
         """
         settings = self.data.get('settings', {})
         tdiv = settings.get('time_per_div', '')
+        channels_data = self.data.get('channels', [])
+        
+        # Valori già mostrati nel form: niente da aggiornare
+        if (tdiv, channels_data) == self._last_settings:
+            return
+        self._last_settings = (tdiv, channels_data)
         
         if tdiv and hasattr(self, 'time_div_edit'):
-            self.time_div_edit.setText(str(tdiv))
+            self.time_div_edit.blockSignals(True)
+            try:
+                self.time_div_edit.setText(str(tdiv))
+            finally:
+                self.time_div_edit.blockSignals(False)
         
         # Popola i canali se presenti
-        channels_data = self.data.get('channels', [])
         if hasattr(self, 'channel_widgets') and channels_data:
             for ch_widget in self.channel_widgets:
                 # Trova i dati corrispondenti per questo canale
@@ -252,12 +343,8 @@ class WasFileDialog(QDialog):
         # Tempo/div globale
         tdiv = self.parse_time(self.time_div_edit.text()) if hasattr(self, 'time_div_edit') else None
         
-        if tdiv is not None:
-            if 'settings' not in self.data:
-                self.data['settings'] = {}
-            self.data['settings']['time_per_div'] = tdiv
-        
         # Canali
+        channels = None
         if hasattr(self, 'channel_widgets'):
             channels = []
             for ch_widget in self.channel_widgets:
@@ -269,18 +356,64 @@ class WasFileDialog(QDialog):
                         'volt_per_div': ch_widget['volt_div_widget'].currentText(),
                         'probe_attenuation': ch_widget.get('probe_attenuation', 1.0)
                     })
-            
+        
+        # Nessuna modifica: evita di riserializzare e riscrivere l'editor
+        tdiv_unchanged = tdiv is None or self.data.get('settings', {}).get('time_per_div') == tdiv
+        channels_unchanged = channels is None or self.data.get('channels') == channels
+        if tdiv_unchanged and channels_unchanged:
+            return
+        
+        if tdiv is not None:
+            if 'settings' not in self.data:
+                self.data['settings'] = {}
+            self.data['settings']['time_per_div'] = tdiv
+        if channels is not None:
             self.data['channels'] = channels
+        self._version += 1
+        
+        # JSON completo non ancora caricato: l'editor mostra solo l'avviso
+        if self._deferred_path is not None:
+            return
         
-        # Aggiorna il visualizzatore JSON
-        self.data_edit.setText(json.dumps(self.data, indent=2))
+        # Aggiorna il visualizzatore JSON solo se il testo cambia davvero; i segnali
+        # sono bloccati perché i dati sono già allineati e non serve riparsare il testo
+        new_text = self._serialize().decode('utf-8')
+        if new_text == self.data_edit.toPlainText():
+            return
+        self._set_editor_text(new_text)
+
+    def _serialize(self):
+        """
+        Ritorna self.data serializzato (bytes UTF-8), riusando l'ultima
+        serializzazione se i dati non sono cambiati da allora.
+        """
+        version, payload = self._serial_cache
+        if version != self._version:
+            payload = _dumps(self.data)
+            self._serial_cache = (self._version, payload)
+        return payload
+
+    def _set_editor_text(self, text):
+        """
+        Sostituisce il testo dell'editor JSON da codice: senza segnali (i dati sono
+        già allineati) e senza registrare l'operazione nello stack di annullamento.
+        """
+        self.data_edit.setUndoRedoEnabled(False)
+        self.data_edit.blockSignals(True)
+        try:
+            self.data_edit.setPlainText(text)
+        finally:
+            self.data_edit.blockSignals(False)
+            self.data_edit.setUndoRedoEnabled(True)
+            self.data_edit.document().clearUndoRedoStacks()
 
     def sync_params_from_json(self):
         """
         Aggiorna i parametri a sinistra se il JSON viene modificato manualmente.
         """
         try:
-            self.data = json.loads(self.data_edit.toPlainText())
+            self.data = _loads(self.data_edit.toPlainText())
+            self._version += 1
             self.populate_params_from_json()
         except Exception:
             pass
@@ -290,9 +423,26 @@ class WasFileDialog(QDialog):
         Salva i dati attuali nel file .was e chiude la dialog.
         Mostra un messaggio di errore se il salvataggio fallisce.
         """
+        # Applica eventuali modifiche manuali al JSON non ancora sincronizzate
+        if self._sync_timer.isActive():
+            self._sync_timer.stop()
+            self.sync_params_from_json()
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2)
+            # Un file grande va salvato per intero, non solo con le parti lette dal form
+            self.show_full_json()
+            payload = self._serialize()
+            # Scrittura atomica: chi legge il file non vede mai un JSON troncato
+            tmp_path = self.file_path + '.tmp'
+            try:
+                with open(tmp_path, 'wb', buffering=1 << 16) as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.file_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
             self.accept()
         except Exception as e:
             QMessageBox.warning(self, self.translator.t('error'), str(e))
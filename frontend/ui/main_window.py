@@ -91,7 +91,8 @@ class MainWindow(QMainWindow):
         try:
             self.load_instruments = LoadInstruments()
             lib_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'Instruments_LIB', 'instruments_lib.json')
-            self.load_instruments.load_instruments(lib_path)
+            # La libreria viene letta al primo utilizzo, non all'avvio
+            self.load_instruments.set_library_path(lib_path)
             self.logger.debug(f"LoadInstruments initialized successfully with library: {lib_path}")
         except Exception as e:
             self.logger.error(f"Error initializing LoadInstruments: {e}", exc_info=True)
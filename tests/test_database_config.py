@@ -0,0 +1,60 @@
+"""
+Tests for password encryption in DatabaseConfigManager, under each Fernet backend.
+"""
+
+import base64
+
+import pytest
+
+pytest.importorskip("PyQt6")  # frontend.core imports the Qt error handler
+pytest.importorskip("cryptography")
+
+from frontend.core import database_config  # noqa: E402
+
+
+@pytest.fixture(params=["cryptography", "rfernet"])
+def manager(request, tmp_path, monkeypatch):
+    """DatabaseConfigManager with its files in tmp_path, using the requested backend."""
+    if request.param == "rfernet":
+        monkeypatch.setattr(database_config, "rfernet", pytest.importorskip("rfernet"))
+    else:
+        monkeypatch.setattr(database_config, "rfernet", None)
+    manager = database_config.DatabaseConfigManager.__new__(database_config.DatabaseConfigManager)
+    monkeypatch.setattr(database_config, "CONFIG_DIR", str(tmp_path))
+    monkeypatch.setattr(database_config, "CONFIG_FILE", str(tmp_path / "database_config.json"))
+    monkeypatch.setattr(database_config, "KEY_FILE", str(tmp_path / ".db_key"))
+    monkeypatch.setattr(database_config, "CONFIG_TMP_FILE", str(tmp_path / "database_config.json.tmp"))
+    manager.__init__()
+    return manager
+
+
+def test_encrypt_decrypt_roundtrip(manager):
+    encrypted = manager._encrypt_password("s3cret-è!")
+    assert isinstance(encrypted, str)
+    assert encrypted.startswith("gA")
+    manager._decrypt_cache.clear()
+    assert manager._decrypt_password(encrypted) == "s3cret-è!"
+
+
+def test_save_and_load_config(manager):
+    assert manager.save_config({"host": "db", "password": "pw"})
+    manager._decrypt_cache.clear()
+    assert manager.load_config()["password"] == "pw"
+
+
+def test_legacy_base64_wrapped_token(manager):
+    token = manager.cipher.encrypt(b"old-password")
+    legacy = base64.b64encode(token.encode("ascii")).decode("ascii")
+    assert manager._decrypt_password(legacy) == "old-password"
+
+
+def test_plain_text_password_is_returned_and_not_cached(manager):
+    assert manager._decrypt_password("plain password") == "plain password"
+    assert "plain password" not in manager._decrypt_cache
+
+
+def test_token_from_other_key_is_not_cached(manager):
+    other = database_config._FernetCipher(database_config.Fernet.generate_key())
+    token = other.encrypt(b"pw")
+    assert manager._decrypt_password(token) == token
+    assert token not in manager._decrypt_cache